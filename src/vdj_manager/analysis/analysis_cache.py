@@ -9,6 +9,7 @@ file's mtime or size changes on disk.
 import contextlib
 import os
 import sqlite3
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 
@@ -154,6 +155,47 @@ class AnalysisCache:
                 ),
             )
 
+    def put_batch(self, results: Iterable[tuple[str, str]], analysis_type: str) -> None:
+        """Store several analysis results in one transaction.
+
+        Like :meth:`put`, but all rows go through a single ``executemany``
+        on one connection. Files that no longer exist are skipped.
+
+        Args:
+            results: ``(file_path, result_value)`` pairs.
+            analysis_type: Type of analysis.
+        """
+        analyzed_at = datetime.now().isoformat()
+        rows = []
+        for file_path, result_value in results:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue  # Can't cache if file doesn't exist
+            rows.append(
+                (
+                    file_path,
+                    analysis_type,
+                    stat.st_mtime,
+                    stat.st_size,
+                    result_value,
+                    analyzed_at,
+                )
+            )
+        if not rows:
+            return
+
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO analysis_results
+                    (file_path, analysis_type, mtime, file_size,
+                     result_value, analyzed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+
     def get_batch(self, file_paths: list[str], analysis_type: str) -> dict[str, str]:
         """Look up cached results for multiple files.
 
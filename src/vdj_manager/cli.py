@@ -1,21 +1,21 @@
 """Command-line interface for VDJ Manager."""
 
+import contextlib
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 import click
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
-from rich.table import Table
 
 from .config import LOCAL_VDJ_DB, MYNVME_VDJ_DB, config
 from .core.backup import BackupManager
 from .core.database import VDJDatabase
 from .files.duplicates import DuplicateDetector
 from .files.path_remapper import PathRemapper
-from .files.scanner import DirectoryScanner
+from .files.scanner import DirectoryScanner, find_existing_paths
 from .files.validator import FileValidator
 
 console = Console()
@@ -72,6 +72,9 @@ def db():
 @click.option("--check-files", is_flag=True, help="Check if files exist (slower)")
 def db_status(db_choice: str, check_files: bool):
     """Show library statistics."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
     databases = []
 
     if db_choice in ("local", "both"):
@@ -144,7 +147,13 @@ def db_status(db_choice: str, check_files: bool):
 @click.option("--mynvme", "db_choice", flag_value="mynvme", help="Backup MyNVMe database")
 @click.option("--both", "db_choice", flag_value="both", default=True, help="Backup both databases")
 @click.option("--label", "-l", help="Optional label for the backup")
-def db_backup(db_choice: str, label: str | None):
+@click.option(
+    "--archive-older-than",
+    type=click.IntRange(min=1),
+    metavar="DAYS",
+    help="Also move backups older than DAYS (at least 1) into monthly .tar.xz archives",
+)
+def db_backup(db_choice: str, label: str | None, archive_older_than: int | None):
     """Create a backup of the database."""
     backup_mgr = BackupManager()
 
@@ -163,6 +172,12 @@ def db_backup(db_choice: str, label: str | None):
         console.print(f"[green]✓[/green] Backed up {name} database to:")
         console.print(f"  {backup_path}")
 
+    if archive_older_than is not None:
+        archived = backup_mgr.archive_old_backups(older_than_days=archive_older_than)
+        console.print(
+            f"[green]✓[/green] Archived {archived} backups older than {archive_older_than} days"
+        )
+
     # Show backup stats
     total_backups = len(backup_mgr.list_backups())
     total_size = backup_mgr.total_backup_size
@@ -175,6 +190,9 @@ def db_backup(db_choice: str, label: str | None):
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed output")
 def db_validate(db_choice: str, verbose: bool):
     """Check file existence and validate entries."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+    from rich.table import Table
+
     path = LOCAL_VDJ_DB if db_choice == "local" else MYNVME_VDJ_DB
 
     if not path.exists():
@@ -267,6 +285,8 @@ def db_validate(db_choice: str, verbose: bool):
 @click.option("--mynvme", "db_choice", flag_value="mynvme", help="Clean MyNVMe database")
 def db_clean(non_audio: bool, missing: bool, dry_run: bool, db_choice: str):
     """Remove invalid entries from the database."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
     if not non_audio and not missing:
         console.print("[yellow]Specify --non-audio and/or --missing to clean[/yellow]")
         return
@@ -355,6 +375,8 @@ def files():
 @click.option("--recursive/--no-recursive", default=True, help="Scan subdirectories")
 def files_scan(directory: str, recursive: bool):
     """Preview new files in a directory."""
+    from rich.table import Table
+
     dir_path = Path(directory)
     scanner = DirectoryScanner()
 
@@ -385,6 +407,8 @@ def files_scan(directory: str, recursive: bool):
 )
 def files_import(directory: str, recursive: bool, dry_run: bool, db_choice: str):
     """Add new files to the database."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
     dir_path = Path(directory)
     path = LOCAL_VDJ_DB if db_choice == "local" else MYNVME_VDJ_DB
 
@@ -509,6 +533,8 @@ def files_remap(
     db_choice: str,
 ):
     """Remap Windows paths to macOS paths."""
+    from rich.table import Table
+
     path = LOCAL_VDJ_DB if db_choice == "local" else MYNVME_VDJ_DB
 
     if not path.exists():
@@ -656,6 +682,8 @@ def analyze():
 )
 def analyze_energy(analyze_all: bool, untagged: bool, dry_run: bool, db_choice: str):
     """Analyze tracks for energy levels."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
     # Import here to avoid slow import on CLI startup
     try:
         from .analysis.energy import EnergyAnalyzer
@@ -768,6 +796,8 @@ def analyze_mood(
     heuristic backend. Assigns multiple mood tags per track based on
     confidence threshold.
     """
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
     from .analysis.mood_backend import MOOD_CLASSES_SET, MoodModel, get_backend
     from .config import get_lastfm_api_key
 
@@ -931,6 +961,9 @@ def analyze_genre(
     to online lookup via Last.fm and MusicBrainz when enabled.
     Results are stored in the Genre tag.
     """
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
+    from .analysis.analysis_cache import DEFAULT_ANALYSIS_CACHE_PATH, AnalysisCache
     from .analysis.online_genre import lookup_online_genre, normalize_genre
     from .config import get_lastfm_api_key
     from .files.id3_editor import FileTagEditor
@@ -959,6 +992,7 @@ def analyze_genre(
 
     # Find tracks
     to_analyze = []
+    readable: set[str] = set()
     for song in db.songs.values():
         if song.is_netsearch:
             continue
@@ -969,6 +1003,8 @@ def analyze_genre(
         if untagged and song.tags and song.tags.genre:
             continue
         to_analyze.append(song)
+        if file_exists:
+            readable.add(song.file_path)
 
     if not to_analyze:
         console.print("[green]No tracks to analyze[/green]")
@@ -986,51 +1022,72 @@ def analyze_genre(
 
     detected = 0
     failed = 0
-    editor = FileTagEditor()
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-    ) as progress:
-        task = progress.add_task("Detecting genre...", total=len(to_analyze))
+    # Parsed tags are cached across runs; unchanged files skip mutagen
+    editor = FileTagEditor(cache=AnalysisCache(db_path=DEFAULT_ANALYSIS_CACHE_PATH))
 
-        for song in to_analyze:
-            try:
-                genre = None
+    # Embedded tags are read ahead on a thread pool, in to_analyze order.
+    # closing() shuts the pool down and flushes the last cache batch even
+    # if the loop is interrupted.
+    with contextlib.closing(
+        editor.read_tags_bulk(song.file_path for song in to_analyze if song.file_path in readable)
+    ) as bulk_tags:
+        file_tags_iter: Iterator[tuple[str, dict[str, str | None]]] | None = bulk_tags
 
-                # Pass 1: Read from embedded file tags
-                file_exists = not song.is_windows_path and Path(song.file_path).exists()
-                if file_exists:
-                    try:
-                        file_tags = editor.read_tags(song.file_path)
-                        raw_genre = file_tags.get("genre")
-                        if raw_genre and raw_genre.strip():
-                            genre = normalize_genre(raw_genre)
-                    except Exception:
-                        logger.debug("Failed to read file tags for %s", song.file_path)
-
-                # Pass 2: Online lookup
-                if not genre and online:
-                    artist = (song.tags.author or "") if song.tags else ""
-                    title = (song.tags.title or "") if song.tags else ""
-                    if artist and title:
-                        online_genre, _source = lookup_online_genre(artist, title, api_key)
-                        if online_genre:
-                            genre = online_genre
-
-                if genre:
-                    db.update_song_tags(song.file_path, Genre=genre)
-                    detected += 1
-                else:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+        ) as progress:
+            task = progress.add_task("Detecting genre...", total=len(to_analyze))
+
+            for song in to_analyze:
+                try:
+                    genre = None
+
+                    # Pass 1: Read from embedded file tags
+                    if song.file_path in readable:
+                        file_tags = None
+                        if file_tags_iter is not None:
+                            try:
+                                _, file_tags = next(file_tags_iter)
+                            except Exception:
+                                # A generator that raised is finished: every later
+                                # next() would just raise StopIteration
+                                logger.warning(
+                                    "Bulk tag read failed; reading the remaining files one by one",
+                                    exc_info=True,
+                                )
+                                file_tags_iter = None
+                        try:
+                            if file_tags is None:
+                                file_tags = editor.read_tags(song.file_path)
+                            raw_genre = file_tags.get("genre")
+                            if raw_genre and raw_genre.strip():
+                                genre = normalize_genre(raw_genre)
+                        except Exception:
+                            logger.debug("Failed to read file tags for %s", song.file_path)
+
+                    # Pass 2: Online lookup
+                    if not genre and online:
+                        artist = (song.tags.author or "") if song.tags else ""
+                        title = (song.tags.title or "") if song.tags else ""
+                        if artist and title:
+                            online_genre, _source = lookup_online_genre(artist, title, api_key)
+                            if online_genre:
+                                genre = online_genre
+
+                    if genre:
+                        db.update_song_tags(song.file_path, Genre=genre)
+                        detected += 1
+                    else:
+                        failed += 1
+                except Exception as e:
+                    console.print(f"[red]Error: {song.file_path}: {e}[/red]")
                     failed += 1
-            except Exception as e:
-                console.print(f"[red]Error: {song.file_path}: {e}[/red]")
-                failed += 1
-            progress.advance(task)
+                progress.advance(task)
 
-    db.save()
+        db.save()
     console.print(f"[green]✓[/green] Detected genre for {detected} tracks ({failed} failed)")
 
 
@@ -1042,6 +1099,8 @@ def analyze_genre(
 )
 def analyze_import_mik(dry_run: bool, db_choice: str):
     """Import existing Mixed In Key tags from audio files."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
     try:
         from .analysis.audio_features import MixedInKeyReader
     except ImportError as e:
@@ -1199,6 +1258,8 @@ def normalize_measure(
     db_choice: str,
 ):
     """Measure current loudness levels using parallel processing."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
     try:
         from .normalize.processor import NormalizationProcessor
     except ImportError as e:
@@ -1315,6 +1376,8 @@ def normalize_apply(
     db_choice: str,
 ):
     """Apply loudness normalization using parallel processing."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
     try:
         from .normalize.processor import NormalizationProcessor
     except ImportError as e:
@@ -1421,6 +1484,13 @@ def export():
 @click.option("--playlist", help="Export specific playlist")
 @click.option("--cues-only", is_flag=True, help="Only export cue points/beatgrid")
 @click.option("--dry-run", is_flag=True, help="Preview what would be exported")
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Number of parallel export threads (default: 2x CPU count, max 32)",
+)
 @click.option("--local", "db_choice", flag_value="local", help="Use local database")
 @click.option(
     "--mynvme", "db_choice", flag_value="mynvme", default=True, help="Use MyNVMe database"
@@ -1430,9 +1500,12 @@ def export_serato(
     playlist: str | None,
     cues_only: bool,
     dry_run: bool,
+    workers: int | None,
     db_choice: str,
 ):
     """Export library to Serato format."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
     try:
         from .export.serato import SeratoExporter
     except ImportError as e:
@@ -1467,12 +1540,10 @@ def export_serato(
         songs = [db.songs[fp] for fp in found.file_paths if fp in db.songs]
         console.print(f"Exporting playlist '{found.name}' ({len(songs)} tracks)")
     else:
-        # Export all valid songs
-        songs = [
-            s
-            for s in db.songs.values()
-            if not s.is_windows_path and not s.is_netsearch and Path(s.file_path).exists()
-        ]
+        # Export all valid songs (one directory listing per folder, not one stat per file)
+        candidates = [s for s in db.songs.values() if not s.is_windows_path and not s.is_netsearch]
+        existing = find_existing_paths(s.file_path for s in candidates)
+        songs = [s for s in candidates if s.file_path in existing]
         console.print(f"Exporting {len(songs)} tracks")
 
     if dry_run:
@@ -1491,15 +1562,14 @@ def export_serato(
         BarColumn(),
         TaskProgressColumn(),
     ) as progress:
-        task = progress.add_task("Exporting to Serato...", total=len(songs))
+        task = progress.add_task("Exporting to Serato...", total=len({s.file_path for s in songs}))
 
         exported = 0
-        for song in songs:
-            try:
-                exporter.export_song(song, cues_only=cues_only)
+        for song, result in exporter.export_songs(songs, cues_only=cues_only, max_workers=workers):
+            if isinstance(result, Exception):
+                console.print(f"[red]Error: {song.file_path}: {result}[/red]")
+            else:
                 exported += 1
-            except Exception as e:
-                console.print(f"[red]Error: {song.file_path}: {e}[/red]")
             progress.advance(task)
 
     if playlist:
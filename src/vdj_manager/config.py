@@ -1,21 +1,26 @@
 """Configuration management for VDJ Manager."""
 
 import logging
-from logging.handlers import RotatingFileHandler
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Default paths
-LOCAL_VDJ_DB = Path.home() / "Library/Application Support/VirtualDJ/database.xml"
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
+# Default paths (home directory resolved once)
+_HOME = Path.home()
+LOCAL_VDJ_DB = _HOME / "Library/Application Support/VirtualDJ/database.xml"
 MYNVME_VDJ_DB = Path("/Volumes/MyNVMe/VirtualDJ/database.xml")
-BACKUP_DIR = Path.home() / ".vdj_manager/backups"
-CHECKPOINT_DIR = Path.home() / ".vdj_manager/checkpoints"
-LOG_DIR = Path.home() / ".vdj_manager/logs"
-SERATO_LOCAL = Path.home() / "Music/_Serato_"
+BACKUP_DIR = _HOME / ".vdj_manager/backups"
+CHECKPOINT_DIR = _HOME / ".vdj_manager/checkpoints"
+LOG_DIR = _HOME / ".vdj_manager/logs"
+SERATO_LOCAL = _HOME / "Music/_Serato_"
 SERATO_MYNVME = Path("/Volumes/MyNVMe/_Serato_")
 
 # Last.fm API key
 LASTFM_API_KEY_ENV = "LASTFM_API_KEY"
-LASTFM_API_KEY_FILE = Path.home() / ".vdj_manager/lastfm_api_key"
+LASTFM_API_KEY_FILE = _HOME / ".vdj_manager/lastfm_api_key"
 
 
 def get_lastfm_api_key() -> str | None:
@@ -37,51 +42,55 @@ def get_lastfm_api_key() -> str | None:
     return None
 
 
-# Audio file extensions
-AUDIO_EXTENSIONS = {
-    ".mp3",
-    ".m4a",
-    ".mp4",
-    ".aac",
-    ".flac",
-    ".wav",
-    ".aiff",
-    ".aif",
-    ".ogg",
-    ".opus",
-    ".wma",
-    ".alac",
-}
+# Audio file extensions (frozen: shared constant, membership-tested per song)
+AUDIO_EXTENSIONS = frozenset(
+    {
+        ".mp3",
+        ".m4a",
+        ".mp4",
+        ".aac",
+        ".flac",
+        ".wav",
+        ".aiff",
+        ".aif",
+        ".ogg",
+        ".opus",
+        ".wma",
+        ".alac",
+    }
+)
 
 # Non-audio extensions to clean
-NON_AUDIO_EXTENSIONS = {
-    ".zip",
-    ".rar",
-    ".7z",
-    ".tar",
-    ".gz",
-    ".mkv",
-    ".avi",
-    ".mov",
-    ".wmv",
-    ".jpg",
-    ".jpeg",
-    ".png",
-    ".gif",
-    ".bmp",
-    ".pdf",
-    ".doc",
-    ".docx",
-    ".txt",
-    ".exe",
-    ".dmg",
-    ".pkg",
-    ".app",
-    ".db",
-    ".xml",
-    ".json",
-    ".nfo",
-}
+NON_AUDIO_EXTENSIONS = frozenset(
+    {
+        ".zip",
+        ".rar",
+        ".7z",
+        ".tar",
+        ".gz",
+        ".mkv",
+        ".avi",
+        ".mov",
+        ".wmv",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".bmp",
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".txt",
+        ".exe",
+        ".dmg",
+        ".pkg",
+        ".app",
+        ".db",
+        ".xml",
+        ".json",
+        ".nfo",
+    }
+)
 
 # Windows to macOS path mappings
 DEFAULT_PATH_MAPPINGS = {
@@ -110,6 +119,9 @@ DEFAULT_LUFS_TARGET = -14.0  # Streaming standard
 class Config:
     """Application configuration."""
 
+    # Seconds to trust the last MyNVMe availability check
+    PRIMARY_DB_TTL = 2.0
+
     def __init__(
         self,
         local_db: Path | None = None,
@@ -119,13 +131,22 @@ class Config:
         self.local_db = local_db or LOCAL_VDJ_DB
         self.mynvme_db = mynvme_db or MYNVME_VDJ_DB
         self.backup_dir = backup_dir or BACKUP_DIR
+        self._primary_cache: tuple[float, Path] | None = None
 
     @property
     def primary_db(self) -> Path:
-        """Return the primary (MyNVMe) database if available, else local."""
-        if self.mynvme_db.exists():
-            return self.mynvme_db
-        return self.local_db
+        """Return the primary (MyNVMe) database if available, else local.
+
+        The availability check stats a possibly slow external volume, so
+        the result is reused for PRIMARY_DB_TTL seconds.
+        """
+        now = time.monotonic()
+        if self._primary_cache is not None and now - self._primary_cache[0] < self.PRIMARY_DB_TTL:
+            return self._primary_cache[1]
+
+        primary = self.mynvme_db if self.mynvme_db.exists() else self.local_db
+        self._primary_cache = (now, primary)
+        return primary
 
     def ensure_backup_dir(self) -> Path:
         """Create backup directory if it doesn't exist."""
@@ -133,6 +154,20 @@ class Config:
         return self.backup_dir
 
 
+# Background thread draining log records into the rotating file handler
+_log_listener: "QueueListener | None" = None
+
+
+def _stop_log_listener() -> None:
+    """Flush queued log records and stop the listener thread, if running."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
 def setup_logging(verbose: bool = False) -> None:
     """Configure centralized logging with console and file handlers.
 
@@ -141,10 +176,20 @@ def setup_logging(verbose: bool = False) -> None:
     handler. All child loggers (e.g. ``vdj_manager.analysis.energy``)
     inherit these handlers automatically.
 
+    The file handler sits behind a ``QueueHandler``: callers only enqueue
+    the record and a ``QueueListener`` thread does the disk write, so
+    logging from hot loops never waits on file I/O.
+
     Args:
         verbose: If True, set console level to DEBUG; otherwise INFO.
                  The file handler always captures DEBUG.
     """
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+    global _log_listener
+
     level = logging.DEBUG if verbose else logging.INFO
 
     root = logging.getLogger("vdj_manager")
@@ -173,7 +218,14 @@ def setup_logging(verbose: bool = False) -> None:
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
-    root.addHandler(file_handler)
+
+    _stop_log_listener()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _log_listener.start()
+    atexit.unregister(_stop_log_listener)
+    atexit.register(_stop_log_listener)
+    root.addHandler(QueueHandler(log_queue))
 
 
 # Global config instance
@@ -1,11 +1,86 @@
 """Backup management for VDJ databases."""
 
+import os
+import re
 import shutil
+import tarfile
+import time
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
 from ..config import BACKUP_DIR
 
+# Upper bound on bytes requested per copy_file_range() call
+_COPY_CHUNK = 1 << 30
+
+# Read size when comparing a database with its newest backup
+_COMPARE_CHUNK = 1 << 20
+
+# Source label written into backup names, keyed by a substring of the
+# database path; databases matching none of them are "unknown"
+_SOURCE_LABELS = {"MyNVMe": "mynvme", "Application Support": "local"}
+_UNKNOWN_SOURCE = "unknown"
+
+# {db_name}_{source}[_{label}]_{YYYYmmdd_HHMMSS}, as written by create_backup.
+# Parsed from the right: the timestamp, an optional label, then the last
+# source label in the stem, so underscores in the database name cannot
+# shift the fields.
+_BACKUP_NAME_RE = re.compile(
+    r"^(?P<name>.+)_(?P<source>"
+    + "|".join(map(re.escape, [*_SOURCE_LABELS.values(), _UNKNOWN_SOURCE]))
+    + r")(?:_(?P<label>.+?))?_(?P<timestamp>\d{8}_\d{6})$"
+)
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy a file and its metadata, keeping the data transfer in the kernel.
+
+    On Linux ``os.copy_file_range`` copies without bouncing bytes through
+    userspace and can share extents on Btrfs/XFS. Elsewhere, or if the
+    filesystem rejects it or copies fewer bytes than the source holds,
+    ``shutil.copy2`` is used, which already picks
+    the platform fast path (``fcopyfile`` on macOS, ``sendfile`` on Linux).
+
+    Args:
+        src: File to copy
+        dst: Destination path (overwritten if it exists)
+
+    Raises:
+        shutil.SameFileError: If src and dst are the same file
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        # Opening dst for writing would truncate src if both are one file
+        if dst.exists() and os.path.samefile(src, dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                copied = 0
+                while n := copy_file_range(fsrc.fileno(), fdst.fileno(), _COPY_CHUNK):
+                    copied += n
+            # Some FUSE, overlay and network mounts report EOF (0) early;
+            # a short copy is redone below rather than left truncated
+            if copied == size:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass  # Unsupported by this kernel/filesystem pair
+
+    shutil.copy2(src, dst)
+
+
+def _same_content(a: Path, b: Path) -> bool:
+    """Compare two files of equal size chunk by chunk, stopping at the first difference."""
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        while True:
+            chunk = fa.read(_COMPARE_CHUNK)
+            if chunk != fb.read(_COMPARE_CHUNK):
+                return False
+            if not chunk:
+                return True
+
 
 class BackupManager:
     """Manages timestamped backups of VDJ database files."""
@@ -14,15 +89,20 @@ class BackupManager:
         self.backup_dir = backup_dir or BACKUP_DIR
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
-    def create_backup(self, db_path: Path, label: str | None = None) -> Path:
+    def create_backup(
+        self, db_path: Path, label: str | None = None, skip_if_unchanged: bool = False
+    ) -> Path:
         """Create a timestamped backup of a database file.
 
         Args:
             db_path: Path to the database file to backup
             label: Optional label to include in backup filename
+            skip_if_unchanged: Return the newest existing backup of this database
+                (with any label) instead of copying, if its content is
+                identical to the database
 
         Returns:
-            Path to the created backup file
+            Path to the created (or reused) backup file
         """
         if not db_path.exists():
             raise FileNotFoundError(f"Database file not found: {db_path}")
@@ -31,12 +111,15 @@ class BackupManager:
 
         # Create a descriptive backup name
         db_name = db_path.stem
-        if "MyNVMe" in str(db_path):
-            source_label = "mynvme"
-        elif "Application Support" in str(db_path):
-            source_label = "local"
-        else:
-            source_label = "unknown"
+        source_label = next(
+            (label for marker, label in _SOURCE_LABELS.items() if marker in str(db_path)),
+            _UNKNOWN_SOURCE,
+        )
+
+        if skip_if_unchanged:
+            current = self._find_current_backup(db_path, source_label)
+            if current is not None:
+                return current
 
         if label:
             backup_name = f"{db_name}_{source_label}_{label}_{timestamp}.xml"
@@ -44,14 +127,40 @@ class BackupManager:
             backup_name = f"{db_name}_{source_label}_{timestamp}.xml"
 
         backup_path = self.backup_dir / backup_name
-        shutil.copy2(db_path, backup_path)
+        _fast_copy(db_path, backup_path)
 
         # Update mtime to current time so backups sort correctly by creation order
-        # (copy2 preserves source mtime, which breaks sorting when creating multiple backups)
+        # (the copy preserves source mtime, which breaks sorting when creating multiple backups)
         backup_path.touch()
 
         return backup_path
 
+    def _find_current_backup(self, db_path: Path, source: str) -> Path | None:
+        """Return the newest backup of this database if it is identical to it.
+
+        Backups of the same database name and source count whatever their
+        label, so back-to-back automatic backups share one copy. A size
+        mismatch or a database modified after the backup rules it out
+        without reading either file. Otherwise the content is compared,
+        since restores keep the backup's old mtime and many edits do not
+        change the file size. A reused backup is touched so that cleanup
+        and archiving treat it as the newest.
+        """
+        db_stat = db_path.stat()
+        for entry, backup_stat in self._scan_backups(source):
+            match = _BACKUP_NAME_RE.match(Path(entry.name).stem)
+            if match is None or match["name"] != db_path.stem or match["source"] != source:
+                continue
+            # Only the newest matching backup can be current
+            if backup_stat.st_size != db_stat.st_size or db_stat.st_mtime > backup_stat.st_mtime:
+                return None
+            if not _same_content(Path(entry.path), db_path):
+                return None
+            backup_path = Path(entry.path)
+            os.utime(backup_path)
+            return backup_path
+        return None
+
     def list_backups(self, source: str | None = None) -> list[Path]:
         """List all backup files, optionally filtered by source.
 
@@ -61,12 +170,31 @@ class BackupManager:
         Returns:
             List of backup file paths, sorted by modification time (newest first)
         """
-        pattern = "*.xml"
-        if source:
-            pattern = f"*_{source}_*.xml"
+        return [Path(entry.path) for entry, _ in self._scan_backups(source)]
+
+    def _scan_backups(self, source: str | None = None) -> list[tuple[os.DirEntry, os.stat_result]]:
+        """Scan the backup directory once, pairing each backup with its stat.
 
-        backups = list(self.backup_dir.glob(pattern))
-        return sorted(backups, key=lambda p: p.stat().st_mtime, reverse=True)
+        Args:
+            source: Filter by source label ('local', 'mynvme', etc.)
+
+        Returns:
+            List of (entry, stat) tuples, sorted by modification time (newest first)
+        """
+        infix = f"_{source}_" if source else None
+        backups = []
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".xml") or name.startswith("."):
+                    continue
+                if infix is not None and infix not in name:
+                    continue
+                if entry.is_file():
+                    backups.append((entry, entry.stat()))
+
+        backups.sort(key=lambda item: item[1].st_mtime, reverse=True)
+        return backups
 
     def get_latest_backup(self, source: str | None = None) -> Path | None:
         """Get the most recent backup file.
@@ -94,7 +222,7 @@ class BackupManager:
         if target_path.exists():
             self.create_backup(target_path, label="pre_restore")
 
-        shutil.copy2(backup_path, target_path)
+        _fast_copy(backup_path, target_path)
 
     def cleanup_old_backups(self, keep_count: int = 10, source: str | None = None) -> int:
         """Remove old backups, keeping the most recent ones.
@@ -117,6 +245,59 @@ class BackupManager:
 
         return len(to_remove)
 
+    def archive_old_backups(self, older_than_days: int = 30, source: str | None = None) -> int:
+        """Move old backups into monthly compressed archives.
+
+        Backups last modified more than ``older_than_days`` ago are grouped
+        by month into ``archive_YYYYMM.tar.xz`` files in the backup
+        directory. Successive backups of a database are almost identical,
+        so one solid xz stream holds a month of them in a small fraction of
+        the space. Originals are deleted only once their archive has been
+        completely written.
+
+        Args:
+            older_than_days: Archive backups older than this many days
+            source: Filter by source label ('local', 'mynvme', etc.)
+
+        Returns:
+            Number of backups archived
+        """
+        cutoff = time.time() - older_than_days * 86400
+        by_month: dict[str, list[Path]] = defaultdict(list)
+        for entry, stat in self._scan_backups(source):
+            if stat.st_mtime < cutoff:
+                month = datetime.fromtimestamp(stat.st_mtime).strftime("%Y%m")
+                by_month[month].append(Path(entry.path))
+
+        archived = 0
+        for month, backups in sorted(by_month.items()):
+            archive_path = self._unused_archive_path(month)
+            partial = archive_path.with_name(f".{archive_path.name}.partial")
+            try:
+                with tarfile.open(partial, "w:xz") as tar:
+                    # One solid stream, oldest first: xz finds the text shared
+                    # by consecutive backups within its dictionary window
+                    for backup in reversed(backups):
+                        tar.add(backup, arcname=backup.name)
+                partial.replace(archive_path)
+            finally:
+                partial.unlink(missing_ok=True)
+
+            for backup in backups:
+                backup.unlink()
+            archived += len(backups)
+
+        return archived
+
+    def _unused_archive_path(self, month: str) -> Path:
+        """Return ``archive_{month}.tar.xz``, numbered if that name is taken."""
+        archive_path = self.backup_dir / f"archive_{month}.tar.xz"
+        n = 2
+        while archive_path.exists():
+            archive_path = self.backup_dir / f"archive_{month}_{n}.tar.xz"
+            n += 1
+        return archive_path
+
     def get_backup_info(self, backup_path: Path) -> dict:
         """Get information about a backup file.
 
@@ -126,18 +307,35 @@ class BackupManager:
         Returns:
             Dict with backup metadata
         """
-        stat = backup_path.stat()
-        name_parts = backup_path.stem.split("_")
+        return self._backup_info(backup_path, backup_path.stat())
+
+    def list_backup_info(self, source: str | None = None) -> list[dict]:
+        """Get information about all backups, reusing the directory scan's stats.
+
+        Args:
+            source: Filter by source label ('local', 'mynvme', etc.)
+
+        Returns:
+            List of backup metadata dicts, newest first
+        """
+        return [
+            self._backup_info(Path(entry.path), stat) for entry, stat in self._scan_backups(source)
+        ]
+
+    @staticmethod
+    def _backup_info(backup_path: Path, stat: os.stat_result) -> dict:
+        """Build the metadata dict for a backup from its path and stat."""
+        match = _BACKUP_NAME_RE.match(backup_path.stem)
 
         return {
             "path": backup_path,
             "size": stat.st_size,
             "created": datetime.fromtimestamp(stat.st_mtime),
-            "source": name_parts[1] if len(name_parts) > 1 else "unknown",
-            "label": name_parts[2] if len(name_parts) > 3 else None,
+            "source": match["source"] if match else "unknown",
+            "label": match["label"] if match else None,
         }
 
     @property
     def total_backup_size(self) -> int:
         """Calculate total size of all backups in bytes."""
-        return sum(f.stat().st_size for f in self.backup_dir.glob("*.xml"))
+        return sum(stat.st_size for _, stat in self._scan_backups())
@@ -3,12 +3,200 @@
 import os
 import re
 from collections.abc import Iterator
+from copy import deepcopy
 from pathlib import Path
+from typing import BinaryIO
 
 from lxml import etree
 
 from ..config import AUDIO_EXTENSIONS
-from .models import DatabaseStats, Infos, Link, Playlist, Poi, PoiType, Scan, Song, Tags
+from ..files.scanner import find_existing_paths
+from .models import (
+    DatabaseStats,
+    Infos,
+    Link,
+    Playlist,
+    Poi,
+    PoiType,
+    Scan,
+    Song,
+    Tags,
+    file_extension,
+)
+
+# Line endings in serialized XML, normalized to CRLF on save
+_NEWLINE_RE = re.compile(rb"\r?\n")
+
+# An attribute value containing a raw apostrophe; [^"<>] prevents matching across tags
+_APOS_IN_ATTR_RE = re.compile(rb'"[^"<>]*\'[^"<>]*"')
+
+# Text content between a closing > and the next <
+_TEXT_CONTENT_RE = re.compile(rb">([^<]+)<")
+
+# Bytes of serialized XML to accumulate before applying the VDJ fix-ups
+_FORMAT_BUFFER_SIZE = 1 << 20
+
+
+def _escape_apos_in_attrs(match: re.Match) -> bytes:
+    return match.group(0).replace(b"'", b"&apos;")
+
+
+def _fix_text_content(match: re.Match) -> bytes:
+    text = match.group(1)
+    if not text.strip():
+        return match.group(0)
+    text = text.replace(b"'", b"&apos;")
+    text = text.replace(b'"', b"&quot;")
+    return b">" + text + b"<"
+
+
+def _apply_vdj_format(data: bytes) -> bytes:
+    """Rewrite a span of lxml's UTF-8 output into VDJ's on-disk format.
+
+    Every pattern is ASCII and UTF-8 multi-byte sequences never contain
+    ASCII bytes, so this works on the encoded bytes directly. The span must
+    end just after a "<" so no tag or text node is split.
+    """
+    # Restore &apos; entities in attribute values.
+    # lxml unescapes &apos; on parse and outputs raw ' (valid XML but
+    # differs from VDJ's format).
+    data = _APOS_IN_ATTR_RE.sub(_escape_apos_in_attrs, data)
+
+    # Restore entities in text content (between > and <).
+    # lxml unescapes &quot; and &apos; in text content.
+    data = _TEXT_CONTENT_RE.sub(_fix_text_content, data)
+
+    # Add space before /> in self-closing tags (VDJ format).
+    # Target "/> (end of attribute value + tag close) which is safe because
+    # lxml escapes internal " as &quot; — unescaped " always ends a value.
+    data = data.replace(b'"/>', b'" />')
+
+    # Convert LF (or existing CRLF) to CRLF in a single pass
+    return _NEWLINE_RE.sub(b"\r\n", data)
+
+
+class _VDJFormatWriter:
+    """File-like sink that applies the VDJ format fix-ups while lxml streams.
+
+    lxml's ``ElementTree.write`` hands over output in small chunks; they are
+    buffered to about ``_FORMAT_BUFFER_SIZE`` and flushed up to the last "<",
+    so the serialized document is never held in memory as a whole.
+    """
+
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        self._chunks: list[bytes] = []
+        self._buffered = 0
+        self._first = True
+        self._tail = b""
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(data)
+        self._buffered += len(data)
+        if self._buffered >= _FORMAT_BUFFER_SIZE:
+            self._flush(final=False)
+        return len(data)
+
+    def close(self) -> None:
+        """Flush the remaining output and ensure the trailing CRLF."""
+        self._flush(final=True)
+        if self._tail != b"\r\n":
+            self._raw.write(b"\r\n")
+
+    def _flush(self, final: bool) -> None:
+        buf = b"".join(self._chunks)
+        cut = len(buf) if final else buf.rfind(b"<") + 1
+        head, rest = buf[:cut], buf[cut:]
+        self._chunks = [rest] if rest else []
+        self._buffered = len(rest)
+        if not head:
+            return
+
+        if self._first:
+            # Fix XML declaration: single quotes → double quotes
+            head = head.replace(
+                b"<?xml version='1.0' encoding='UTF-8'?>",
+                b'<?xml version="1.0" encoding="UTF-8"?>',
+                1,
+            )
+            self._first = False
+
+        head = _apply_vdj_format(head)
+        self._raw.write(head)
+        self._tail = (self._tail + head)[-2:]
+
+
+# XML Tags attribute names (lowercased) whose model field name differs
+_TAG_FIELD_ALIASES = {"tracknumber": "track_number"}
+
+# Path kinds tallied by get_stats, each counted into the DatabaseStats field
+# at the same index (None: only contributes to the windows/local totals)
+(
+    _KIND_NETSEARCH,
+    _KIND_WIN_C,
+    _KIND_WIN_D,
+    _KIND_WIN_E,
+    _KIND_WIN_OTHER,
+    _KIND_MAC_HOME,
+    _KIND_MYNVME,
+    _KIND_LOCAL_OTHER,
+) = range(8)
+_PATH_KIND_FIELDS: tuple[str | None, ...] = (
+    "netsearch",
+    "windows_c_paths",
+    "windows_d_paths",
+    "windows_e_paths",
+    None,
+    "mac_home_paths",
+    "mynvme_paths",
+    None,
+)
+_WIN_DRIVE_KINDS = {
+    "C": _KIND_WIN_C,
+    "c": _KIND_WIN_C,
+    "D": _KIND_WIN_D,
+    "d": _KIND_WIN_D,
+    "E": _KIND_WIN_E,
+    "e": _KIND_WIN_E,
+}
+
+
+def _path_kind(file_path: str) -> int:
+    """Classify a song path in one pass (same rules as Song.is_netsearch/is_windows_path)."""
+    if "://" in file_path and not file_path.startswith("file://"):
+        return _KIND_NETSEARCH
+    if len(file_path) > 1 and file_path[1] == ":":
+        return _WIN_DRIVE_KINDS.get(file_path[0], _KIND_WIN_OTHER)
+    if file_path.startswith("/Users/"):
+        return _KIND_MAC_HOME
+    if file_path.startswith("/Volumes/MyNVMe"):
+        return _KIND_MYNVME
+    return _KIND_LOCAL_OTHER
+
+
+# PoiType by attribute value; a dict lookup avoids Enum.__call__ per POI
+_POI_TYPES: dict[str | None, PoiType] = {member.value: member for member in PoiType}
+
+
+def _safe_int(value: str | None) -> int | None:
+    """Safely convert string to int (None for missing or malformed values)."""
+    # Most attributes are absent; returning early skips a raised TypeError
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _safe_float(value: str | None) -> float | None:
+    """Safely convert string to float (None for missing or malformed values)."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
 
 
 class VDJDatabase:
@@ -21,128 +209,172 @@ class VDJDatabase:
         self._songs: dict[str, Song] = {}
         self._playlists: list[Playlist] = []
         self._filepath_to_elem: dict[str, etree._Element] = {}
+        self._dirty = False
 
     @property
     def is_loaded(self) -> bool:
         """Check if database is loaded."""
         return self._root is not None
 
+    @property
+    def is_modified(self) -> bool:
+        """Check if the tree has changed since it was loaded or last saved."""
+        return self._dirty
+
     def load(self) -> None:
         """Load and parse the database XML file."""
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database not found: {self.db_path}")
 
-        parser = etree.XMLParser(
+        # Single streaming pass: songs and playlists are parsed as their end
+        # tags arrive instead of building the tree first and walking it twice.
+        # Elements are kept (not cleared) since mutations and save() need them.
+        context = etree.iterparse(
+            str(self.db_path),
+            events=("end",),
+            tag=("Song", "MyList"),
             remove_blank_text=False,
             strip_cdata=False,
             resolve_entities=False,
             no_network=True,
         )
-        self._tree = etree.parse(str(self.db_path), parser)
-        self._root = self._tree.getroot()
-
-        # Parse all songs and build element index
-        self._songs.clear()
-        self._filepath_to_elem.clear()
-        for song_elem in self._root.iter("Song"):
-            song = self._parse_song(song_elem)
-            if song:
-                self._songs[song.file_path] = song
-                self._filepath_to_elem[song.file_path] = song_elem
-
-        # Parse playlists
-        self._playlists.clear()
-        for mylist in self._root.iter("MyList"):
-            playlist = self._parse_playlist(mylist)
-            if playlist:
-                self._playlists.append(playlist)
+
+        songs: dict[str, Song] = {}
+        filepath_to_elem: dict[str, etree._Element] = {}
+        playlists: list[Playlist] = []
+        # Song entries anywhere inside a MyList are references, not library
+        # songs: they are collected for every enclosing playlist (as
+        # MyList.iter("Song") would find them) as they stream past, so the
+        # MyList end event needs no second walk over its descendants.
+        playlist_paths: dict[etree._Element, list[str]] = {}
+        for _, elem in context:
+            if elem.tag == "Song":
+                mylists = list(elem.iterancestors("MyList"))
+                if mylists:
+                    file_path = elem.get("FilePath")
+                    if file_path:
+                        for mylist in mylists:
+                            playlist_paths.setdefault(mylist, []).append(file_path)
+                    continue
+                song = self._parse_song(elem)
+                if song:
+                    songs[song.file_path] = song
+                    filepath_to_elem[song.file_path] = elem
+            else:
+                playlist = self._parse_playlist(elem, playlist_paths.pop(elem, []))
+                if playlist:
+                    playlists.append(playlist)
+
+        self._root = context.root
+        self._tree = self._root.getroottree()
+        self._songs = songs
+        self._filepath_to_elem = filepath_to_elem
+        self._playlists = playlists
+        self._dirty = False
 
     def _parse_song(self, elem: etree._Element) -> Song | None:
         """Parse a Song element into a Song model."""
+        _int = _safe_int
+        _float = _safe_float
+
         file_path = elem.get("FilePath")
         if not file_path:
             return None
 
         file_size = elem.get("FileSize")
 
+        # Sort the children in one walk rather than a separate lookup per kind
+        tags_elem = infos_elem = scan_elem = None
+        poi_elems = []
+        links = []
+        for child in elem:
+            tag = child.tag
+            if tag == "Poi":
+                poi_elems.append(child)
+            elif tag == "Tags":
+                if tags_elem is None:
+                    tags_elem = child
+            elif tag == "Infos":
+                if infos_elem is None:
+                    infos_elem = child
+            elif tag == "Scan":
+                if scan_elem is None:
+                    scan_elem = child
+            elif tag == "Link":
+                source = child.get("Source")
+                if source:
+                    links.append(Link(Source=source))
+
         # Parse Tags
         tags = None
-        tags_elem = elem.find("Tags")
         if tags_elem is not None:
+            get = tags_elem.get
             tags = Tags(
-                Author=tags_elem.get("Author"),
-                Title=tags_elem.get("Title"),
-                Genre=tags_elem.get("Genre"),
-                Album=tags_elem.get("Album"),
-                TrackNumber=self._safe_int(tags_elem.get("TrackNumber")),
-                Year=self._safe_int(tags_elem.get("Year")),
-                Composer=tags_elem.get("Composer"),
-                Grouping=tags_elem.get("Grouping"),
-                Remix=tags_elem.get("Remix"),
-                Label=tags_elem.get("Label"),
-                Comment=tags_elem.get("Comment"),
-                User2=tags_elem.get("User2"),
-                Bpm=self._safe_float(tags_elem.get("Bpm")),
-                Key=tags_elem.get("Key"),
-                Color=tags_elem.get("Color"),
-                Rating=self._safe_int(tags_elem.get("Rating")),
-                Flag=self._safe_int(tags_elem.get("Flag")),
+                Author=get("Author"),
+                Title=get("Title"),
+                Genre=get("Genre"),
+                Album=get("Album"),
+                TrackNumber=_int(get("TrackNumber")),
+                Year=_int(get("Year")),
+                Composer=get("Composer"),
+                Grouping=get("Grouping"),
+                Remix=get("Remix"),
+                Label=get("Label"),
+                Comment=get("Comment"),
+                User2=get("User2"),
+                Bpm=_float(get("Bpm")),
+                Key=get("Key"),
+                Color=get("Color"),
+                Rating=_int(get("Rating")),
+                Flag=_int(get("Flag")),
             )
 
         # Parse Infos
         infos = None
-        infos_elem = elem.find("Infos")
         if infos_elem is not None:
+            get = infos_elem.get
             infos = Infos(
-                SongLength=self._safe_float(infos_elem.get("SongLength")),
-                FirstSeen=self._safe_int(infos_elem.get("FirstSeen")),
-                LastPlay=self._safe_int(infos_elem.get("LastPlay")),
-                PlayCount=self._safe_int(infos_elem.get("PlayCount")),
-                Bitrate=self._safe_int(infos_elem.get("Bitrate")),
-                Cover=infos_elem.get("Cover"),
+                SongLength=_float(get("SongLength")),
+                FirstSeen=_int(get("FirstSeen")),
+                LastPlay=_int(get("LastPlay")),
+                PlayCount=_int(get("PlayCount")),
+                Bitrate=_int(get("Bitrate")),
+                Cover=get("Cover"),
             )
 
         # Parse Scan
         scan = None
-        scan_elem = elem.find("Scan")
         if scan_elem is not None:
+            get = scan_elem.get
             scan = Scan(
-                Bpm=self._safe_float(scan_elem.get("Bpm")),
-                Key=scan_elem.get("Key"),
-                Volume=self._safe_float(scan_elem.get("Volume")),
-                Flag=self._safe_int(scan_elem.get("Flag")),
+                Bpm=_float(get("Bpm")),
+                Key=get("Key"),
+                Volume=_float(get("Volume")),
+                Flag=_int(get("Flag")),
             )
 
         # Parse Poi (cue points, beatgrid, loops)
         pois = []
-        for poi_elem in elem.iter("Poi"):
-            poi_type_str = poi_elem.get("Type")
-            if poi_type_str:
-                try:
-                    poi_type = PoiType(poi_type_str)
-                    poi = Poi(
-                        Type=poi_type,
-                        Pos=self._safe_float(poi_elem.get("Pos")) or 0.0,
-                        Name=poi_elem.get("Name"),
-                        Num=self._safe_int(poi_elem.get("Num")),
-                        Size=self._safe_float(poi_elem.get("Size")),
-                        Point=self._safe_float(poi_elem.get("Point")),
-                        Bpm=self._safe_float(poi_elem.get("Bpm")),
-                    )
-                    pois.append(poi)
-                except ValueError:
-                    pass  # Unknown POI type
-
-        # Parse Links
-        links = []
-        for link_elem in elem.iter("Link"):
-            source = link_elem.get("Source")
-            if source:
-                links.append(Link(Source=source))
+        for poi_elem in poi_elems:
+            get = poi_elem.get
+            poi_type = _POI_TYPES.get(get("Type"))
+            if poi_type is None:
+                continue  # Missing or unknown POI type
+            pois.append(
+                Poi(
+                    Type=poi_type,
+                    Pos=_float(get("Pos")) or 0.0,
+                    Name=get("Name"),
+                    Num=_int(get("Num")),
+                    Size=_float(get("Size")),
+                    Point=_float(get("Point")),
+                    Bpm=_float(get("Bpm")),
+                )
+            )
 
         return Song(
             FilePath=file_path,
-            FileSize=self._safe_int(file_size),
+            FileSize=_int(file_size),
             tags=tags,
             infos=infos,
             scan=scan,
@@ -150,40 +382,14 @@ class VDJDatabase:
             links=links,
         )
 
-    def _parse_playlist(self, elem: etree._Element) -> Playlist | None:
-        """Parse a MyList element into a Playlist model."""
+    def _parse_playlist(self, elem: etree._Element, file_paths: list[str]) -> Playlist | None:
+        """Build a Playlist model from a MyList element and its collected song paths."""
         name = elem.get("Name")
         if not name:
             return None
 
-        file_paths = []
-        for song_elem in elem.iter("Song"):
-            file_path = song_elem.get("FilePath")
-            if file_path:
-                file_paths.append(file_path)
-
         return Playlist(Name=name, file_paths=file_paths)
 
-    @staticmethod
-    def _safe_int(value: str | None) -> int | None:
-        """Safely convert string to int."""
-        if value is None:
-            return None
-        try:
-            return int(value)
-        except ValueError:
-            return None
-
-    @staticmethod
-    def _safe_float(value: str | None) -> float | None:
-        """Safely convert string to float."""
-        if value is None:
-            return None
-        try:
-            return float(value)
-        except ValueError:
-            return None
-
     @property
     def songs(self) -> dict[str, Song]:
         """Return all songs keyed by file path."""
@@ -205,45 +411,52 @@ class VDJDatabase:
     def get_stats(self, check_existence: bool = False) -> DatabaseStats:
         """Calculate database statistics."""
         stats = DatabaseStats(total_songs=len(self._songs))
+        to_check: list[str] = []
+
+        # Tally into locals; attribute writes on the pydantic model are slow
+        kind_counts = [0] * len(_PATH_KIND_FIELDS)
+        audio_files = non_audio_files = with_energy = with_cue_points = 0
+        cue = PoiType.CUE
 
         for song in self._songs.values():
-            # Check path type
-            if song.is_netsearch:
-                stats.netsearch += 1
-            elif song.is_windows_path:
-                stats.windows_paths += 1
-                drive = song.file_path[0].upper()
-                if drive == "C":
-                    stats.windows_c_paths += 1
-                elif drive == "D":
-                    stats.windows_d_paths += 1
-                elif drive == "E":
-                    stats.windows_e_paths += 1
-            else:
-                stats.local_files += 1
-                if song.file_path.startswith("/Users/"):
-                    stats.mac_home_paths += 1
-                elif song.file_path.startswith("/Volumes/MyNVMe"):
-                    stats.mynvme_paths += 1
+            file_path = song.file_path
+            kind = _path_kind(file_path)
+            kind_counts[kind] += 1
+            is_netsearch = kind == _KIND_NETSEARCH
+            is_windows_path = _KIND_WIN_C <= kind <= _KIND_WIN_OTHER
 
             # Check file type
-            ext = song.extension
-            if ext in AUDIO_EXTENSIONS:
-                stats.audio_files += 1
-            else:
-                if not song.is_netsearch:
-                    stats.non_audio_files += 1
+            if file_extension(file_path) in AUDIO_EXTENSIONS:
+                audio_files += 1
+            elif not is_netsearch:
+                non_audio_files += 1
 
             # Check metadata
-            if song.energy is not None:
-                stats.with_energy += 1
-            if song.cue_points:
-                stats.with_cue_points += 1
-
-            # Check file existence (expensive)
-            if check_existence and not song.is_windows_path and not song.is_netsearch:
-                if not Path(song.file_path).exists():
-                    stats.missing_files += 1
+            tags = song.tags
+            if tags is not None and tags.energy_level is not None:
+                with_energy += 1
+            if any(poi.type is cue for poi in song.pois):
+                with_cue_points += 1
+
+            if check_existence and not is_windows_path and not is_netsearch:
+                to_check.append(file_path)
+
+        stats.audio_files = audio_files
+        stats.non_audio_files = non_audio_files
+        stats.with_energy = with_energy
+        stats.with_cue_points = with_cue_points
+
+        # Path type breakdown, then the totals derived from it
+        for field, count in zip(_PATH_KIND_FIELDS, kind_counts):
+            if field is not None:
+                setattr(stats, field, count)
+        stats.windows_paths = sum(kind_counts[_KIND_WIN_C : _KIND_WIN_OTHER + 1])
+        stats.local_files = sum(kind_counts[_KIND_MAC_HOME:])
+
+        # Check file existence (expensive): one directory listing per folder
+        # instead of a stat() per song
+        if to_check:
+            stats.missing_files = len(to_check) - len(find_existing_paths(to_check))
 
         return stats
 
@@ -256,32 +469,33 @@ class VDJDatabase:
         if song_elem is None:
             return False
 
+        self._apply_tags(file_path, song_elem, kwargs)
+        return True
+
+    def _apply_tags(self, file_path: str, song_elem: etree._Element, attrs: dict) -> None:
+        """Set Tags attributes on a song element and mirror them on its model."""
+        self._dirty = True
         tags_elem = song_elem.find("Tags")
         if tags_elem is None:
             tags_elem = etree.SubElement(song_elem, "Tags")
 
-        for key, value in kwargs.items():
+        for key, value in attrs.items():
             if value is not None:
                 tags_elem.set(key, str(value))
             elif key in tags_elem.attrib:
                 del tags_elem.attrib[key]
 
         # Update in-memory model
-        if file_path in self._songs:
-            song = self._songs[file_path]
+        song = self._songs.get(file_path)
+        if song is not None:
             if song.tags is None:
                 song.tags = Tags()
-            # Map XML attribute names to Pydantic field names
-            alias_map = {
-                "tracknumber": "track_number",
-            }
-            for key, value in kwargs.items():
-                attr_name = alias_map.get(key.lower(), key.lower())
+            for key, value in attrs.items():
+                # Map XML attribute names to Pydantic field names
+                attr_name = _TAG_FIELD_ALIASES.get(key.lower(), key.lower())
                 if hasattr(song.tags, attr_name):
                     setattr(song.tags, attr_name, value)
 
-        return True
-
     def update_song_scan(self, file_path: str, **kwargs) -> bool:
         """Update scan data for a song in the XML tree."""
         if not self.is_loaded:
@@ -291,16 +505,20 @@ class VDJDatabase:
         if song_elem is None:
             return False
 
+        self._apply_scan(song_elem, kwargs)
+        return True
+
+    def _apply_scan(self, song_elem: etree._Element, attrs: dict) -> None:
+        """Set Scan attributes on a song element."""
+        self._dirty = True
         scan_elem = song_elem.find("Scan")
         if scan_elem is None:
             scan_elem = etree.SubElement(song_elem, "Scan")
 
-        for key, value in kwargs.items():
+        for key, value in attrs.items():
             if value is not None:
                 scan_elem.set(key, str(value))
 
-        return True
-
     def update_song_infos(self, file_path: str, **kwargs) -> bool:
         """Update infos for a song in the XML tree.
 
@@ -314,6 +532,7 @@ class VDJDatabase:
         if song_elem is None:
             return False
 
+        self._dirty = True
         infos_elem = song_elem.find("Infos")
         if infos_elem is None:
             infos_elem = etree.SubElement(song_elem, "Infos")
@@ -363,6 +582,8 @@ class VDJDatabase:
         if song_elem is None:
             return False
 
+        self._dirty = True
+
         # Remove existing cue-type Poi elements from XML
         for poi_elem in list(song_elem.findall("Poi")):
             if poi_elem.get("Type") == "cue":
@@ -400,6 +621,7 @@ class VDJDatabase:
             return False
 
         song_elem.set("FilePath", new_path)
+        self._dirty = True
 
         # Update element index
         del self._filepath_to_elem[old_path]
@@ -425,6 +647,7 @@ class VDJDatabase:
         parent = song_elem.getparent()
         if parent is not None:
             parent.remove(song_elem)
+            self._dirty = True
             self._songs.pop(file_path, None)
             self._filepath_to_elem.pop(file_path, None)
             return True
@@ -436,6 +659,7 @@ class VDJDatabase:
             raise RuntimeError("Database not loaded")
 
         song_elem = etree.SubElement(self._root, "Song")  # type: ignore[arg-type]
+        self._dirty = True
         song_elem.set("FilePath", file_path)
         if file_size is not None:
             song_elem.set("FileSize", str(file_size))
@@ -457,71 +681,43 @@ class VDJDatabase:
         - Space before /> in self-closing tags
         - Apostrophes as &apos; entities in attribute values
         - Trailing CRLF after root element
+
+        Saving an unmodified database back to its own file is a no-op.
         """
         if not self.is_loaded:
             raise RuntimeError("Database not loaded")
 
         path = output_path or self.db_path
+        if not self._dirty and path == self.db_path:
+            return
 
-        # lxml produces single quotes and no space before />, so we post-process
-        xml_bytes = etree.tostring(
-            self._tree,  # type: ignore[arg-type]
-            encoding="UTF-8",
-            xml_declaration=True,
-            pretty_print=False,
-        )
-
-        xml_str: str = xml_bytes.decode("utf-8") if isinstance(xml_bytes, bytes) else xml_bytes
-
-        # Fix XML declaration: single quotes → double quotes
-        xml_str = xml_str.replace(
-            "<?xml version='1.0' encoding='UTF-8'?>",
-            '<?xml version="1.0" encoding="UTF-8"?>',
-        )
-
-        # Restore &apos; entities in attribute values.
-        # lxml unescapes &apos; on parse and outputs raw ' (valid XML but
-        # differs from VDJ's format). [^"<>] prevents matching across tags.
-        def _escape_apos_in_attrs(match: re.Match) -> str:
-            return match.group(0).replace("'", "&apos;")
-
-        xml_str = re.sub(r'"[^"<>]*\'[^"<>]*"', _escape_apos_in_attrs, xml_str)
-
-        # Restore entities in text content (between > and <).
-        # lxml unescapes &quot; and &apos; in text content.
-        def _fix_text_content(match: re.Match) -> str:
-            text = match.group(1)
-            if not text.strip():
-                return match.group(0)
-            text = text.replace("'", "&apos;")
-            text = text.replace('"', "&quot;")
-            return ">" + text + "<"
-
-        xml_str = re.sub(r">([^<]+)<", _fix_text_content, xml_str)
-
-        # Add space before /> in self-closing tags (VDJ format).
-        # Target "/> (end of attribute value + tag close) which is safe because
-        # lxml escapes internal " as &quot; — unescaped " always ends a value.
-        xml_str = xml_str.replace('"/>', '" />')
-
-        # Convert LF to CRLF
-        xml_str = xml_str.replace("\r\n", "\n").replace("\n", "\r\n")
-
-        # Ensure trailing CRLF
-        if not xml_str.endswith("\r\n"):
-            xml_str += "\r\n"
-
+        # lxml produces single quotes and no space before />, so the output is
+        # post-processed as it streams to the temp file.
         # Atomic write: write to temp file, then rename.
         # os.replace() is atomic on POSIX when src/dst are on the same
-        # filesystem, so the database is never left partially written.
+        # filesystem, so the database is never left partially written; the
+        # fsync makes sure the rename cannot land before the data does.
         tmp_path = path.with_suffix(".xml.tmp")
         try:
-            tmp_path.write_bytes(xml_str.encode("utf-8"))
+            with open(tmp_path, "wb") as f:
+                writer = _VDJFormatWriter(f)
+                self._tree.write(  # type: ignore[union-attr]
+                    writer,  # type: ignore[arg-type]
+                    encoding="UTF-8",
+                    xml_declaration=True,
+                    pretty_print=False,
+                )
+                writer.close()
+                f.flush()
+                os.fsync(f.fileno())
             os.replace(str(tmp_path), str(path))
         except Exception:
             tmp_path.unlink(missing_ok=True)
             raise
 
+        if path == self.db_path:
+            self._dirty = False
+
     def merge_from(self, other: "VDJDatabase", prefer_other: bool = True) -> dict:
         """Merge songs from another database into this one.
 
@@ -536,6 +732,9 @@ class VDJDatabase:
             raise RuntimeError("Both databases must be loaded")
 
         stats = {"added": 0, "updated": 0, "skipped": 0}
+        # Loaded-ness is checked once above; the per-song work goes straight
+        # to the indexed elements instead of through the public update methods
+        elem_index = self._filepath_to_elem
 
         for file_path, other_song in other.songs.items():
             if file_path in self._songs:
@@ -547,20 +746,22 @@ class VDJDatabase:
                     # Update tags if other has more info
                     if other_song.tags:
                         if not existing.tags or (other_song.energy and not existing.energy):
-                            self.update_song_tags(
+                            self._apply_tags(
                                 file_path,
-                                Grouping=other_song.tags.grouping,
-                                Comment=other_song.tags.comment,
+                                elem_index[file_path],
+                                {
+                                    "Grouping": other_song.tags.grouping,
+                                    "Comment": other_song.tags.comment,
+                                },
                             )
                             updated = True
 
                     # Update scan if other has BPM/key
                     if other_song.scan and other_song.scan.bpm:
                         if not existing.scan or not existing.scan.bpm:
-                            self.update_song_scan(
-                                file_path,
-                                Bpm=other_song.scan.bpm,
-                                Key=other_song.scan.key,
+                            self._apply_scan(
+                                elem_index[file_path],
+                                {"Bpm": other_song.scan.bpm, "Key": other_song.scan.key},
                             )
                             updated = True
 
@@ -574,10 +775,12 @@ class VDJDatabase:
                 # Add new song (copy XML element via index)
                 song_elem = other._filepath_to_elem.get(file_path)
                 if song_elem is not None:
-                    new_elem = etree.fromstring(etree.tostring(song_elem))
+                    new_elem = deepcopy(song_elem)
+                    new_elem.tail = None
                     self._root.append(new_elem)  # type: ignore[union-attr]
+                    self._dirty = True
                     self._songs[file_path] = other_song
-                    self._filepath_to_elem[file_path] = new_elem
+                    elem_index[file_path] = new_elem
                     stats["added"] += 1
 
         return stats
@@ -6,6 +6,19 @@ from pathlib import Path
 from pydantic import BaseModel, Field, computed_field
 
 
+def file_extension(file_path: str) -> str:
+    """Return the lowercase suffix of a path string (same as ``Path.suffix``).
+
+    Works on the string directly; building a Path per song dominated
+    callers that classify every song in the database.
+    """
+    name = file_path.rpartition("/")[2]
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ""
+
+
 class PoiType(str, Enum):
     """Types of Point of Interest markers in VDJ."""
 
@@ -150,7 +163,7 @@ class Song(BaseModel):
     @property
     def extension(self) -> str:
         """Return lowercase file extension."""
-        return Path(self.file_path).suffix.lower()
+        return file_extension(self.file_path)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -186,10 +199,12 @@ class Song(BaseModel):
         if not self.tags or not self.tags.user2:
             return None
         # User2 contains space-separated hashtags like "#ClearBeat #Mellow #happy"
-        # Mood tags are lowercase hashtags added by the analyzer
-        hashtags = self.tags.user2.split()
-        mood_tags = [h[1:] for h in hashtags if h.startswith("#") and h[1:].islower()]
-        return mood_tags[-1] if mood_tags else None
+        # Mood tags are lowercase hashtags added by the analyzer; scan from the
+        # end since only the most recent one is wanted
+        for hashtag in reversed(self.tags.user2.split()):
+            if hashtag.startswith("#") and hashtag[1:].islower():
+                return hashtag[1:]
+        return None
 
     @property
     def actual_bpm(self) -> float | None:
@@ -199,18 +214,18 @@ class Song(BaseModel):
     @property
     def cue_points(self) -> list[Poi]:
         """Get cue point markers."""
-        return [p for p in self.pois if p.type == PoiType.CUE]
+        return [p for p in self.pois if p.type is PoiType.CUE]
 
     @property
     def loops(self) -> list[Poi]:
         """Get loop markers."""
-        return [p for p in self.pois if p.type == PoiType.LOOP]
+        return [p for p in self.pois if p.type is PoiType.LOOP]
 
     @property
     def beatgrid(self) -> Poi | None:
         """Get beatgrid marker."""
         for p in self.pois:
-            if p.type == PoiType.BEATGRID:
+            if p.type is PoiType.BEATGRID:
                 return p
         return None
 
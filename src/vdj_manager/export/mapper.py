@@ -110,6 +110,26 @@ class VDJToSeratoMapper:
             "type": "loop",
         }
 
+    def map_cue_points_only(self, song: Song) -> list[dict]:
+        """Map just the cue points of a song, as in ``map_song()["cue_points"]``.
+
+        Skips tags, BPM/key conversion, loops and the beatgrid, and stops
+        after the 8 cue points Serato supports.
+
+        Args:
+            song: VDJ Song object
+
+        Returns:
+            List of Serato cue point dicts
+        """
+        cue_points: list[dict] = []
+        for poi in song.pois:
+            if poi.type is PoiType.CUE:
+                cue_points.append(self.map_cue_point(poi, len(cue_points)))
+                if len(cue_points) == 8:
+                    break
+        return cue_points
+
     def map_song(self, song: Song) -> dict:
         """Map all metadata from a VDJ song to Serato format.
 
@@ -119,66 +139,58 @@ class VDJToSeratoMapper:
         Returns:
             Dict with all Serato-compatible metadata
         """
-        result: dict[str, float | int | list | str | dict | None] = {
-            "file_path": song.file_path,
-            "bpm": None,
-            "key": None,
-            "artist": None,
-            "title": None,
-            "album": None,
-            "genre": None,
-            "comment": None,
-            "energy": None,
-            "cue_points": [],
-            "loops": [],
-            "beatgrid": None,
-        }
-
-        # Basic metadata from tags
-        if song.tags:
-            result["artist"] = song.tags.author
-            result["title"] = song.tags.title
-            result["album"] = song.tags.album
-            result["genre"] = song.tags.genre
-
-            # Energy to comment
-            if song.tags.energy_level:
-                result["energy"] = song.tags.energy_level
-                result["comment"] = f"Energy: {song.tags.energy_level}"
-
-            # Original comment
-            if song.tags.comment and not result["comment"]:
-                result["comment"] = song.tags.comment
-
-        # BPM and key from scan
-        if song.scan:
-            if song.scan.bpm:
-                result["bpm"] = self.convert_bpm(song.scan.bpm)
-            if song.scan.key:
-                result["key"] = self.convert_key(song.scan.key)
-
-        # Cue points and loops
-        cue_index = 0
-        loop_index = 0
+        # Collect values in locals and build the result dict once at the end
+        bpm = key = None
+        scan = song.scan
+        if scan:
+            if scan.bpm:
+                bpm = self.convert_bpm(scan.bpm)
+            if scan.key:
+                key = self.convert_key(scan.key)
+
+        cue_points: list[dict] = []
+        loops: list[dict] = []
+        beatgrid = None
 
         for poi in song.pois:
-            if poi.type == PoiType.CUE:
-                if cue_index < 8:  # Serato supports 8 cue points
-                    result["cue_points"].append(self.map_cue_point(poi, cue_index))  # type: ignore[union-attr]
-                    cue_index += 1
-
-            elif poi.type == PoiType.LOOP:
-                if loop_index < 8:  # Serato supports 8 loops
-                    result["loops"].append(self.map_loop(poi, loop_index))  # type: ignore[union-attr]
-                    loop_index += 1
-
-            elif poi.type == PoiType.BEATGRID:
-                result["beatgrid"] = {
+            poi_type = poi.type
+            if poi_type is PoiType.CUE:
+                if len(cue_points) < 8:  # Serato supports 8 cue points
+                    cue_points.append(self.map_cue_point(poi, len(cue_points)))
+
+            elif poi_type is PoiType.LOOP:
+                if len(loops) < 8:  # Serato supports 8 loops
+                    loops.append(self.map_loop(poi, len(loops)))
+
+            elif poi_type is PoiType.BEATGRID:
+                beatgrid = {
                     "position_ms": self.convert_cue_position(poi.pos),
-                    "bpm": self.convert_bpm(poi.bpm) if poi.bpm else result["bpm"],
+                    "bpm": self.convert_bpm(poi.bpm) if poi.bpm else bpm,
                 }
 
-        return result
+        tags = song.tags
+        if tags:
+            energy = tags.energy_level
+            # Energy goes to the comment, otherwise keep the original comment
+            comment = f"Energy: {energy}" if energy else tags.comment or None
+            artist, title, album, genre = tags.author, tags.title, tags.album, tags.genre
+        else:
+            energy = comment = artist = title = album = genre = None
+
+        return {
+            "file_path": song.file_path,
+            "bpm": bpm,
+            "key": key,
+            "artist": artist,
+            "title": title,
+            "album": album,
+            "genre": genre,
+            "comment": comment,
+            "energy": energy or None,
+            "cue_points": cue_points,
+            "loops": loops,
+            "beatgrid": beatgrid,
+        }
 
     def generate_serato_markers(self, song: Song) -> bytes:
         """Generate Serato Markers2 binary data for a song.
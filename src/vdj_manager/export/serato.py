@@ -1,7 +1,12 @@
 """Serato export functionality."""
 
 import logging
+import os
+import re
 import struct
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -17,14 +22,37 @@ except ImportError:
 
 from ..config import SERATO_LOCAL
 from ..core.models import Song
+from ..files.scanner import find_existing_paths
 from .mapper import VDJToSeratoMapper
 
+# otrk/ptrk headers of a crate track entry (tag + big-endian length, twice)
+_TRACK_HEADER = struct.Struct(">4sI4sI")
+
+# Serato Markers2 fields: big-endian length prefix, and the fixed part of a
+# cue entry (type, position ms, color, name length)
+_U32BE = struct.Struct(">I")
+_CUE_ENTRY_HEADER = struct.Struct(">BIIB")
+
+# Crate file header: "vrsn" record holding the UTF-16BE format version,
+# laid out like the track records (tag + big-endian length + payload)
+_CRATE_VERSION = "1.0/Serato ScratchLive Crate".encode("utf-16-be")
+_CRATE_HEADER = b"vrsn" + _U32BE.pack(len(_CRATE_VERSION)) + _CRATE_VERSION
+
+# Path separators and characters not allowed in crate file names
+_UNSAFE_NAME_RE = re.compile(r'[/\\:*?"<>|]')
+
+
+@lru_cache(maxsize=8192)
+def _encode_utf16be(file_path: str) -> bytes:
+    """Encode a path as UTF-16BE, cached for tracks shared between crates."""
+    return file_path.encode("utf-16-be")
+
 
 class SeratoCrateWriter:
     """Write Serato crate files."""
 
     # Serato crate file header
-    CRATE_HEADER = b"vrsn\x00\x00\x00\x008\x00.\x001\x00/\x00S\x00e\x00r\x00a\x00t\x00o\x00 \x00S\x00c\x00r\x00a\x00t\x00c\x00h\x00L\x00i\x00v\x00e\x00 \x00C\x00r\x00a\x00t\x00e"
+    CRATE_HEADER = _CRATE_HEADER
 
     def __init__(self, serato_dir: Path | None = None):
         """Initialize crate writer.
@@ -51,8 +79,7 @@ class SeratoCrateWriter:
             Encoded path bytes
         """
         # Serato expects paths relative to drive root or absolute
-        path_bytes = file_path.encode("utf-16-be")
-        return path_bytes
+        return _encode_utf16be(file_path)
 
     def create_track_entry(self, file_path: str) -> bytes:
         """Create a track entry for the crate file.
@@ -68,10 +95,7 @@ class SeratoCrateWriter:
         path_encoded = self.encode_path(file_path)
         path_length = len(path_encoded)
 
-        ptrk = b"ptrk" + struct.pack(">I", path_length) + path_encoded
-        otrk = b"otrk" + struct.pack(">I", len(ptrk)) + ptrk
-
-        return otrk
+        return _TRACK_HEADER.pack(b"otrk", path_length + 8, b"ptrk", path_length) + path_encoded
 
     def write_crate(self, name: str, file_paths: list[str]) -> Path:
         """Write a Serato crate file.
@@ -85,17 +109,11 @@ class SeratoCrateWriter:
         """
         self.ensure_directories()
 
-        # Build crate content
-        content = bytearray(self.CRATE_HEADER)
-
-        for path in file_paths:
-            track_entry = self.create_track_entry(path)
-            content.extend(track_entry)
+        # Build crate content in one join
+        content = b"".join([self.CRATE_HEADER, *map(self.create_track_entry, file_paths)])
 
         # Sanitize crate name: strip path separators and filesystem-unsafe chars
-        import re
-
-        safe_name = re.sub(r'[/\\:*?"<>|]', "_", name)
+        safe_name = _UNSAFE_NAME_RE.sub("_", name)
         # Remove path components (e.g. "../../evil" → "evil" after sub becomes "_.._evil")
         safe_name = Path(safe_name).name
         if not safe_name or safe_name == ".":
@@ -289,19 +307,17 @@ class SeratoTagWriter:
             name = cue.get("name", f"Cue {i + 1}")[:32]  # Max 32 chars
 
             # Cue point entry: type(1) + position(4) + color(4) + name
-            entry = struct.pack(">B", 0)  # Type 0 = cue
-            entry += struct.pack(">I", pos_ms)
-            entry += struct.pack(">I", color)
-            entry += struct.pack(">B", len(name))
-            entry += name.encode("utf-8")
-            entries.append(entry)
-
-        # Combine header and entries
-        data = header + struct.pack(">I", len(entries))
+            name_bytes = name.encode("utf-8")
+            # Type 0 = cue
+            entries.append(_CUE_ENTRY_HEADER.pack(0, pos_ms, color, len(name_bytes)) + name_bytes)
+
+        # Combine header and length-prefixed entries in one join
+        parts = [header, _U32BE.pack(len(entries))]
         for entry in entries:
-            data += struct.pack(">I", len(entry)) + entry
+            parts.append(_U32BE.pack(len(entry)))
+            parts.append(entry)
 
-        return data
+        return b"".join(parts)
 
 
 class SeratoExporter:
@@ -322,12 +338,16 @@ class SeratoExporter:
         except ImportError:
             self.tag_writer = None
 
-    def export_song(self, song: Song, cues_only: bool = False) -> bool:
+    def export_song(
+        self, song: Song, cues_only: bool = False, *, check_exists: bool = True
+    ) -> bool:
         """Export a single song to Serato format.
 
         Args:
             song: VDJ Song object
             cues_only: Only export cue points, not metadata
+            check_exists: Stat the file first; pass False when the caller
+                has already checked
 
         Returns:
             True if successful
@@ -335,28 +355,64 @@ class SeratoExporter:
         if not self.tag_writer:
             return False
 
-        if not Path(song.file_path).exists():
+        if check_exists and not os.path.exists(song.file_path):
             return False
 
-        # Map VDJ metadata to Serato format
-        mapped = self.mapper.map_song(song)
-
         if cues_only:
-            # Only write cue points
-            return self.tag_writer.write_tags(
-                song.file_path,
-                cue_points=mapped["cue_points"],
-            )
-        else:
-            # Write all metadata
+            # Only write cue points; no need to map the rest of the metadata
             return self.tag_writer.write_tags(
                 song.file_path,
-                bpm=mapped["bpm"],
-                key=mapped["key"],
-                cue_points=mapped["cue_points"],
-                comment=mapped["comment"],
+                cue_points=self.mapper.map_cue_points_only(song),
             )
 
+        # Map VDJ metadata to Serato format and write all of it
+        mapped = self.mapper.map_song(song)
+        return self.tag_writer.write_tags(
+            song.file_path,
+            bpm=mapped["bpm"],
+            key=mapped["key"],
+            cue_points=mapped["cue_points"],
+            comment=mapped["comment"],
+        )
+
+    def export_songs(
+        self,
+        songs: list[Song],
+        cues_only: bool = False,
+        max_workers: int | None = None,
+        check_exists: bool = True,
+    ) -> Iterator[tuple[Song, bool | Exception]]:
+        """Export songs concurrently, yielding results as they complete.
+
+        Tag writing is I/O-bound and independent per file, so a thread pool
+        overlaps the disk waits. Songs sharing a file path are exported once
+        so no two threads ever write the same file.
+
+        Args:
+            songs: VDJ Song objects to export
+            cues_only: Only export cue points, not metadata
+            max_workers: Number of worker threads (default: 2x CPU count, max 32)
+            check_exists: Passed on to export_song
+
+        Yields:
+            Tuples of (song, result) where result is the export_song return
+            value, or the exception it raised
+        """
+        unique_songs = list({song.file_path: song for song in songs}.values())
+        workers = max_workers or min(32, (os.cpu_count() or 1) * 2)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.export_song, song, cues_only, check_exists=check_exists): song
+                for song in unique_songs
+            }
+            for future in as_completed(futures):
+                song = futures[future]
+                try:
+                    yield song, future.result()
+                except Exception as e:
+                    yield song, e
+
     def create_crate(self, name: str, file_paths: list[str]) -> Path:
         """Create a Serato crate.
 
@@ -369,26 +425,35 @@ class SeratoExporter:
         """
         return self.crate_writer.write_crate(name, file_paths)
 
-    def export_playlist(self, name: str, songs: list[Song]) -> tuple[int, Path]:
+    def export_playlist(
+        self, name: str, songs: list[Song], max_workers: int | None = None
+    ) -> tuple[int, Path]:
         """Export a playlist as a Serato crate.
 
+        Tags are written concurrently via ``export_songs``; the crate keeps
+        the playlist order.
+
         Args:
             name: Playlist/crate name
             songs: List of VDJ Song objects
+            max_workers: Number of tag-writing threads (default: see export_songs)
 
         Returns:
             Tuple of (exported count, crate path)
         """
-        exported = 0
-        file_paths = []
-
-        for song in songs:
-            if Path(song.file_path).exists():
-                if self.export_song(song):
-                    exported += 1
-                file_paths.append(song.file_path)
-
-        crate_path = self.create_crate(name, file_paths)
+        # One directory listing per parent instead of a stat per entry; the
+        # writes below skip export_song's own check.
+        existing = find_existing_paths(song.file_path for song in songs)
+        present = [song for song in songs if song.file_path in existing]
+
+        results: dict[str, bool | Exception] = {}
+        for song, result in self.export_songs(present, max_workers=max_workers, check_exists=False):
+            if isinstance(result, Exception):
+                logger.error("Failed to export %s: %s", song.file_path, result)
+            results[song.file_path] = result
+
+        exported = sum(1 for song in present if results.get(song.file_path) is True)
+        crate_path = self.create_crate(name, [song.file_path for song in present])
 
         return exported, crate_path
 
@@ -1,35 +1,119 @@
 """Duplicate detection utilities."""
 
 import hashlib
+import os
 from collections import defaultdict
-from collections.abc import Iterator
-from pathlib import Path
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
 from ..core.models import Song
 
+try:
+    import blake3
+
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+
+# Hasher state after a file's prefix, and how many bytes it has consumed
+_Prefix = tuple[Any, int]
+
+_K = TypeVar("_K")
+
+
+def _new_hasher() -> Any:
+    """Return a hasher for duplicate checks.
+
+    Hashes are only compared within one run, so BLAKE3 (SIMD, several
+    times faster per byte) is used when installed, SHA-256 otherwise.
+    """
+    if BLAKE3_AVAILABLE:
+        return blake3.blake3()
+    return hashlib.sha256()
+
+
+def _repeated_groups(keyed_songs: Iterable[tuple[_K, Song]]) -> dict[_K, list[Song]]:
+    """Group songs by key, keeping only keys seen more than once.
+
+    A key's first song waits in a side dict and a list is only created
+    when a second song arrives, so unique keys (most of a library) never
+    allocate a list and no filtering pass is needed afterwards.
+    """
+    first_seen: dict[_K, Song] = {}
+    groups: dict[_K, list[Song]] = {}
+    for key, song in keyed_songs:
+        if key in groups:
+            groups[key].append(song)
+        elif key in first_seen:
+            groups[key] = [first_seen.pop(key), song]
+        else:
+            first_seen[key] = song
+    return groups
+
 
 class DuplicateDetector:
     """Detects duplicate songs by various criteria."""
 
     @staticmethod
-    def compute_file_hash(path: str, chunk_size: int = 65536) -> str | None:
-        """Compute SHA-256 hash of a file.
+    def compute_file_hash(
+        path: str,
+        chunk_size: int = 1024 * 1024,
+        resume: _Prefix | None = None,
+    ) -> str | None:
+        """Compute a content hash of a file.
+
+        Reads go into one reusable buffer, so hashing a large file does not
+        allocate a new bytes object per chunk.
 
         Args:
             path: Path to file
             chunk_size: Size of chunks to read
+            resume: ``(hasher, offset)`` from ``_hash_prefix``; hashing
+                continues from ``offset`` instead of re-reading the prefix
 
         Returns:
             Hex digest of file hash, or None if file not accessible
         """
         try:
-            hasher = hashlib.sha256()
-            with open(path, "rb") as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    hasher.update(chunk)
+            hasher, offset = resume if resume is not None else (_new_hasher(), 0)
+            view = memoryview(bytearray(chunk_size))
+            with open(path, "rb", buffering=0) as f:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), offset, 0, os.POSIX_FADV_SEQUENTIAL)
+                f.seek(offset)
+                while n := f.readinto(view):
+                    hasher.update(view[:n])
             return hasher.hexdigest()
-        except (OSError, FileNotFoundError):
+        except OSError:
+            return None
+
+    @staticmethod
+    def _hash_prefix(path: str, bytes_to_read: int = 1024 * 1024) -> _Prefix | None:
+        """Hash the first N bytes of a file.
+
+        Returns:
+            ``(hasher, bytes hashed)``, or None if file not accessible. The
+            hasher can be passed to ``compute_file_hash`` to finish the file.
+        """
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            # One pread on the raw descriptor skips the buffered file object
+            data = os.pread(fd, bytes_to_read, 0)
+            hasher = _new_hasher()
+            hasher.update(data)
+            if hasattr(os, "posix_fadvise"):
+                # The prefix is read once; don't let it evict useful cache
+                os.posix_fadvise(fd, 0, bytes_to_read, os.POSIX_FADV_DONTNEED)
+            return hasher, len(data)
+        except OSError:
             return None
+        finally:
+            os.close(fd)
 
     @staticmethod
     def compute_partial_hash(path: str, bytes_to_read: int = 1024 * 1024) -> str | None:
@@ -42,13 +126,15 @@ class DuplicateDetector:
         Returns:
             Hex digest, or None if file not accessible
         """
+        prefix = DuplicateDetector._hash_prefix(path, bytes_to_read)
+        return prefix[0].hexdigest() if prefix is not None else None
+
+    @staticmethod
+    def _file_size(path: str) -> int | None:
+        """Return the size of a file on disk, or None if it is not accessible."""
         try:
-            hasher = hashlib.sha256()
-            with open(path, "rb") as f:
-                data = f.read(bytes_to_read)
-                hasher.update(data)
-            return hasher.hexdigest()
-        except (OSError, FileNotFoundError):
+            return os.stat(path).st_size
+        except OSError:
             return None
 
     def find_by_metadata(self, songs: Iterator[Song]) -> dict[str, list[Song]]:
@@ -60,16 +146,12 @@ class DuplicateDetector:
         Returns:
             Dict mapping metadata key to list of songs with same key
         """
-        groups: dict[str, list[Song]] = defaultdict(list)
-
-        for song in songs:
-            if song.tags and song.tags.author and song.tags.title:
-                # Normalize: lowercase, strip whitespace
-                key = f"{song.tags.author.lower().strip()}|{song.tags.title.lower().strip()}"
-                groups[key].append(song)
-
-        # Filter to only duplicates (more than one entry)
-        return {k: v for k, v in groups.items() if len(v) > 1}
+        return _repeated_groups(
+            # Normalize: lowercase, strip whitespace
+            (f"{tags.author.lower().strip()}|{tags.title.lower().strip()}", song)
+            for song in songs
+            if (tags := song.tags) and tags.author and tags.title
+        )
 
     def find_by_filename(self, songs: Iterator[Song]) -> dict[str, list[Song]]:
         """Find potential duplicates by filename (ignoring path).
@@ -80,13 +162,8 @@ class DuplicateDetector:
         Returns:
             Dict mapping filename to list of songs with same filename
         """
-        groups: dict[str, list[Song]] = defaultdict(list)
-
-        for song in songs:
-            filename = Path(song.file_path).name.lower()
-            groups[filename].append(song)
-
-        return {k: v for k, v in groups.items() if len(v) > 1}
+        # os.path.basename avoids building a Path object per song
+        return _repeated_groups((os.path.basename(song.file_path).lower(), song) for song in songs)
 
     def find_by_size(self, songs: Iterator[Song]) -> dict[int, list[Song]]:
         """Find potential duplicates by file size.
@@ -97,26 +174,26 @@ class DuplicateDetector:
         Returns:
             Dict mapping file size to list of songs with same size
         """
-        groups: dict[int, list[Song]] = defaultdict(list)
-
-        for song in songs:
-            if song.file_size:
-                groups[song.file_size].append(song)
-
-        return {k: v for k, v in groups.items() if len(v) > 1}
+        return _repeated_groups((song.file_size, song) for song in songs if song.file_size)
 
     def find_by_hash(
         self,
         songs: list[Song],
         use_partial: bool = True,
         verify_full: bool = True,
+        max_workers: int | None = None,
     ) -> list[list[Song]]:
         """Find exact duplicates by file hash.
 
+        Files are hashed on a thread pool: reads are independent per file
+        and hashing releases the GIL, so the pool keeps several reads in
+        flight at once. Use ``max_workers=1`` or 2 on spinning disks.
+
         Args:
             songs: List of Song objects
             use_partial: Use partial hash for initial grouping
             verify_full: Verify with full hash
+            max_workers: Number of worker threads (default: 2x CPU count, max 32)
 
         Returns:
             List of duplicate groups (each group is a list of duplicate songs)
@@ -124,49 +201,82 @@ class DuplicateDetector:
         # First, group by file size (quick filter)
         by_size = self.find_by_size(iter(songs))
 
-        # Then hash files with same size
-        duplicates = []
+        # Only files that may exist locally are worth opening
+        candidates = [
+            song
+            for size_group in by_size.values()
+            for song in size_group
+            if not song.is_windows_path and not song.is_netsearch
+        ]
+        if len(candidates) < 2:
+            return []
 
-        for size_group in by_size.values():
-            if len(size_group) < 2:
-                continue
-
-            # Compute hashes for files that exist
-            hash_groups: dict[str, list[Song]] = defaultdict(list)
-
-            for song in size_group:
-                if song.is_windows_path or song.is_netsearch:
-                    continue
-
-                if use_partial:
-                    file_hash = self.compute_partial_hash(song.file_path)
-                else:
-                    file_hash = self.compute_file_hash(song.file_path)
-
-                if file_hash:
-                    hash_groups[file_hash].append(song)
-
-            # Verify partial hash matches with full hash
-            for group in hash_groups.values():
-                if len(group) < 2:
-                    continue
+        workers = max_workers or min(32, (os.cpu_count() or 1) * 2)
 
+        duplicates = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Regroup by the size on disk: FileSize in the database can be
+            # stale, and missing files drop out here without an open()
+            by_disk_size: dict[int, list[Song]] = defaultdict(list)
+            sizes = executor.map(self._file_size, [song.file_path for song in candidates])
+            for song, size in zip(candidates, sizes):
+                if size is not None:
+                    by_disk_size[size].append(song)
+            size_groups = [group for group in by_disk_size.values() if len(group) > 1]
+
+            # Hash every remaining candidate in one batch, then regroup per size.
+            # Partial hashes keep their hasher state so a full-hash
+            # verification can continue after the prefix instead of
+            # re-reading it.
+            to_hash = [song for size_group in size_groups for song in size_group]
+            paths = [song.file_path for song in to_hash]
+            if use_partial:
+                prefixes = list(executor.map(self._hash_prefix, paths))
+                hashes = [p[0].hexdigest() if p is not None else None for p in prefixes]
+            else:
+                prefixes = [None] * len(to_hash)
+                hashes = list(executor.map(self.compute_file_hash, paths))
+
+            entries = iter(zip(hashes, prefixes))
+            groups: list[list[tuple[Song, _Prefix | None]]] = []
+            for size_group in size_groups:
+                hash_groups: dict[str, list[tuple[Song, _Prefix | None]]] = defaultdict(list)
+                for song in size_group:
+                    file_hash, prefix = next(entries)
+                    if file_hash:
+                        hash_groups[file_hash].append((song, prefix))
+                groups.extend(group for group in hash_groups.values() if len(group) > 1)
+
+            # Verify partial hash matches with full hash.
+            # Only do expensive full-hash verification for groups of 3+
+            # where partial hash collisions are more likely.
+            # Groups of 2 matching on size + 1MB partial hash are
+            # near-certainly true duplicates.
+            to_verify = []
+            for group in groups:
                 if use_partial and verify_full and len(group) > 2:
-                    # Only do expensive full-hash verification for groups of 3+
-                    # where partial hash collisions are more likely.
-                    # Groups of 2 matching on size + 1MB partial hash are
-                    # near-certainly true duplicates.
+                    to_verify.append(group)
+                else:
+                    duplicates.append([song for song, _ in group])
+
+            if to_verify:
+                verify_entries = [entry for group in to_verify for entry in group]
+                full_hashes = iter(
+                    executor.map(
+                        lambda entry: self.compute_file_hash(entry[0].file_path, resume=entry[1]),
+                        verify_entries,
+                    )
+                )
+                for group in to_verify:
                     full_hash_groups: dict[str, list[Song]] = defaultdict(list)
-                    for song in group:
-                        full_hash = self.compute_file_hash(song.file_path)
+                    for song, _ in group:
+                        full_hash = next(full_hashes)
                         if full_hash:
                             full_hash_groups[full_hash].append(song)
 
                     for full_group in full_hash_groups.values():
                         if len(full_group) > 1:
                             duplicates.append(full_group)
-                else:
-                    duplicates.append(group)
 
         return duplicates
 
@@ -229,7 +339,7 @@ class DuplicateDetector:
             # Sort by preference
             def sort_key(song: Song) -> tuple:
                 # Prefer: existing > missing, local > external, has metadata > no metadata
-                exists = Path(song.file_path).exists() if not song.is_windows_path else False
+                exists = os.path.exists(song.file_path) if not song.is_windows_path else False
                 is_local = song.file_path.startswith("/Users/")
                 has_metadata = song.tags is not None and song.tags.author is not None
 
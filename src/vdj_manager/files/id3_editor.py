@@ -3,13 +3,33 @@
 Supports MP3 (ID3), M4A/MP4, FLAC, OGG Vorbis, WAV, and AIFF.
 """
 
+import json
 import logging
+import os
+from collections import deque
+from collections.abc import Generator, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from vdj_manager.core.models import Song
 
+if TYPE_CHECKING:
+    from vdj_manager.analysis.analysis_cache import AnalysisCache
+
 logger = logging.getLogger(__name__)
 
+# AnalysisCache type under which parsed tag dicts are stored (as JSON)
+TAG_CACHE_TYPE = "file_tags"
+
+# Parsed tags as returned by read_tags()
+_Tags = dict[str, str | None]
+
+# Keep batched cache lookups under SQLite's bound-parameter limit
+_CACHE_BATCH_SIZE = 900
+
 # Fields supported for read/write
 SUPPORTED_FIELDS = [
     "title",
@@ -38,6 +58,68 @@ _ID3_FRAMES = {
     # comment uses COMM frame (special handling)
 }
 
+
+@lru_cache(maxsize=1)
+def _id3_write_table() -> dict:
+    """Map fields to (frame_id, frame class) for writing.
+
+    Built once on first write so mutagen stays a lazy import.
+    """
+    from mutagen import id3
+
+    return {field: (frame_id, getattr(id3, frame_id)) for field, frame_id in _ID3_FRAMES.items()}
+
+
+# ID3v2.3 date frames that mutagen folds into TDRC, and the ID3v2.2 names
+# of the frames we read (mutagen upgrades those to their v2.4 classes)
+_ID3_V23_DATE_FRAMES = ("TYER", "TDAT", "TIME")
+_ID3_V22_FRAMES = (
+    "TT2",
+    "TP1",
+    "TAL",
+    "TCO",
+    "TYE",
+    "TDA",
+    "TIM",
+    "TRK",
+    "TBP",
+    "TKE",
+    "TCM",
+    "COM",
+)
+
+
+@lru_cache(maxsize=1)
+def _id3_read_frames() -> dict:
+    """Frame classes for ``ID3(known_frames=...)`` when reading tags.
+
+    Frames missing from this table (APIC cover art, GEOB, PRIV, ...) are
+    kept as raw bytes instead of being parsed into frame objects.
+    """
+    from mutagen.id3 import Frames, Frames_2_2
+
+    frames = {frame_id: Frames[frame_id] for frame_id in _ID3_FRAMES.values()}
+    frames["COMM"] = Frames["COMM"]
+    frames.update((frame_id, Frames[frame_id]) for frame_id in _ID3_V23_DATE_FRAMES)
+    frames.update((frame_id, Frames_2_2[frame_id]) for frame_id in _ID3_V22_FRAMES)
+    return frames
+
+
+def _load_id3_for_reading(file_path: str):
+    """Load just the ID3 tag of an MP3, with only the frames we read parsed.
+
+    Unlike ``mutagen.File`` this skips probing the MPEG stream, and cover
+    art (often several MB of APIC data) is never decoded into frames.
+    A file without an ID3 header gives an empty tag.
+    """
+    from mutagen.id3 import ID3, ID3NoHeaderError
+
+    try:
+        return ID3(file_path, known_frames=_id3_read_frames())
+    except ID3NoHeaderError:
+        return ID3()
+
+
 # MP4/M4A tag mapping
 _MP4_KEYS = {
     "title": "\xa9nam",
@@ -71,8 +153,16 @@ class FileTagEditor:
     """Read and write embedded tags in audio files.
 
     Uses mutagen (lazy-imported) to support MP3, M4A, FLAC, OGG, WAV, AIFF.
+
+    Args:
+        cache: Optional AnalysisCache for parsed tags. Entries are keyed by
+               path and invalidated when the file's mtime or size changes,
+               so unchanged files skip mutagen on later runs.
     """
 
+    def __init__(self, cache: "AnalysisCache | None" = None) -> None:
+        self.cache = cache
+
     def read_tags(self, file_path: str) -> dict[str, str | None]:
         """Read tags from an audio file.
 
@@ -82,23 +172,37 @@ class FileTagEditor:
         Returns:
             Dict with SUPPORTED_FIELDS keys, values are strings or None.
         """
+        cached = self._load_from_cache([file_path]).get(file_path)
+        if cached is not None:
+            return json.loads(cached)
+
+        tags = self._read_uncached(file_path)
+        if tags is None:
+            return {f: None for f in SUPPORTED_FIELDS}
+        self._store_in_cache([(file_path, tags)])
+        return tags
+
+    def _read_uncached(self, file_path: str) -> _Tags | None:
+        """Parse tags with mutagen, or return None if the file can't be opened."""
         result: dict[str, str | None] = {f: None for f in SUPPORTED_FIELDS}
+        ext = Path(file_path).suffix.lower()
 
         try:
-            from mutagen import File as MutagenFile
+            if ext == ".mp3":
+                audio = _load_id3_for_reading(file_path)
+            else:
+                from mutagen import File as MutagenFile
 
-            audio = MutagenFile(file_path)
+                audio = MutagenFile(file_path)
         except Exception:
             logger.warning("Failed to open %s for tag reading", file_path, exc_info=True)
-            return result
+            return None
 
         if audio is None:
             return result
 
-        ext = Path(file_path).suffix.lower()
-
         if ext == ".mp3":
-            result = self._read_id3(audio, result)
+            result = self._read_id3_frames(audio, result)
         elif ext in (".m4a", ".mp4", ".aac"):
             result = self._read_mp4(audio, result)
         elif ext in (".flac", ".ogg"):
@@ -109,6 +213,103 @@ class FileTagEditor:
 
         return result
 
+    def _load_from_cache(self, file_paths: list[str]) -> dict[str, str]:
+        """Look up cached tags (as JSON) for the given paths, if there is a cache.
+
+        Like writes, lookups are best-effort: a failing cache is logged and
+        treated as all misses, so the files are parsed instead.
+        """
+        if self.cache is None:
+            return {}
+        try:
+            return self.cache.get_batch(file_paths, TAG_CACHE_TYPE)
+        except Exception:
+            logger.warning("Failed to look up cached tags", exc_info=True)
+            return {}
+
+    def _store_in_cache(self, parsed: list[tuple[str, _Tags]]) -> None:
+        """Write parsed tags to the cache, if any, in one transaction.
+
+        Caching is best-effort: a failed write (e.g. "database is locked")
+        is logged and the parsed tags are still returned to the caller.
+        """
+        if self.cache is None or not parsed:
+            return
+        try:
+            self.cache.put_batch(
+                [(path, json.dumps(tags)) for path, tags in parsed], TAG_CACHE_TYPE
+            )
+        except Exception:
+            logger.warning("Failed to cache tags for %d files", len(parsed), exc_info=True)
+
+    def read_tags_bulk(
+        self, file_paths: Iterable[str], max_workers: int | None = None
+    ) -> Generator[tuple[str, dict[str, str | None]], None, None]:
+        """Read tags from many files concurrently, in input order.
+
+        Tag reading is dominated by open/seek/read latency (especially on
+        network shares), so a thread pool keeps several files in flight.
+        Paths are consumed in batches: each batch is looked up in the cache
+        (if any) and its misses are submitted before the previous batch's
+        results are yielded. A lazy source such as
+        ``DirectoryScanner.scan_directory`` therefore keeps walking while
+        earlier files are parsed, and only about two batches are held at once.
+        Newly parsed tags are written back from this thread, one
+        transaction per batch, rather than once per file from the workers.
+
+        Args:
+            file_paths: Paths to the audio files.
+            max_workers: Number of worker threads (default: 2x CPU count, max 32).
+
+        Yields:
+            Tuples of (file_path, tags) where tags is as from read_tags();
+            files that fail to parse give all-None tags.
+        """
+        workers = max_workers or min(32, (os.cpu_count() or 1) * 2)
+        paths = iter(file_paths)
+        parsed: list[tuple[str, _Tags]] = []
+
+        def resolve(path: str, tags: _Tags | Future[_Tags | None]) -> tuple[str, _Tags]:
+            if not isinstance(tags, Future):
+                return path, tags
+            read = tags.result()
+            if read is None:
+                return path, {f: None for f in SUPPORTED_FIELDS}
+            parsed.append((path, read))
+            return path, read
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: deque[tuple[str, _Tags | Future[_Tags | None]]] = deque()
+            try:
+                while batch := list(islice(paths, _CACHE_BATCH_SIZE)):
+                    cached = self._load_from_cache(batch)
+                    for path in batch:
+                        hit = cached.get(path)
+                        if hit is not None:
+                            pending.append((path, json.loads(hit)))
+                        else:
+                            pending.append((path, executor.submit(self._read_or_none, path)))
+
+                    # Keep the batch just submitted in flight while the
+                    # caller works through the one before it
+                    while len(pending) > len(batch):
+                        yield resolve(*pending.popleft())
+                    self._store_in_cache(parsed)
+                    parsed.clear()
+
+                while pending:
+                    yield resolve(*pending.popleft())
+            finally:
+                self._store_in_cache(parsed)
+
+    def _read_or_none(self, file_path: str) -> _Tags | None:
+        """Uncached read that never raises, so one bad file can't end a bulk read."""
+        try:
+            return self._read_uncached(file_path)
+        except Exception:
+            logger.warning("Failed to read tags from %s", file_path, exc_info=True)
+            return None
+
     def write_tags(self, file_path: str, tags: dict[str, str | None]) -> bool:
         """Write tags to an audio file.
 
@@ -146,6 +347,9 @@ class FileTagEditor:
                 return False
 
             audio.save()
+            if self.cache is not None:
+                # mtime alone can miss a rewrite on coarse-grained filesystems
+                self.cache.invalidate(file_path, TAG_CACHE_TYPE)
             return True
         except Exception:
             logger.error("Failed to write tags to %s", file_path, exc_info=True)
@@ -158,7 +362,10 @@ class FileTagEditor:
         tags = getattr(audio, "tags", None)
         if tags is None:
             return result
+        return self._read_id3_frames(tags, result)
 
+    def _read_id3_frames(self, tags, result: dict) -> dict:
+        """Read fields from a mapping of ID3 frames."""
         for field, frame_id in _ID3_FRAMES.items():
             frame = tags.get(frame_id)
             if frame is not None:
@@ -178,7 +385,7 @@ class FileTagEditor:
 
     def _write_id3(self, audio, tags: dict) -> None:
         """Write ID3 tags to an MP3/WAV/AIFF file."""
-        from mutagen.id3 import COMM, TALB, TBPM, TCOM, TCON, TDRC, TIT2, TKEY, TPE1, TRCK
+        from mutagen.id3 import COMM
 
         id3_tags = audio.tags
         if id3_tags is None:
@@ -186,33 +393,25 @@ class FileTagEditor:
             audio.add_tags()
             id3_tags = audio.tags
 
-        frame_classes = {
-            "title": TIT2,
-            "artist": TPE1,
-            "album": TALB,
-            "genre": TCON,
-            "year": TDRC,
-            "track_number": TRCK,
-            "bpm": TBPM,
-            "key": TKEY,
-            "composer": TCOM,
-        }
+        write_table = _id3_write_table()
+        setall = id3_tags.setall
+        delall = id3_tags.delall
 
         for field, value in tags.items():
             if field == "comment":
                 if value:
-                    id3_tags.setall("COMM", [COMM(encoding=3, lang="eng", desc="", text=[value])])
+                    setall("COMM", [COMM(encoding=3, lang="eng", desc="", text=[value])])
                 else:
-                    id3_tags.delall("COMM")
+                    delall("COMM")
                 continue
 
-            frame_id = _ID3_FRAMES.get(field)
-            cls = frame_classes.get(field)
-            if frame_id and cls:
+            entry = write_table.get(field)
+            if entry is not None:
+                frame_id, cls = entry
                 if value:
-                    id3_tags.setall(frame_id, [cls(encoding=3, text=[value])])
+                    setall(frame_id, [cls(encoding=3, text=[value])])
                 elif frame_id in id3_tags:
-                    id3_tags.delall(frame_id)
+                    delall(frame_id)
 
     # --- MP4/M4A ---
 
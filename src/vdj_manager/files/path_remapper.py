@@ -1,5 +1,6 @@
 """Path remapping utilities for Windows to macOS conversion."""
 
+import re
 from collections import defaultdict
 from collections.abc import Iterator
 from pathlib import Path
@@ -7,13 +8,18 @@ from pathlib import Path
 from ..config import DEFAULT_PATH_MAPPINGS
 from ..core.models import Song
 
+# Example paths reported per prefix by detect_mappable_paths
+_MAX_EXAMPLES = 5
+
 
 class PathRemapper:
     """Handles remapping Windows paths to macOS paths."""
 
     def __init__(self, mappings: dict[str, str] | None = None):
         self.mappings = mappings or DEFAULT_PATH_MAPPINGS.copy()
-        self._sorted_prefixes: list[str] | None = None
+        # Anchored alternation of all prefixes, longest first. Built lazily,
+        # invalidated on changes.
+        self._prefix_re: re.Pattern[str] | None = None
 
     def add_mapping(self, windows_prefix: str, mac_prefix: str) -> None:
         """Add a path mapping.
@@ -25,7 +31,7 @@ class PathRemapper:
         # Normalize to forward slashes
         windows_prefix = windows_prefix.replace("\\", "/")
         self.mappings[windows_prefix] = mac_prefix
-        self._sorted_prefixes = None  # Invalidate cache
+        self._prefix_re = None  # Invalidate cache
 
     def remove_mapping(self, windows_prefix: str) -> bool:
         """Remove a path mapping.
@@ -39,7 +45,7 @@ class PathRemapper:
         windows_prefix = windows_prefix.replace("\\", "/")
         if windows_prefix in self.mappings:
             del self.mappings[windows_prefix]
-            self._sorted_prefixes = None  # Invalidate cache
+            self._prefix_re = None  # Invalidate cache
             return True
         return False
 
@@ -55,17 +61,25 @@ class PathRemapper:
         # Normalize backslashes
         normalized = path.replace("\\", "/")
 
-        # Build sorted prefix cache on first use (invalidated on mapping changes)
-        if self._sorted_prefixes is None:
-            self._sorted_prefixes = sorted(self.mappings.keys(), key=len, reverse=True)
+        # Compile prefix pattern on first use (invalidated on mapping changes)
+        if self._prefix_re is None:
+            self._prefix_re = self._compile_prefixes(self.mappings)
+
+        match = self._prefix_re.match(normalized)
+        if match is None:
+            return None
+        return self.mappings[match.group()] + normalized[match.end() :]
 
-        # Try each mapping, longest prefix first
-        for win_prefix in self._sorted_prefixes:
-            if normalized.startswith(win_prefix):
-                mac_prefix = self.mappings[win_prefix]
-                return mac_prefix + normalized[len(win_prefix) :]
+    @staticmethod
+    def _compile_prefixes(mappings: dict[str, str]) -> re.Pattern[str]:
+        """Compile mapping prefixes into one pattern matched at the path start.
 
-        return None
+        Alternatives are tried in order, so sorting longest first keeps
+        longest-prefix-wins semantics.
+        """
+        if not mappings:
+            return re.compile(r"(?!)")  # Never matches
+        return re.compile("|".join(map(re.escape, sorted(mappings, key=len, reverse=True))))
 
     def can_remap(self, path: str) -> bool:
         """Check if a path can be remapped."""
@@ -86,20 +100,24 @@ class PathRemapper:
             if not song.is_windows_path:
                 continue
 
-            path = song.file_path.replace("\\", "/")
-
-            # Extract drive letter and first directory
-            parts = path.split("/")
-            if len(parts) >= 2:
-                # e.g., "D:/Main/" or "E:/"
-                prefix = f"{parts[0]}/"
-                if len(parts) >= 2 and parts[1]:
-                    prefix = f"{parts[0]}/{parts[1]}/"
-
+            prefix = self._windows_prefix(song.file_path)
+            if prefix is not None:
                 prefixes[prefix].append(song.file_path)
 
         return dict(prefixes)
 
+    @staticmethod
+    def _windows_prefix(file_path: str) -> str | None:
+        """Return the drive and first directory of a Windows path, e.g. "D:/Main/"."""
+        # Extract drive letter and first directory
+        parts = file_path.replace("\\", "/").split("/")
+        if len(parts) < 2:
+            return None
+        # e.g., "D:/Main/" or "E:/"
+        if parts[1]:
+            return f"{parts[0]}/{parts[1]}/"
+        return f"{parts[0]}/"
+
     def detect_mappable_paths(self, songs: Iterator[Song]) -> dict:
         """Analyze Windows paths and suggest mappings.
 
@@ -109,8 +127,19 @@ class PathRemapper:
         Returns:
             Dict with analysis results
         """
-        songs_list = list(songs)
-        prefixes = self.detect_windows_prefixes(iter(songs_list))
+        # One pass that keeps a count and a few examples per prefix, rather
+        # than every path as detect_windows_prefixes() does
+        counts: dict[str, int] = defaultdict(int)
+        prefixes: dict[str, list[str]] = defaultdict(list)
+        for song in songs:
+            if not song.is_windows_path:
+                continue
+
+            prefix = self._windows_prefix(song.file_path)
+            if prefix is not None:
+                counts[prefix] += 1
+                if len(examples := prefixes[prefix]) < _MAX_EXAMPLES:
+                    examples.append(song.file_path)
 
         result = {
             "total_windows_paths": 0,
@@ -120,7 +149,7 @@ class PathRemapper:
         }
 
         for prefix, examples in prefixes.items():
-            count = len(examples)
+            count = counts[prefix]
             result["total_windows_paths"] += count  # type: ignore[operator]
 
             # Check if we have a mapping for this prefix
@@ -143,7 +172,7 @@ class PathRemapper:
                 "sample_original": examples[0] if examples else None,
                 "sample_mapped": sample_mapped,
                 "sample_exists": sample_exists,
-                "examples": examples[:5],  # First 5 examples
+                "examples": examples,
             }
 
             if has_mapping:
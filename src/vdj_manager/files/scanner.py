@@ -1,15 +1,61 @@
 """Directory scanning utilities for finding audio files."""
 
-from collections.abc import Iterator
+import os
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from ..config import AUDIO_EXTENSIONS
 
 
+def find_existing_paths(file_paths: Iterable[str]) -> set[str]:
+    """Return the subset of file paths that exist on disk.
+
+    Paths are grouped by parent directory and each directory is listed once
+    with ``os.scandir``, replacing one stat() per file with one listing per
+    directory. Only absolute paths are grouped; anything else is checked
+    with ``os.path.exists``. Symlinks are left out of the listing, and names missing from
+    it are re-checked with ``os.path.exists``, so broken links and
+    case-insensitive or normalizing filesystems (APFS, HFS+) give the same
+    answer as a direct stat.
+
+    Args:
+        file_paths: File path strings to check
+
+    Returns:
+        Set of the given paths that exist
+    """
+    existing: set[str] = set()
+    by_dir: dict[str, list[str]] = {}
+    for file_path in file_paths:
+        if os.path.isabs(file_path):
+            by_dir.setdefault(os.path.dirname(file_path), []).append(file_path)
+        elif os.path.exists(file_path):
+            # Relative or drive-relative ("C:track.mp3" on POSIX): checked
+            # directly rather than matched against a listing of the CWD
+            existing.add(file_path)
+
+    for directory, paths in by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                # is_symlink() comes from the listing's d_type; links are
+                # resolved by the os.path.exists fallback below
+                names = {entry.name for entry in entries if not entry.is_symlink()}
+        except (FileNotFoundError, NotADirectoryError):
+            continue  # Parent is gone, so none of its files exist
+        except OSError:
+            names = set()  # Unlistable directory: fall back to per-file checks
+
+        for file_path in paths:
+            if os.path.basename(file_path) in names or os.path.exists(file_path):
+                existing.add(file_path)
+
+    return existing
+
+
 class DirectoryScanner:
     """Scans directories for audio files."""
 
-    def __init__(self, extensions: set[str] | None = None):
+    def __init__(self, extensions: set[str] | frozenset[str] | None = None):
         self.extensions = extensions or AUDIO_EXTENSIONS
 
     def scan_directory(self, directory: Path, recursive: bool = True) -> Iterator[Path]:
@@ -22,20 +68,50 @@ class DirectoryScanner:
         Yields:
             Paths to audio files found
         """
+        for entry in self._iter_entries(directory, recursive):
+            yield Path(entry.path)
+
+    def _iter_entries(self, directory: Path, recursive: bool) -> Iterator[os.DirEntry[str]]:
+        """Yield directory entries for the audio files under a directory.
+
+        Entries keep the metadata from the listing, so callers that need
+        sizes use ``entry.stat()`` rather than a separate stat of the path.
+        """
         if not directory.exists():
             raise FileNotFoundError(f"Directory not found: {directory}")
 
         if not directory.is_dir():
             raise ValueError(f"Path is not a directory: {directory}")
 
-        if recursive:
-            for path in directory.rglob("*"):
-                if path.is_file() and path.suffix.lower() in self.extensions:
-                    yield path
-        else:
-            for path in directory.iterdir():
-                if path.is_file() and path.suffix.lower() in self.extensions:
-                    yield path
+        # Walk with os.scandir: DirEntry type checks use the directory
+        # listing instead of a stat() per entry, and callers only build a
+        # Path (or stat) for matching files. Directories are visited
+        # depth-first in listing order and symlinked directories are not
+        # followed, as with rglob.
+        extensions = self.extensions
+        top = str(directory)
+        stack = [top]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = os.scandir(current)
+            except OSError:
+                if current == top:
+                    raise
+                continue  # Unreadable or vanished subdirectory
+
+            subdirs = []
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        name = entry.name
+                        dot = name.rfind(".")
+                        if dot > 0 and name[dot:].lower() in extensions:
+                            yield entry
+            stack.extend(reversed(subdirs))
 
     def scan_with_metadata(self, directory: Path, recursive: bool = True) -> Iterator[dict]:
         """Scan directory and return file metadata.
@@ -47,16 +123,21 @@ class DirectoryScanner:
         Yields:
             Dicts with file path and metadata
         """
-        for path in self.scan_directory(directory, recursive):
-            stat = path.stat()
-            yield {
-                "path": path,
-                "file_path": str(path),
-                "file_size": stat.st_size,
-                "modified": stat.st_mtime,
-                "extension": path.suffix.lower(),
-                "name": path.stem,
-            }
+        for entry in self._iter_entries(directory, recursive):
+            path = Path(entry.path)
+            yield self._file_info(path, str(path), entry.stat())
+
+    @staticmethod
+    def _file_info(path: Path, file_path: str, stat: os.stat_result) -> dict:
+        """Build the metadata dict for a single scanned file."""
+        return {
+            "path": path,
+            "file_path": file_path,
+            "file_size": stat.st_size,
+            "modified": stat.st_mtime,
+            "extension": path.suffix.lower(),
+            "name": path.stem,
+        }
 
     def count_files(self, directory: Path, recursive: bool = True) -> dict:
         """Count audio files by extension.
@@ -99,9 +180,13 @@ class DirectoryScanner:
         """
         new_files = []
 
-        for file_info in self.scan_with_metadata(directory, recursive):
-            if file_info["file_path"] not in existing_paths:
-                new_files.append(file_info)
+        # Check membership on the path string before touching the file, so
+        # entries already in the database never cost a stat() call.
+        for entry in self._iter_entries(directory, recursive):
+            path = Path(entry.path)
+            file_path = str(path)
+            if file_path not in existing_paths:
+                new_files.append(self._file_info(path, file_path, entry.stat()))
 
         return new_files
 
@@ -1,11 +1,13 @@
 """File validation utilities."""
 
+import os
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from ..config import AUDIO_EXTENSIONS, NON_AUDIO_EXTENSIONS
-from ..core.models import Song
+from ..core.models import Song, file_extension
+from .scanner import find_existing_paths
 
 
 class FileValidator:
@@ -14,19 +16,17 @@ class FileValidator:
     @staticmethod
     def _get_extension(path: str) -> str:
         """Extract lowercase file extension from a path."""
-        return Path(path).suffix.lower()
+        return file_extension(path)
 
     @staticmethod
     def is_audio_file(path: str) -> bool:
         """Check if a file path has an audio extension."""
-        ext = Path(path).suffix.lower()
-        return ext in AUDIO_EXTENSIONS
+        return file_extension(path) in AUDIO_EXTENSIONS
 
     @staticmethod
     def is_non_audio_file(path: str) -> bool:
         """Check if a file path has a known non-audio extension."""
-        ext = Path(path).suffix.lower()
-        return ext in NON_AUDIO_EXTENSIONS
+        return file_extension(path) in NON_AUDIO_EXTENSIONS
 
     @staticmethod
     def _is_audio_ext(ext: str) -> bool:
@@ -38,13 +38,18 @@ class FileValidator:
         """Check if an extension is a non-audio extension (pre-extracted)."""
         return ext in NON_AUDIO_EXTENSIONS
 
+    @staticmethod
+    def _is_local_path(path: str) -> bool:
+        """Check that a path could exist locally (not a drive letter or URL)."""
+        if len(path) > 1 and path[1] == ":":
+            return False
+        return "://" not in path
+
     @staticmethod
     def file_exists(path: str) -> bool:
         """Check if a file exists on disk."""
         # Skip Windows paths and network paths
-        if len(path) > 1 and path[1] == ":":
-            return False
-        if path.startswith("netsearch://") or "://" in path:
+        if not FileValidator._is_local_path(path):
             return False
         return Path(path).exists()
 
@@ -74,27 +79,37 @@ class FileValidator:
             "extension": ext,
         }
 
-        # Only check existence for local paths
-        if not song.is_windows_path and not song.is_netsearch:
-            result["exists"] = self.file_exists(song.file_path)
+        # Only check existence for local paths; one stat answers both
+        # existence and size
+        if (
+            not song.is_windows_path
+            and not song.is_netsearch
+            and self._is_local_path(song.file_path)
+        ):
+            try:
+                actual_size = os.stat(song.file_path).st_size
+            except OSError:
+                pass
+            else:
+                result["exists"] = True
 
-            # Check if file size matches
-            if result["exists"] and song.file_size:
-                actual_size = self.get_file_size(song.file_path)
-                if actual_size:
+                # Check if file size matches
+                if song.file_size and actual_size:
                     result["size_match"] = actual_size == song.file_size
 
         return result
 
     def find_missing_files(self, songs: Iterator[Song]) -> list[Song]:
-        """Find songs with missing files."""
-        missing = []
-        for song in songs:
-            if song.is_windows_path or song.is_netsearch:
-                continue
-            if not self.file_exists(song.file_path):
-                missing.append(song)
-        return missing
+        """Find songs with missing files.
+
+        Existence is checked with one directory listing per parent
+        directory (see ``find_existing_paths``) rather than a stat per song.
+        """
+        local = [song for song in songs if not song.is_windows_path and not song.is_netsearch]
+        existing = find_existing_paths(
+            song.file_path for song in local if self._is_local_path(song.file_path)
+        )
+        return [song for song in local if song.file_path not in existing]
 
     def find_non_audio_entries(self, songs: Iterator[Song]) -> list[Song]:
         """Find songs that are not audio files."""
@@ -102,10 +117,8 @@ class FileValidator:
         for song in songs:
             if song.is_netsearch:
                 continue
-            if self.is_non_audio_file(song.file_path):
-                non_audio.append(song)
-            elif not self.is_audio_file(song.file_path):
-                # Unknown extension, might be non-audio
+            # Known non-audio, or an unknown extension that might be non-audio
+            if file_extension(song.file_path) not in AUDIO_EXTENSIONS:
                 non_audio.append(song)
         return non_audio
 
@@ -128,26 +141,36 @@ class FileValidator:
             "unknown": [],
         }
         extensions: dict[str, int] = {}
+        audio: list[Song] = []
 
         for song in songs:
+            # Extract the extension once and reuse it for every check
+            ext = file_extension(song.file_path)
             if collect_extensions:
-                ext = self._get_extension(song.file_path) or "(none)"
-                extensions[ext] = extensions.get(ext, 0) + 1
+                key = ext or "(none)"
+                extensions[key] = extensions.get(key, 0) + 1
 
             if song.is_netsearch:
                 categories["netsearch"].append(song)
             elif song.is_windows_path:
                 categories["windows_paths"].append(song)
-            elif self.is_non_audio_file(song.file_path):
+            elif ext in NON_AUDIO_EXTENSIONS:
                 categories["non_audio"].append(song)
-            elif self.is_audio_file(song.file_path):
-                if self.file_exists(song.file_path):
-                    categories["audio_exists"].append(song)
-                else:
-                    categories["audio_missing"].append(song)
+            elif ext in AUDIO_EXTENSIONS:
+                audio.append(song)
             else:
                 categories["unknown"].append(song)
 
+        # Check all audio entries in one pass of directory listings
+        existing = find_existing_paths(
+            song.file_path for song in audio if self._is_local_path(song.file_path)
+        )
+        for song in audio:
+            if song.file_path in existing:
+                categories["audio_exists"].append(song)
+            else:
+                categories["audio_missing"].append(song)
+
         if collect_extensions:
             categories["extensions"] = extensions
 
@@ -646,7 +646,9 @@ class AnalysisPanel(QWidget):
         try:
             from vdj_manager.core.backup import BackupManager
 
-            BackupManager().create_backup(self._database.db_path, label="pre_energy")
+            BackupManager().create_backup(
+                self._database.db_path, label="pre_energy", skip_if_unchanged=True
+            )
         except Exception:
             logger.warning("Auto-backup failed before analysis", exc_info=True)
 
@@ -773,7 +775,9 @@ class AnalysisPanel(QWidget):
         try:
             from vdj_manager.core.backup import BackupManager
 
-            BackupManager().create_backup(self._database.db_path, label="pre_mik")
+            BackupManager().create_backup(
+                self._database.db_path, label="pre_mik", skip_if_unchanged=True
+            )
         except Exception:
             logger.warning("Auto-backup failed before analysis", exc_info=True)
 
@@ -846,7 +850,9 @@ class AnalysisPanel(QWidget):
         try:
             from vdj_manager.core.backup import BackupManager
 
-            BackupManager().create_backup(self._database.db_path, label="pre_mood")
+            BackupManager().create_backup(
+                self._database.db_path, label="pre_mood", skip_if_unchanged=True
+            )
         except Exception:
             logger.warning("Auto-backup failed before analysis", exc_info=True)
 
@@ -916,7 +922,9 @@ class AnalysisPanel(QWidget):
         try:
             from vdj_manager.core.backup import BackupManager
 
-            BackupManager().create_backup(self._database.db_path, label="pre_mood_reanalyze")
+            BackupManager().create_backup(
+                self._database.db_path, label="pre_mood_reanalyze", skip_if_unchanged=True
+            )
         except Exception:
             logger.warning("Auto-backup failed before analysis", exc_info=True)
 
@@ -996,7 +1004,9 @@ class AnalysisPanel(QWidget):
         try:
             from vdj_manager.core.backup import BackupManager
 
-            BackupManager().create_backup(self._database.db_path, label="pre_mood_reanalyze_all")
+            BackupManager().create_backup(
+                self._database.db_path, label="pre_mood_reanalyze_all", skip_if_unchanged=True
+            )
         except Exception:
             logger.warning("Auto-backup failed before analysis", exc_info=True)
 
@@ -1097,7 +1107,9 @@ class AnalysisPanel(QWidget):
         try:
             from vdj_manager.core.backup import BackupManager
 
-            BackupManager().create_backup(self._database.db_path, label="pre_genre")
+            BackupManager().create_backup(
+                self._database.db_path, label="pre_genre", skip_if_unchanged=True
+            )
         except Exception:
             logger.warning("Auto-backup failed before analysis", exc_info=True)
 
@@ -1171,7 +1183,9 @@ class AnalysisPanel(QWidget):
         try:
             from vdj_manager.core.backup import BackupManager
 
-            BackupManager().create_backup(self._database.db_path, label="pre_genre_redetect")
+            BackupManager().create_backup(
+                self._database.db_path, label="pre_genre_redetect", skip_if_unchanged=True
+            )
         except Exception:
             logger.warning("Auto-backup failed before analysis", exc_info=True)
 
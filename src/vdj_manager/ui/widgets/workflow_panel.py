@@ -379,7 +379,9 @@ class WorkflowPanel(QWidget):
         try:
             from vdj_manager.core.backup import BackupManager
 
-            BackupManager().create_backup(self._database.db_path, label="pre_workflow")
+            BackupManager().create_backup(
+                self._database.db_path, label="pre_workflow", skip_if_unchanged=True
+            )
         except Exception:
             logger.warning("Auto-backup failed before workflow", exc_info=True)
 
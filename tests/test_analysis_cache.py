@@ -159,6 +159,29 @@ class TestBatchGet:
         assert hits == {}
 
 
+class TestBatchPut:
+    """Tests for put_batch."""
+
+    def test_batch_put_round_trips_and_skips_missing(self, cache, tmp_path):
+        files = []
+        for i in range(3):
+            p = tmp_path / f"song{i}.mp3"
+            p.write_bytes(b"\x00" * 256)
+            files.append(str(p))
+        missing = str(tmp_path / "gone.mp3")
+
+        cache.put_batch([(f, f"v{i}") for i, f in enumerate(files)] + [(missing, "x")], "tags")
+
+        assert cache.get_batch(files + [missing], "tags") == {
+            f: f"v{i}" for i, f in enumerate(files)
+        }
+        assert cache.stats()["count"] == 3
+
+    def test_batch_put_empty_is_noop(self, cache):
+        cache.put_batch([], "tags")
+        assert cache.stats()["count"] == 0
+
+
 class TestClearAndStats:
     """Tests for clear() and stats()."""
 
@@ -1,12 +1,19 @@
 """Tests for backup manager."""
 
+import os
+import shutil
+import tarfile
+import time
 from datetime import datetime
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
+from unittest.mock import patch
 
 import pytest
+from click.testing import CliRunner
 
-from vdj_manager.core.backup import BackupManager
+from vdj_manager.cli import cli
+from vdj_manager.core.backup import BackupManager, _fast_copy
 
 
 @pytest.fixture
@@ -62,10 +69,20 @@ class TestBackupManager:
         assert any("second" in n for n in backup_names)
         assert any("third" in n for n in backup_names)
 
+    def test_list_backups_filters_by_source(self, temp_backup_dir, sample_db_file):
+        """Only .xml files matching the source label are listed."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        unknown = mgr.create_backup(sample_db_file)
+        (temp_backup_dir / "database_local_20240101_000000.xml").write_text("<x/>")
+        (temp_backup_dir / "notes.txt").write_text("ignored")
+        (temp_backup_dir / "subdir.xml").mkdir()
+
+        assert mgr.list_backups(source="unknown") == [unknown]
+        assert len(mgr.list_backups()) == 2
+        assert mgr.total_backup_size == unknown.stat().st_size + 4
+
     def test_get_latest_backup(self, temp_backup_dir, sample_db_file):
         """Test getting latest backup."""
-        import time
-
         mgr = BackupManager(backup_dir=temp_backup_dir)
 
         mgr.create_backup(sample_db_file, label="old")
@@ -119,6 +136,48 @@ class TestBackupManager:
         assert info["size"] > 0
         assert isinstance(info["created"], datetime)
 
+    def test_get_backup_info_parses_name(self, temp_backup_dir, sample_db_file):
+        """Source and label are parsed around the trailing timestamp."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        plain = mgr.create_backup(sample_db_file)
+        labeled = mgr.create_backup(sample_db_file, label="pre_restore")
+
+        assert mgr.get_backup_info(plain)["source"] == "unknown"
+        assert mgr.get_backup_info(plain)["label"] is None
+        assert mgr.get_backup_info(labeled)["label"] == "pre_restore"
+
+    def test_get_backup_info_underscored_db_name(self, temp_backup_dir):
+        """Underscores in the database name do not shift the source field."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        labeled = temp_backup_dir / "my_vdj_db_local_pre_clean_20240101_120000.xml"
+        plain = temp_backup_dir / "my_local_db_mynvme_20240101_120000.xml"
+        for path in (labeled, plain):
+            path.write_text("<x/>")
+
+        assert mgr.get_backup_info(labeled)["source"] == "local"
+        assert mgr.get_backup_info(labeled)["label"] == "pre_clean"
+        assert mgr.get_backup_info(plain)["source"] == "mynvme"
+        assert mgr.get_backup_info(plain)["label"] is None
+
+    def test_get_backup_info_unrecognized_name(self, temp_backup_dir):
+        """Files not written by create_backup fall back to defaults."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        path = temp_backup_dir / "database.xml"
+        path.write_text("<x/>")
+
+        info = mgr.get_backup_info(path)
+        assert info["source"] == "unknown"
+        assert info["label"] is None
+
+    def test_list_backup_info(self, temp_backup_dir, sample_db_file):
+        """list_backup_info returns one metadata dict per listed backup."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        mgr.create_backup(sample_db_file, label="first")
+
+        infos = mgr.list_backup_info()
+        assert [info["path"] for info in infos] == mgr.list_backups()
+        assert infos[0]["label"] == "first"
+
     def test_backup_nonexistent_file(self, temp_backup_dir):
         """Test backing up non-existent file raises error."""
         mgr = BackupManager(backup_dir=temp_backup_dir)
@@ -132,8 +191,6 @@ class TestBackupManager:
         Bug fix: shutil.copy2 preserves source mtime, which broke sorting backups
         by creation order. The fix touches the file after copying to update mtime.
         """
-        import time
-
         mgr = BackupManager(backup_dir=temp_backup_dir)
 
         # Create first backup
@@ -151,3 +208,227 @@ class TestBackupManager:
         assert (
             second_mtime > first_mtime
         ), f"Second backup mtime ({second_mtime}) should be > first backup mtime ({first_mtime})"
+
+
+class TestSkipIfUnchanged:
+    def test_reuses_backup_when_database_unchanged(self, temp_backup_dir, sample_db_file):
+        """An unchanged database returns the newest backup without copying."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        first = mgr.create_backup(sample_db_file, label="pre_analysis")
+
+        with patch("vdj_manager.core.backup._fast_copy") as fast_copy:
+            again = mgr.create_backup(sample_db_file, label="pre_analysis", skip_if_unchanged=True)
+
+        assert again == first
+        fast_copy.assert_not_called()
+        assert len(mgr.list_backups()) == 1
+
+    def test_copies_same_size_edit_with_old_mtime(self, temp_backup_dir, sample_db_file):
+        """A same-size edit is copied even if the mtime predates the backup (as after a restore)."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        first = mgr.create_backup(sample_db_file, label="pre_analysis")
+        old_mtime = first.stat().st_mtime_ns - 60_000_000_000
+        sample_db_file.write_text(sample_db_file.read_text().replace("VirtualDJ", "VirtualXX"))
+        os.utime(sample_db_file, ns=(old_mtime, old_mtime))
+
+        with patch("vdj_manager.core.backup._fast_copy") as fast_copy:
+            mgr.create_backup(sample_db_file, label="pre_analysis", skip_if_unchanged=True)
+
+        fast_copy.assert_called_once()
+
+    def test_backup_with_other_label_is_reused(self, temp_backup_dir, sample_db_file):
+        """Back-to-back backups with different labels share one copy."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        first = mgr.create_backup(sample_db_file, label="pre_energy")
+
+        with patch("vdj_manager.core.backup._fast_copy") as fast_copy:
+            again = mgr.create_backup(sample_db_file, label="pre_mik", skip_if_unchanged=True)
+
+        assert again == first
+        fast_copy.assert_not_called()
+
+    def test_reused_backup_is_touched(self, temp_backup_dir, sample_db_file):
+        """A reused backup becomes the newest, so cleanup keeps it."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        first = mgr.create_backup(sample_db_file)
+        old_mtime = time.time() - 86400
+        os.utime(first, (old_mtime, old_mtime))
+        os.utime(sample_db_file, (old_mtime - 60, old_mtime - 60))
+
+        again = mgr.create_backup(sample_db_file, skip_if_unchanged=True)
+
+        assert again == first
+        assert first.stat().st_mtime > old_mtime
+        assert mgr.archive_old_backups(older_than_days=1) == 0
+
+    def test_database_modified_after_backup_skips_compare(self, temp_backup_dir, sample_db_file):
+        """A database newer than its backup is copied without reading either file."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        first = mgr.create_backup(sample_db_file)
+        newer = first.stat().st_mtime + 60
+        os.utime(sample_db_file, (newer, newer))
+
+        with patch("vdj_manager.core.backup._same_content") as same_content:
+            again = mgr.create_backup(sample_db_file, label="pre_mik", skip_if_unchanged=True)
+
+        assert again != first
+        same_content.assert_not_called()
+
+    def test_other_database_is_not_reused(self, temp_backup_dir, sample_db_file):
+        """Only backups of the same database count."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        other_db = temp_backup_dir.parent / f"other_{sample_db_file.name}"
+        shutil.copyfile(sample_db_file, other_db)
+        try:
+            mgr.create_backup(other_db, label="pre_analysis")
+
+            with patch("vdj_manager.core.backup._fast_copy") as fast_copy:
+                mgr.create_backup(sample_db_file, label="pre_analysis", skip_if_unchanged=True)
+        finally:
+            other_db.unlink()
+
+        fast_copy.assert_called_once()
+
+
+class TestArchiveOldBackups:
+    def _age(self, path, days):
+        """Backdate a backup's mtime by a number of days."""
+        mtime = time.time() - days * 86400
+        os.utime(path, (mtime, mtime))
+
+    def test_old_backups_move_into_monthly_archive(self, temp_backup_dir, sample_db_file):
+        """Old backups are replaced by one archive holding them; recent ones stay."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        old = [mgr.create_backup(sample_db_file, label=f"old_{i}") for i in range(3)]
+        recent = mgr.create_backup(sample_db_file, label="recent")
+        for backup in old:
+            self._age(backup, 40)
+
+        archived = mgr.archive_old_backups(older_than_days=30)
+
+        assert archived == 3
+        assert mgr.list_backups() == [recent]
+        (archive,) = temp_backup_dir.glob("archive_*.tar.xz")
+        with tarfile.open(archive) as tar:
+            assert sorted(tar.getnames()) == sorted(b.name for b in old)
+            member = tar.extractfile(old[0].name)
+            assert member is not None
+            assert member.read() == sample_db_file.read_bytes()
+
+    def test_existing_archive_is_not_overwritten(self, temp_backup_dir, sample_db_file):
+        """A second run for the same month writes a separately numbered archive."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        for run in range(2):
+            backup = mgr.create_backup(sample_db_file, label=f"run_{run}")
+            self._age(backup, 40)
+            assert mgr.archive_old_backups() == 1
+
+        assert len(list(temp_backup_dir.glob("archive_*.tar.xz"))) == 2
+
+    def test_failed_archive_keeps_backups(self, temp_backup_dir, sample_db_file):
+        """Backups are only deleted after their archive is complete."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        backup = mgr.create_backup(sample_db_file)
+        self._age(backup, 40)
+
+        with patch("tarfile.TarFile.add", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                mgr.archive_old_backups()
+
+        assert backup.exists()
+        assert list(temp_backup_dir.glob("*archive_*")) == []
+
+
+class TestBackupCommand:
+    def _run(self, temp_backup_dir, sample_db_file, *args):
+        with (
+            patch("vdj_manager.cli.LOCAL_VDJ_DB", sample_db_file),
+            patch("vdj_manager.core.backup.BACKUP_DIR", temp_backup_dir),
+        ):
+            return CliRunner().invoke(cli, ["db", "backup", "--local", *args])
+
+    def test_archive_older_than_zero_is_rejected(self, temp_backup_dir, sample_db_file):
+        """0 days would archive the backup the command just created, so it is refused."""
+        result = self._run(temp_backup_dir, sample_db_file, "--archive-older-than", "0")
+
+        assert result.exit_code == 2
+        assert list(temp_backup_dir.iterdir()) == []
+
+    def test_archive_keeps_new_backup(self, temp_backup_dir, sample_db_file):
+        """Old backups are archived while the one just created stays in place."""
+        old = BackupManager(backup_dir=temp_backup_dir).create_backup(sample_db_file, label="old")
+        mtime = time.time() - 3 * 86400
+        os.utime(old, (mtime, mtime))
+
+        result = self._run(temp_backup_dir, sample_db_file, "--archive-older-than", "1")
+
+        assert result.exit_code == 0, result.output
+        assert "Archived 1 backups" in result.output
+        assert not old.exists()
+        backups = BackupManager(backup_dir=temp_backup_dir).list_backups()
+        assert len(backups) == 1
+        assert backups[0].name in result.output.replace("\n", "")
+
+
+class TestFastCopy:
+    def test_copies_content_and_mtime(self, tmp_path):
+        """The copy is byte-identical and keeps the source mtime like copy2."""
+        src = tmp_path / "src.xml"
+        src.write_bytes(b"<VirtualDJ_Database>" + b"x" * 100_000 + b"</VirtualDJ_Database>")
+        os.utime(src, (1_000_000_000, 1_000_000_000))
+        dst = tmp_path / "dst.xml"
+
+        _fast_copy(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == src.stat().st_mtime
+
+    def test_same_file_is_left_intact(self, tmp_path):
+        """Copying a file onto itself raises instead of truncating it."""
+        src = tmp_path / "db.xml"
+        src.write_bytes(b"<VirtualDJ_Database/>")
+
+        with pytest.raises(shutil.SameFileError):
+            _fast_copy(src, tmp_path / "." / "db.xml")
+
+        assert src.read_bytes() == b"<VirtualDJ_Database/>"
+
+    def test_falls_back_when_copy_file_range_fails(self, tmp_path):
+        """An OSError from copy_file_range falls back to shutil.copy2."""
+        src = tmp_path / "src.xml"
+        src.write_bytes(b"data")
+        dst = tmp_path / "dst.xml"
+
+        with patch(
+            "vdj_manager.core.backup.os.copy_file_range",
+            side_effect=OSError("EXDEV"),
+            create=True,
+        ):
+            _fast_copy(src, dst)
+
+        assert dst.read_bytes() == b"data"
+
+    def test_falls_back_when_copy_file_range_stops_short(self, tmp_path):
+        """A copy_file_range that reports EOF early does not leave a truncated copy."""
+        src = tmp_path / "src.xml"
+        src.write_bytes(b"x" * 10_000)
+        dst = tmp_path / "dst.xml"
+
+        with patch(
+            "vdj_manager.core.backup.os.copy_file_range", return_value=0, create=True
+        ) as copy_file_range:
+            _fast_copy(src, dst)
+
+        copy_file_range.assert_called_once()
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_restore_backup_overwrites_target(self, temp_backup_dir, sample_db_file, tmp_path):
+        """restore_backup copies the backup contents over the target."""
+        mgr = BackupManager(backup_dir=temp_backup_dir)
+        backup_path = mgr.create_backup(sample_db_file)
+        target = tmp_path / "database.xml"
+        target.write_text("stale")
+
+        mgr.restore_backup(backup_path, target)
+
+        assert target.read_bytes() == sample_db_file.read_bytes()
@@ -0,0 +1,33 @@
+"""Tests for application configuration."""
+
+from unittest.mock import patch
+
+from vdj_manager.config import Config
+
+
+class TestPrimaryDb:
+    """Tests for Config.primary_db."""
+
+    def test_prefers_mynvme_when_present(self, tmp_path):
+        mynvme = tmp_path / "mynvme.xml"
+        mynvme.write_text("<x/>")
+        cfg = Config(local_db=tmp_path / "local.xml", mynvme_db=mynvme)
+        assert cfg.primary_db == mynvme
+
+    def test_falls_back_to_local(self, tmp_path):
+        local = tmp_path / "local.xml"
+        cfg = Config(local_db=local, mynvme_db=tmp_path / "missing.xml")
+        assert cfg.primary_db == local
+
+    def test_availability_cached_within_ttl(self, tmp_path):
+        """Repeated lookups within the TTL do not stat the volume again."""
+        mynvme = tmp_path / "mynvme.xml"
+        cfg = Config(local_db=tmp_path / "local.xml", mynvme_db=mynvme)
+
+        with patch("vdj_manager.config.time.monotonic", return_value=100.0):
+            assert cfg.primary_db == cfg.local_db
+            mynvme.write_text("<x/>")
+            assert cfg.primary_db == cfg.local_db
+
+        with patch("vdj_manager.config.time.monotonic", return_value=100.0 + Config.PRIMARY_DB_TTL):
+            assert cfg.primary_db == mynvme
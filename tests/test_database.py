@@ -109,6 +109,76 @@ class TestVDJDatabase:
         assert stats.with_energy == 1
         assert stats.with_cue_points == 1
 
+    def test_get_stats_path_breakdown(self, tmp_path):
+        """Drive letters are counted case-insensitively; locations by prefix."""
+        db_file = tmp_path / "database.xml"
+        db_file.write_text(
+            '<VirtualDJ_Database Version="2024">\n'
+            ' <Song FilePath="C:/a.mp3" />\n'
+            ' <Song FilePath="d:/b.mp3" />\n'
+            ' <Song FilePath="E:/c.txt" />\n'
+            ' <Song FilePath="/Users/me/d.mp3" />\n'
+            ' <Song FilePath="/Volumes/MyNVMe/e.flac" />\n'
+            ' <Song FilePath="netsearch://dz123" />\n'
+            ' <Song FilePath="F:/f.mp3" />\n'
+            ' <Song FilePath="file:///music/g.mp3" />\n'
+            "</VirtualDJ_Database>\n"
+        )
+        db = VDJDatabase(db_file)
+        db.load()
+
+        stats = db.get_stats()
+
+        assert (stats.windows_c_paths, stats.windows_d_paths, stats.windows_e_paths) == (1, 1, 1)
+        assert stats.windows_paths == 4
+        assert stats.netsearch == 1
+        assert stats.local_files == 3
+        assert stats.mac_home_paths == 1
+        assert stats.mynvme_paths == 1
+        assert stats.audio_files == 6
+        assert stats.non_audio_files == 1
+
+    def test_get_stats_counts_odd_extensions(self, tmp_path):
+        """Audio/non-audio counts use Path.suffix semantics for odd file names."""
+        paths = [
+            "/music/A.MP3",
+            "/music/.hidden",
+            "/music/trailing.",
+            "/music.d/noext",
+            "C:/dir/track.FLAC",
+            "/music/archive.tar.gz",
+        ]
+        db_file = tmp_path / "database.xml"
+        db_file.write_text(
+            '<VirtualDJ_Database Version="2024">\n'
+            + "".join(f' <Song FilePath="{p}" />\n' for p in paths)
+            + "</VirtualDJ_Database>\n"
+        )
+        db = VDJDatabase(db_file)
+        db.load()
+
+        stats = db.get_stats()
+        assert (stats.audio_files, stats.non_audio_files) == (2, 4)
+
+    def test_get_stats_check_existence(self, tmp_path):
+        """Only local, non-netsearch paths that are absent count as missing."""
+        present = tmp_path / "present.mp3"
+        present.write_bytes(b"")
+        db_file = tmp_path / "database.xml"
+        db_file.write_text(
+            '<VirtualDJ_Database Version="2024">\n'
+            f' <Song FilePath="{present}" />\n'
+            f' <Song FilePath="{tmp_path / "gone.mp3"}" />\n'
+            ' <Song FilePath="C:/elsewhere.mp3" />\n'
+            ' <Song FilePath="netsearch://dz123" />\n'
+            "</VirtualDJ_Database>\n"
+        )
+        db = VDJDatabase(db_file)
+        db.load()
+
+        assert db.get_stats(check_existence=True).missing_files == 1
+        assert db.get_stats(check_existence=False).missing_files == 0
+
     def test_update_song_tags(self, temp_db_file):
         """Test updating song tags."""
         db = VDJDatabase(temp_db_file)
@@ -206,6 +276,143 @@ class TestVDJDatabase:
         assert song.tags.grouping == "10"
         assert song.energy == 10
 
+    def test_load_parses_playlists_in_same_pass(self, tmp_path):
+        """Songs and MyList playlists are both picked up by the streaming load."""
+        db_file = tmp_path / "database.xml"
+        db_file.write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<VirtualDJ_Database Version="8">\n'
+            ' <Song FilePath="/music/a.mp3"><Tags Title="A" /></Song>\n'
+            ' <MyList Name="Set 1">\n'
+            '  <Song FilePath="/music/a.mp3" />\n'
+            '  <Song FilePath="/music/b.mp3" />\n'
+            " </MyList>\n"
+            ' <MyList Name="Set 2" />\n'
+            "</VirtualDJ_Database>\n"
+        )
+        db = VDJDatabase(db_file)
+        db.load()
+
+        assert db._root.tag == "VirtualDJ_Database"
+        assert [pl.name for pl in db.playlists] == ["Set 1", "Set 2"]
+        assert db.playlists[0].file_paths == ["/music/a.mp3", "/music/b.mp3"]
+        assert db.playlists[1].file_paths == []
+
+    def test_load_playlist_entries_do_not_replace_library_songs(self, tmp_path):
+        """A MyList reference to a song leaves the library entry and its element alone."""
+        db_file = tmp_path / "database.xml"
+        db_file.write_text(
+            '<VirtualDJ_Database Version="8">\n'
+            ' <Song FilePath="/music/a.mp3"><Tags Title="A" Grouping="7" /></Song>\n'
+            ' <MyList Name="Set">\n'
+            '  <Song FilePath="/music/a.mp3" />\n'
+            '  <Song FilePath="/music/only-in-list.mp3" />\n'
+            " </MyList>\n"
+            "</VirtualDJ_Database>\n"
+        )
+        db = VDJDatabase(db_file)
+        db.load()
+
+        assert list(db.songs) == ["/music/a.mp3"]
+        assert db.get_song("/music/a.mp3").energy == 7
+        assert db._filepath_to_elem["/music/a.mp3"].getparent() is db._root
+        assert db.playlists[0].file_paths == ["/music/a.mp3", "/music/only-in-list.mp3"]
+
+    def test_load_nested_playlist_songs_are_references(self, tmp_path):
+        """Songs nested deeper under a MyList belong to it, not to the library."""
+        db_file = tmp_path / "database.xml"
+        db_file.write_text(
+            '<VirtualDJ_Database Version="8">\n'
+            ' <Song FilePath="/music/a.mp3" />\n'
+            ' <MyList Name="Set">\n'
+            '  <Folder><Song FilePath="/music/nested.mp3" /></Folder>\n'
+            '  <Song FilePath="/music/a.mp3" />\n'
+            " </MyList>\n"
+            "</VirtualDJ_Database>\n"
+        )
+        db = VDJDatabase(db_file)
+        db.load()
+
+        assert list(db.songs) == ["/music/a.mp3"]
+        assert "/music/nested.mp3" not in db._filepath_to_elem
+        assert db.playlists[0].file_paths == ["/music/nested.mp3", "/music/a.mp3"]
+
+    def test_load_malformed_xml_raises(self, tmp_path):
+        """A syntax error surfaces and leaves the database unloaded."""
+        db_file = tmp_path / "database.xml"
+        db_file.write_text('<VirtualDJ_Database><Song FilePath="/a.mp3">')
+        db = VDJDatabase(db_file)
+
+        with pytest.raises(etree.XMLSyntaxError):
+            db.load()
+        assert not db.is_loaded
+        assert db.songs == {}
+
+    def test_load_malformed_numbers_become_none(self, tmp_path):
+        """Non-numeric or missing numeric attributes parse as None."""
+        db_file = tmp_path / "database.xml"
+        db_file.write_text(
+            '<VirtualDJ_Database Version="2024">\n'
+            ' <Song FilePath="/music/a.mp3" FileSize="abc">'
+            '<Tags Year="" Bpm="fast" Rating="3" /></Song>\n'
+            "</VirtualDJ_Database>\n"
+        )
+        db = VDJDatabase(db_file)
+        db.load()
+
+        song = db.get_song("/music/a.mp3")
+        assert song.file_size is None
+        assert song.tags.year is None
+        assert song.tags.bpm is None
+        assert song.tags.rating == 3
+        assert song.tags.track_number is None
+
+    def test_load_skips_unknown_poi_types(self, tmp_path):
+        """POIs with a missing or unrecognized Type are dropped."""
+        db_file = tmp_path / "database.xml"
+        db_file.write_text(
+            '<VirtualDJ_Database Version="2024">\n'
+            ' <Song FilePath="/music/a.mp3">'
+            '<Poi Type="cue" Pos="1.5" Num="1" />'
+            '<Poi Type="marker" Pos="2.0" />'
+            '<Poi Pos="3.0" />'
+            "</Song>\n"
+            "</VirtualDJ_Database>\n"
+        )
+        db = VDJDatabase(db_file)
+        db.load()
+
+        pois = db.get_song("/music/a.mp3").pois
+        assert len(pois) == 1
+        assert pois[0].type.value == "cue"
+        assert pois[0].pos == 1.5
+
+    def test_load_parses_children_in_any_order(self, tmp_path):
+        """Tags/Infos/Scan/Poi/Link children are picked up regardless of position."""
+        db_file = tmp_path / "database.xml"
+        db_file.write_text(
+            '<VirtualDJ_Database Version="2024">\n'
+            ' <Song FilePath="/music/a.mp3">'
+            '<Poi Type="cue" Pos="1.0" Num="1" />'
+            '<Link Source="/music/a-stem.mp3" />'
+            '<Scan Bpm="0.5" />'
+            '<Poi Type="cue" Pos="2.0" Num="2" />'
+            '<Infos SongLength="200" />'
+            '<Link Source="" />'
+            '<Tags Title="A" />'
+            "</Song>\n"
+            "</VirtualDJ_Database>\n"
+        )
+        db = VDJDatabase(db_file)
+        db.load()
+
+        song = db.get_song("/music/a.mp3")
+        assert song.tags.title == "A"
+        assert song.infos.song_length == 200.0
+        assert song.actual_bpm == 120.0
+        assert [p.num for p in song.pois] == [1, 2]
+        assert [link.source for link in song.links] == ["/music/a-stem.mp3"]
+
     def test_iter_songs(self, temp_db_file):
         """Test iterating over songs."""
         db = VDJDatabase(temp_db_file)
@@ -231,18 +438,20 @@ class TestVDJDatabaseSaveFormat:
         """Saved XML declaration must use double quotes."""
         db = VDJDatabase(temp_db_file)
         db.load()
-        db.save()
+        out = temp_db_file.with_name("saved.xml")
+        db.save(out)
 
-        content = temp_db_file.read_bytes()
+        content = out.read_bytes()
         assert content.startswith(b'<?xml version="1.0" encoding="UTF-8"?>')
 
     def test_save_uses_crlf_line_endings(self, temp_db_file):
         """Saved file must use CRLF line endings."""
         db = VDJDatabase(temp_db_file)
         db.load()
-        db.save()
+        out = temp_db_file.with_name("saved.xml")
+        db.save(out)
 
-        content = temp_db_file.read_bytes()
+        content = out.read_bytes()
         # Every LF should be preceded by CR
         lf_count = content.count(b"\n")
         crlf_count = content.count(b"\r\n")
@@ -253,9 +462,10 @@ class TestVDJDatabaseSaveFormat:
         """Self-closing tags must have space before />."""
         db = VDJDatabase(temp_db_file)
         db.load()
-        db.save()
+        out = temp_db_file.with_name("saved.xml")
+        db.save(out)
 
-        content = temp_db_file.read_text(encoding="utf-8")
+        content = out.read_text(encoding="utf-8")
         # All /> should be preceded by a space
         assert "/>" in content
         import re
@@ -267,9 +477,10 @@ class TestVDJDatabaseSaveFormat:
         """File must end with CRLF."""
         db = VDJDatabase(temp_db_file)
         db.load()
-        db.save()
+        out = temp_db_file.with_name("saved.xml")
+        db.save(out)
 
-        content = temp_db_file.read_bytes()
+        content = out.read_bytes()
         assert content.endswith(b"\r\n")
 
     def test_save_round_trip_byte_identical(self, temp_db_file):
@@ -278,9 +489,10 @@ class TestVDJDatabaseSaveFormat:
 
         db = VDJDatabase(temp_db_file)
         db.load()
-        db.save()
+        out = temp_db_file.with_name("saved.xml")
+        db.save(out)
 
-        saved = temp_db_file.read_bytes()
+        saved = out.read_bytes()
         assert original == saved
 
     def test_save_preserves_apostrophe_entities(self):
@@ -299,6 +511,7 @@ class TestVDJDatabaseSaveFormat:
         try:
             db = VDJDatabase(tmp)
             db.load()
+            db.update_song_tags("/path/to/it's a track.mp3", Grouping="5")
             db.save()
 
             content = tmp.read_bytes().decode("utf-8")
@@ -308,13 +521,60 @@ class TestVDJDatabaseSaveFormat:
         finally:
             tmp.unlink(missing_ok=True)
 
+    def test_save_round_trip_non_ascii(self, tmp_path):
+        """Multi-byte UTF-8 next to escaped quotes survives a byte-identical round trip."""
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>\r\n'
+            '<VirtualDJ_Database Version="8">\r\n'
+            ' <Song FilePath="/music/Beyoncé – Déjà Vu.mp3" FileSize="100">\r\n'
+            '  <Tags Author="Sigur Rós &amp; l&apos;Orchestre" Title="Ágætis byrjun" />\r\n'
+            "  <Comment>日本語 &quot;live&quot; l&apos;été</Comment>\r\n"
+            " </Song>\r\n"
+            "</VirtualDJ_Database>\r\n"
+        )
+        db_file = tmp_path / "database.xml"
+        db_file.write_bytes(xml.encode("utf-8"))
+
+        db = VDJDatabase(db_file)
+        db.load()
+        db.save(tmp_path / "saved.xml")
+
+        assert (tmp_path / "saved.xml").read_bytes() == xml.encode("utf-8")
+
+    def test_save_streaming_matches_across_flush_boundaries(self, tmp_path):
+        """Output is identical when the fix-ups are applied in many small flushes."""
+        from unittest.mock import patch
+
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>\r\n'
+            '<VirtualDJ_Database Version="8">\r\n'
+            + "".join(
+                f' <Song FilePath="/music/it&apos;s {i}.mp3">\r\n'
+                f'  <Tags Author="Rock&apos;n Roll" Title="Café {i}" />\r\n'
+                f"  <Comment>say &quot;{i}&quot; l&apos;été</Comment>\r\n"
+                " </Song>\r\n"
+                for i in range(20)
+            )
+            + "</VirtualDJ_Database>\r\n"
+        )
+        db_file = tmp_path / "database.xml"
+        db_file.write_bytes(xml.encode("utf-8"))
+        db = VDJDatabase(db_file)
+        db.load()
+
+        with patch("vdj_manager.core.database._FORMAT_BUFFER_SIZE", 7):
+            db.save(tmp_path / "saved.xml")
+
+        assert (tmp_path / "saved.xml").read_bytes() == xml.encode("utf-8")
+
     def test_save_produces_valid_xml(self, temp_db_file):
         """Saved XML can be parsed back successfully."""
         db = VDJDatabase(temp_db_file)
         db.load()
-        db.save()
+        out = temp_db_file.with_name("saved.xml")
+        db.save(out)
 
-        db2 = VDJDatabase(temp_db_file)
+        db2 = VDJDatabase(out)
         db2.load()
 
         assert db2.is_loaded
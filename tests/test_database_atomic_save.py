@@ -1,12 +1,11 @@
 """Tests for atomic database save to prevent corruption."""
 
 import os
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from vdj_manager.core.database import VDJDatabase
+from vdj_manager.core.database import VDJDatabase, _VDJFormatWriter
 
 
 @pytest.fixture
@@ -24,6 +23,8 @@ def db_with_song(tmp_path):
     db_path.write_bytes(xml.encode("utf-8"))
     db = VDJDatabase(db_path)
     db.load()
+    # Unmodified saves are skipped, so give every test something to write
+    db.update_song_tags("/test/song.mp3", Grouping="5")
     return db
 
 
@@ -47,6 +48,23 @@ class TestAtomicSave:
             assert args[0].endswith(".xml.tmp")
             assert args[1] == str(db_with_song.db_path)
 
+    def test_save_fsyncs_before_replace(self, db_with_song):
+        """Temp file contents are flushed to disk before the rename."""
+        calls = []
+        real_replace = os.replace
+        with (
+            patch(
+                "vdj_manager.core.database.os.fsync", side_effect=lambda fd: calls.append("fsync")
+            ),
+            patch(
+                "vdj_manager.core.database.os.replace",
+                side_effect=lambda src, dst: calls.append("replace") or real_replace(src, dst),
+            ),
+        ):
+            db_with_song.save()
+
+        assert calls == ["fsync", "replace"]
+
     def test_save_cleans_up_temp_on_failure(self, db_with_song, tmp_path):
         """If os.replace fails, temp file should be cleaned up."""
         tmp_file = db_with_song.db_path.with_suffix(".xml.tmp")
@@ -65,8 +83,8 @@ class TestAtomicSave:
         # Read original content
         original_content = db_with_song.db_path.read_bytes()
 
-        # Make write_bytes fail on the temp file
-        with patch.object(Path, "write_bytes", side_effect=OSError("write failed")):
+        # Make the final flush to the temp file fail
+        with patch.object(_VDJFormatWriter, "close", side_effect=OSError("write failed")):
             with pytest.raises(IOError):
                 db_with_song.save()
 
@@ -78,3 +96,43 @@ class TestAtomicSave:
         db_with_song.save()
         tmp_file = db_with_song.db_path.with_suffix(".xml.tmp")
         assert not tmp_file.exists()
+
+
+class TestSkipUnmodifiedSave:
+    """Tests for skipping the rewrite when nothing has changed."""
+
+    def test_unmodified_save_does_not_write(self, tmp_path):
+        db_path = tmp_path / "database.xml"
+        db_path.write_bytes(
+            b'<VirtualDJ_Database Version="2024"><Song FilePath="/a.mp3"/>' b"</VirtualDJ_Database>"
+        )
+        db = VDJDatabase(db_path)
+        db.load()
+
+        assert not db.is_modified
+        with patch("vdj_manager.core.database.os.replace") as mock_replace:
+            db.save()
+        mock_replace.assert_not_called()
+
+    def test_modified_save_writes_and_clears_flag(self, db_with_song):
+        assert db_with_song.is_modified
+        db_with_song.save()
+        assert not db_with_song.is_modified
+
+        with patch("vdj_manager.core.database.os.replace") as mock_replace:
+            db_with_song.save()
+        mock_replace.assert_not_called()
+
+    def test_save_to_other_path_always_writes(self, db_with_song, tmp_path):
+        db_with_song.save()
+        out = tmp_path / "copy.xml"
+
+        db_with_song.save(out)
+
+        assert out.exists()
+        assert not db_with_song.is_modified
+
+    def test_mutators_mark_modified(self, db_with_song):
+        db_with_song.save()
+        db_with_song.remap_path("/test/song.mp3", "/test/moved.mp3")
+        assert db_with_song.is_modified
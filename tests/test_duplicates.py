@@ -0,0 +1,177 @@
+"""Tests for DuplicateDetector file hashing."""
+
+import hashlib
+from unittest.mock import patch
+
+from vdj_manager.core.models import Song, Tags
+from vdj_manager.files.duplicates import DuplicateDetector
+
+
+class TestFileHash:
+    """Tests for compute_file_hash / compute_partial_hash."""
+
+    def test_sha256_fallback_without_blake3(self, tmp_path):
+        path = tmp_path / "a.mp3"
+        path.write_bytes(b"audio" * 1000)
+
+        with patch("vdj_manager.files.duplicates.BLAKE3_AVAILABLE", False):
+            assert DuplicateDetector.compute_file_hash(str(path)) == (
+                hashlib.sha256(path.read_bytes()).hexdigest()
+            )
+
+    def test_identical_files_hash_equal(self, tmp_path):
+        a = tmp_path / "a.mp3"
+        b = tmp_path / "b.mp3"
+        c = tmp_path / "c.mp3"
+        a.write_bytes(b"same" * 5000)
+        b.write_bytes(b"same" * 5000)
+        c.write_bytes(b"diff" * 5000)
+
+        assert DuplicateDetector.compute_file_hash(str(a)) == DuplicateDetector.compute_file_hash(
+            str(b)
+        )
+        assert DuplicateDetector.compute_file_hash(str(a)) != DuplicateDetector.compute_file_hash(
+            str(c)
+        )
+
+    def test_partial_hash_only_reads_prefix(self, tmp_path):
+        a = tmp_path / "a.mp3"
+        b = tmp_path / "b.mp3"
+        a.write_bytes(b"x" * 100 + b"tail-a")
+        b.write_bytes(b"x" * 100 + b"tail-b")
+
+        assert DuplicateDetector.compute_partial_hash(
+            str(a), bytes_to_read=100
+        ) == DuplicateDetector.compute_partial_hash(str(b), bytes_to_read=100)
+
+    def test_resumed_full_hash_matches_fresh_hash(self, tmp_path):
+        path = tmp_path / "a.mp3"
+        path.write_bytes(bytes(range(256)) * 100)
+
+        prefix = DuplicateDetector._hash_prefix(str(path), bytes_to_read=1000)
+        assert prefix is not None and prefix[1] == 1000
+        assert DuplicateDetector.compute_file_hash(
+            str(path), chunk_size=4096, resume=prefix
+        ) == DuplicateDetector.compute_file_hash(str(path))
+
+    def test_missing_file_returns_none(self, tmp_path):
+        missing = str(tmp_path / "missing.mp3")
+        assert DuplicateDetector.compute_file_hash(missing) is None
+        assert DuplicateDetector.compute_partial_hash(missing) is None
+
+
+class TestFindByHash:
+    """Tests for the concurrent find_by_hash."""
+
+    def _write(self, tmp_path, name, content):
+        path = tmp_path / name
+        path.write_bytes(content)
+        return Song(FilePath=str(path), FileSize=len(content))
+
+    def test_groups_stay_within_size_buckets(self, tmp_path):
+        a1 = self._write(tmp_path, "a1.mp3", b"a" * 3000)
+        a2 = self._write(tmp_path, "a2.mp3", b"a" * 3000)
+        b1 = self._write(tmp_path, "b1.mp3", b"b" * 5000)
+        b2 = self._write(tmp_path, "b2.mp3", b"b" * 5000)
+        b3 = self._write(tmp_path, "b3.mp3", b"b" * 5000)
+        lone = self._write(tmp_path, "c.mp3", b"c" * 3000)
+        remote = Song(FilePath="D:/music/b.mp3", FileSize=5000)
+
+        groups = DuplicateDetector().find_by_hash([a1, b1, lone, a2, remote, b2, b3], max_workers=3)
+
+        assert sorted(sorted(s.file_path for s in g) for g in groups) == [
+            sorted([a1.file_path, a2.file_path]),
+            sorted([b1.file_path, b2.file_path, b3.file_path]),
+        ]
+
+    def test_full_hash_splits_partial_collisions(self, tmp_path):
+        prefix = b"x" * (1024 * 1024)
+        songs = [
+            self._write(tmp_path, f"{i}.mp3", prefix + tail)
+            for i, tail in enumerate([b"one", b"one", b"two"])
+        ]
+
+        with patch.object(
+            DuplicateDetector, "compute_file_hash", wraps=DuplicateDetector.compute_file_hash
+        ) as full_hash:
+            groups = DuplicateDetector().find_by_hash(songs, max_workers=2)
+
+        assert [sorted(s.file_path for s in g) for g in groups] == [
+            sorted([songs[0].file_path, songs[1].file_path])
+        ]
+        # Verification resumes after the already-hashed prefix
+        assert all(call.kwargs["resume"][1] == len(prefix) for call in full_hash.call_args_list)
+
+    def test_stale_file_size_and_missing_files_skip_hashing(self, tmp_path):
+        real = self._write(tmp_path, "real.mp3", b"r" * 4000)
+        stale = self._write(tmp_path, "stale.mp3", b"s" * 1000)
+        stale.file_size = 4000  # database still records the old size
+        missing = Song(FilePath=str(tmp_path / "gone.mp3"), FileSize=4000)
+
+        with patch.object(DuplicateDetector, "_hash_prefix") as partial:
+            groups = DuplicateDetector().find_by_hash([real, stale, missing])
+
+        assert groups == []
+        partial.assert_not_called()
+
+
+class TestFindByKey:
+    """Tests for metadata and filename grouping."""
+
+    def test_filename_groups_ignore_directory_and_case(self):
+        songs = [
+            Song(FilePath="/music/a/Track.mp3"),
+            Song(FilePath="D:/backup/track.MP3"),
+            Song(FilePath="/music/b/other.mp3"),
+        ]
+
+        groups = DuplicateDetector().find_by_filename(iter(songs))
+
+        assert list(groups) == ["track.mp3"]
+        assert len(groups["track.mp3"]) == 2
+
+    def test_metadata_groups_normalize_and_skip_incomplete_tags(self):
+        songs = [
+            Song(FilePath="/a.mp3", tags=Tags(Author="Artist ", Title="Song")),
+            Song(FilePath="/b.mp3", tags=Tags(Author="artist", Title=" SONG")),
+            Song(FilePath="/c.mp3", tags=Tags(Author="Artist")),
+            Song(FilePath="/d.mp3"),
+        ]
+
+        groups = DuplicateDetector().find_by_metadata(iter(songs))
+
+        assert {k: [s.file_path for s in v] for k, v in groups.items()} == {
+            "artist|song": ["/a.mp3", "/b.mp3"]
+        }
+
+    def test_size_groups_keep_input_order_and_skip_unknown_sizes(self):
+        songs = [
+            Song(FilePath="/a.mp3", FileSize=10),
+            Song(FilePath="/b.mp3", FileSize=20),
+            Song(FilePath="/c.mp3", FileSize=10),
+            Song(FilePath="/d.mp3"),
+            Song(FilePath="/e.mp3"),
+            Song(FilePath="/f.mp3", FileSize=10),
+        ]
+
+        groups = DuplicateDetector().find_by_size(iter(songs))
+
+        assert {k: [s.file_path for s in v] for k, v in groups.items()} == {
+            10: ["/a.mp3", "/c.mp3", "/f.mp3"]
+        }
+
+
+class TestSuggestDuplicatesToRemove:
+    """Tests for choosing which duplicate to keep."""
+
+    def test_keeps_existing_file(self, tmp_path):
+        present = tmp_path / "present.mp3"
+        present.write_bytes(b"x")
+        missing = Song(FilePath=str(tmp_path / "missing.mp3"))
+        windows = Song(FilePath="D:/music/present.mp3")
+        kept = Song(FilePath=str(present))
+
+        to_remove = DuplicateDetector().suggest_duplicates_to_remove([[missing, windows, kept]])
+
+        assert kept not in to_remove
+        assert len(to_remove) == 2
@@ -1,17 +1,24 @@
 """Tests for FileTagEditor — read/write embedded audio file tags."""
 
+import sqlite3
 from unittest.mock import MagicMock, patch
 
+from click.testing import CliRunner
+
+from vdj_manager.cli import cli
 from vdj_manager.core.models import Song, Tags
 from vdj_manager.files.id3_editor import (
     SUPPORTED_FIELDS,
     FileTagEditor,
+    _load_id3_for_reading,
     file_tags_to_vdj_kwargs,
     vdj_tags_to_file_tags,
 )
 
 # Patch target: mutagen.File is lazy-imported inside methods as MutagenFile
 _MUTAGEN_FILE = "mutagen.File"
+# MP3 tags are read with mutagen.id3.ID3 directly
+_ID3 = "mutagen.id3.ID3"
 
 
 class TestFileTagEditorRead:
@@ -20,7 +27,7 @@ class TestFileTagEditorRead:
     def test_read_nonexistent_returns_none_values(self):
         """Reading a nonexistent file returns dict with all None values."""
         editor = FileTagEditor()
-        with patch(_MUTAGEN_FILE, side_effect=Exception("not found")):
+        with patch(_ID3, side_effect=Exception("not found")):
             result = editor.read_tags("/nonexistent/file.mp3")
 
         assert all(result[f] is None for f in SUPPORTED_FIELDS)
@@ -37,12 +44,10 @@ class TestFileTagEditorRead:
         """Reading MP3 should extract standard ID3 frames."""
         editor = FileTagEditor()
 
-        mock_audio = MagicMock()
         mock_frame = MagicMock()
         mock_frame.text = ["Test Title"]
-        mock_audio.tags = {"TIT2": mock_frame}
 
-        with patch(_MUTAGEN_FILE, return_value=mock_audio):
+        with patch(_ID3, return_value={"TIT2": mock_frame}):
             result = editor.read_tags("/test/song.mp3")
 
         assert result["title"] == "Test Title"
@@ -56,14 +61,32 @@ class TestFileTagEditorRead:
 
         # Use a real dict with COMM key
         tags_dict = {"COMM::eng": mock_comm}
-        mock_audio = MagicMock()
-        mock_audio.tags = tags_dict
 
-        with patch(_MUTAGEN_FILE, return_value=mock_audio):
+        with patch(_ID3, return_value=tags_dict):
             result = editor.read_tags("/test/song.mp3")
 
         assert result["comment"] == "Great track"
 
+    def test_read_mp3_leaves_cover_art_unparsed(self, tmp_path):
+        """Only the text frames we read are parsed; APIC stays raw bytes."""
+        from mutagen.id3 import APIC, ID3, TIT2, TYER
+
+        path = tmp_path / "art.mp3"
+        path.write_bytes(b"")
+        tags = ID3()
+        tags.add(TIT2(encoding=3, text=["Covered"]))
+        tags.add(TYER(encoding=3, text=["1999"]))
+        tags.add(APIC(encoding=3, mime="image/jpeg", type=3, desc="", data=b"\xff" * 4096))
+        tags.save(str(path), v2_version=3)
+
+        result = FileTagEditor().read_tags(str(path))
+        loaded = _load_id3_for_reading(str(path))
+
+        assert result["title"] == "Covered"
+        assert result["year"] == "1999"  # v2.3 TYER is still upgraded to TDRC
+        assert not loaded.getall("APIC")
+        assert any(frame[:4] == b"APIC" for frame in loaded.unknown_frames)
+
     def test_read_flac_extracts_vorbis_comments(self):
         """Reading FLAC should extract Vorbis comment fields."""
         editor = FileTagEditor()
@@ -79,6 +102,225 @@ class TestFileTagEditorRead:
         assert result["title"] == "Flac Track"
 
 
+class TestFileTagEditorReadBulk:
+    """Tests for concurrent bulk tag reading."""
+
+    def test_results_follow_input_order(self):
+        """Results come back in input order regardless of completion order."""
+        editor = FileTagEditor()
+        paths = [f"/music/{i}.mp3" for i in range(20)]
+
+        def fake_read(path):
+            return {f: None for f in SUPPORTED_FIELDS} | {"title": path}
+
+        with patch.object(editor, "_read_uncached", side_effect=fake_read):
+            results = list(editor.read_tags_bulk(iter(paths), max_workers=4))
+
+        assert [path for path, _ in results] == paths
+        assert all(tags["title"] == path for path, tags in results)
+
+    def test_one_failing_file_does_not_stop_the_rest(self):
+        """A read that raises gives all-None tags for that file only."""
+        editor = FileTagEditor()
+
+        def fake_read(path):
+            if path == "/music/bad.mp3":
+                raise ValueError("corrupt frame")
+            return {f: None for f in SUPPORTED_FIELDS} | {"title": "ok"}
+
+        with patch.object(editor, "_read_uncached", side_effect=fake_read):
+            results = dict(
+                editor.read_tags_bulk(["/music/a.mp3", "/music/bad.mp3", "/music/b.mp3"])
+            )
+
+        assert results["/music/a.mp3"]["title"] == "ok"
+        assert all(v is None for v in results["/music/bad.mp3"].values())
+        assert results["/music/b.mp3"]["title"] == "ok"
+
+    def test_reads_start_before_input_is_exhausted(self):
+        """A lazy path source is consumed in batches, not up front."""
+        editor = FileTagEditor()
+        consumed = []
+
+        def source():
+            for i in range(10):
+                consumed.append(i)
+                yield f"/music/{i}.mp3"
+
+        def fake_read(path):
+            return {f: None for f in SUPPORTED_FIELDS} | {"title": path}
+
+        with (
+            patch("vdj_manager.files.id3_editor._CACHE_BATCH_SIZE", 3),
+            patch.object(editor, "_read_uncached", side_effect=fake_read),
+        ):
+            results = editor.read_tags_bulk(source(), max_workers=2)
+            first = next(results)
+            consumed_at_first = len(consumed)
+            rest = list(results)
+
+        assert first[0] == "/music/0.mp3"
+        assert consumed_at_first == 6  # first batch plus the one kept in flight
+        assert [path for path, _ in [first, *rest]] == [f"/music/{i}.mp3" for i in range(10)]
+
+
+class TestFileTagEditorCache:
+    """Tests for caching parsed tags in an AnalysisCache."""
+
+    def _editor(self, tmp_path):
+        from vdj_manager.analysis.analysis_cache import AnalysisCache
+
+        return FileTagEditor(cache=AnalysisCache(db_path=tmp_path / "cache.db"))
+
+    def _mp3(self, tmp_path, name="song.mp3"):
+        path = tmp_path / name
+        path.write_bytes(b"\x00" * 128)
+        return str(path)
+
+    def _mock_tags(self, title):
+        frame = MagicMock()
+        frame.text = [title]
+        return {"TIT2": frame}
+
+    def test_unchanged_file_skips_mutagen(self, tmp_path):
+        editor = self._editor(tmp_path)
+        path = self._mp3(tmp_path)
+
+        with patch(_ID3, return_value=self._mock_tags("Cached")) as load_id3:
+            first = editor.read_tags(path)
+            second = editor.read_tags(path)
+
+        assert first == second
+        assert second["title"] == "Cached"
+        load_id3.assert_called_once()
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        editor = self._editor(tmp_path)
+        path = self._mp3(tmp_path)
+
+        with patch(_ID3, return_value=self._mock_tags("Old")):
+            editor.read_tags(path)
+        with open(path, "ab") as f:
+            f.write(b"\x00")  # size change invalidates the entry
+        with patch(_ID3, return_value=self._mock_tags("New")):
+            assert editor.read_tags(path)["title"] == "New"
+
+    def test_open_failures_are_not_cached(self, tmp_path):
+        editor = self._editor(tmp_path)
+        path = self._mp3(tmp_path)
+
+        with patch(_ID3, side_effect=Exception("locked")):
+            editor.read_tags(path)
+        with patch(_ID3, return_value=self._mock_tags("Readable")):
+            assert editor.read_tags(path)["title"] == "Readable"
+
+    def test_bulk_read_only_parses_misses(self, tmp_path):
+        editor = self._editor(tmp_path)
+        warm = self._mp3(tmp_path, "warm.mp3")
+        cold = self._mp3(tmp_path, "cold.mp3")
+
+        with patch(_ID3, return_value=self._mock_tags("Warm")):
+            editor.read_tags(warm)
+        with patch(_ID3, return_value=self._mock_tags("Cold")) as load_id3:
+            results = list(editor.read_tags_bulk([cold, warm, cold]))
+
+        assert [(path, tags["title"]) for path, tags in results] == [
+            (cold, "Cold"),
+            (warm, "Warm"),
+            (cold, "Cold"),
+        ]
+        assert {call.args[0] for call in load_id3.call_args_list} == {cold}
+
+    def test_bulk_read_writes_cache_once_per_batch(self, tmp_path):
+        editor = self._editor(tmp_path)
+        paths = [self._mp3(tmp_path, f"{i}.mp3") for i in range(5)]
+
+        with (
+            patch("vdj_manager.files.id3_editor._CACHE_BATCH_SIZE", 2),
+            patch(_ID3, return_value=self._mock_tags("Parsed")),
+            patch.object(editor.cache, "put") as put,
+            patch.object(editor.cache, "put_batch", wraps=editor.cache.put_batch) as put_batch,
+        ):
+            results = list(editor.read_tags_bulk(paths))
+
+        assert all(tags["title"] == "Parsed" for _, tags in results)
+        put.assert_not_called()
+        assert [len(call.args[0]) for call in put_batch.call_args_list] == [2, 2, 1]
+        assert editor.cache.get_batch(paths, "file_tags").keys() == set(paths)
+
+    def test_failed_cache_write_still_returns_tags(self, tmp_path):
+        editor = self._editor(tmp_path)
+        path = self._mp3(tmp_path)
+
+        with (
+            patch(_ID3, return_value=self._mock_tags("Parsed")),
+            patch.object(
+                editor.cache,
+                "put_batch",
+                side_effect=sqlite3.OperationalError("database is locked"),
+            ),
+        ):
+            single = editor.read_tags(path)
+            bulk = list(editor.read_tags_bulk([path]))
+
+        assert single["title"] == "Parsed"
+        assert bulk == [(path, single)]
+
+    def test_failed_cache_lookup_still_parses(self, tmp_path):
+        editor = self._editor(tmp_path)
+        path = self._mp3(tmp_path)
+
+        with (
+            patch(_ID3, return_value=self._mock_tags("Parsed")),
+            patch.object(
+                editor.cache,
+                "get_batch",
+                side_effect=sqlite3.OperationalError("database is locked"),
+            ),
+        ):
+            single = editor.read_tags(path)
+            bulk = list(editor.read_tags_bulk([path, path]))
+
+        assert single["title"] == "Parsed"
+        assert bulk == [(path, single), (path, single)]
+
+
+class TestAnalyzeGenreBulkFallback:
+    """analyze genre keeps reading file tags after the bulk reader fails."""
+
+    def test_falls_back_to_per_file_reads(self, tmp_path):
+        tracks = [tmp_path / f"{name}.mp3" for name in "abc"]
+        for track in tracks:
+            track.write_bytes(b"")
+        db_file = tmp_path / "database.xml"
+        db_file.write_text(
+            '<VirtualDJ_Database Version="2024">\n'
+            + "".join(f' <Song FilePath="{track}" />\n' for track in tracks)
+            + "</VirtualDJ_Database>\n"
+        )
+
+        def failing_bulk(self, file_paths, max_workers=None):
+            first = next(iter(file_paths))
+            yield first, {"genre": "House"}
+            raise sqlite3.OperationalError("disk I/O error")
+
+        with (
+            patch("vdj_manager.cli.MYNVME_VDJ_DB", db_file),
+            patch("vdj_manager.cli.BackupManager"),
+            patch(
+                "vdj_manager.analysis.analysis_cache.DEFAULT_ANALYSIS_CACHE_PATH",
+                tmp_path / "analysis.db",
+            ),
+            patch.object(FileTagEditor, "read_tags_bulk", failing_bulk),
+            patch.object(FileTagEditor, "read_tags", return_value={"genre": "Techno"}) as read_tags,
+        ):
+            result = CliRunner().invoke(cli, ["analyze", "genre", "--no-online"])
+
+        assert result.exit_code == 0, result.output
+        assert "Detected genre for 3 tracks (0 failed)" in result.output
+        assert [c.args[0] for c in read_tags.call_args_list] == [str(t) for t in tracks[1:]]
+
+
 class TestFileTagEditorWrite:
     """Tests for writing tags to audio files."""
 
@@ -96,6 +338,22 @@ class TestFileTagEditorWrite:
         assert ok
         mock_audio.save.assert_called_once()
 
+    def test_write_mp3_uses_matching_frame_classes(self):
+        """Each field is written with its own ID3 frame class; empty values delete."""
+        from mutagen.id3 import TBPM, TIT2
+
+        editor = FileTagEditor()
+        mock_audio = MagicMock()
+        mock_audio.tags.__contains__ = lambda self, key: key == "TPE1"
+
+        with patch(_MUTAGEN_FILE, return_value=mock_audio):
+            editor.write_tags("/test/song.mp3", {"title": "T", "bpm": "128", "artist": None})
+
+        written = {c.args[0]: c.args[1][0] for c in mock_audio.tags.setall.call_args_list}
+        assert isinstance(written["TIT2"], TIT2) and written["TIT2"].text == ["T"]
+        assert isinstance(written["TBPM"], TBPM)
+        mock_audio.tags.delall.assert_called_once_with("TPE1")
+
     def test_write_nonexistent_returns_false(self):
         """Writing to a file that can't be opened returns False."""
         editor = FileTagEditor()
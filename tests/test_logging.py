@@ -1,10 +1,19 @@
 """Tests for centralized logging setup."""
 
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, RotatingFileHandler
 from unittest.mock import patch
 
 
+def _file_handler() -> RotatingFileHandler:
+    """Return the file handler served by the background queue listener."""
+    from vdj_manager import config
+
+    assert config._log_listener is not None
+    (handler,) = config._log_listener.handlers
+    return handler
+
+
 class TestSetupLogging:
     """Tests for config.setup_logging()."""
 
@@ -16,6 +25,9 @@ class TestSetupLogging:
 
     def teardown_method(self):
         # Clean up after each test
+        from vdj_manager.config import _stop_log_listener
+
+        _stop_log_listener()
         logger = logging.getLogger("vdj_manager")
         logger.handlers.clear()
         logger.setLevel(logging.WARNING)
@@ -30,7 +42,7 @@ class TestSetupLogging:
         assert log_dir.exists()
 
     def test_attaches_two_handlers(self, tmp_path):
-        """Should add console + file handlers."""
+        """Should add console + queued file handlers."""
         from vdj_manager.config import setup_logging
 
         log_dir = tmp_path / "logs"
@@ -41,7 +53,8 @@ class TestSetupLogging:
         assert len(logger.handlers) == 2
         handler_types = {type(h) for h in logger.handlers}
         assert logging.StreamHandler in handler_types
-        assert RotatingFileHandler in handler_types
+        assert QueueHandler in handler_types
+        assert isinstance(_file_handler(), RotatingFileHandler)
 
     def test_idempotent(self, tmp_path):
         """Calling setup_logging twice should not duplicate handlers."""
@@ -64,11 +77,7 @@ class TestSetupLogging:
             setup_logging(verbose=True)
 
         logger = logging.getLogger("vdj_manager")
-        console = [
-            h
-            for h in logger.handlers
-            if isinstance(h, logging.StreamHandler) and not isinstance(h, RotatingFileHandler)
-        ][0]
+        console = [h for h in logger.handlers if isinstance(h, logging.StreamHandler)][0]
         assert console.level == logging.DEBUG
 
     def test_non_verbose_sets_console_info(self, tmp_path):
@@ -80,11 +89,7 @@ class TestSetupLogging:
             setup_logging(verbose=False)
 
         logger = logging.getLogger("vdj_manager")
-        console = [
-            h
-            for h in logger.handlers
-            if isinstance(h, logging.StreamHandler) and not isinstance(h, RotatingFileHandler)
-        ][0]
+        console = [h for h in logger.handlers if isinstance(h, logging.StreamHandler)][0]
         assert console.level == logging.INFO
 
     def test_file_handler_always_debug(self, tmp_path):
@@ -95,9 +100,7 @@ class TestSetupLogging:
         with patch("vdj_manager.config.LOG_DIR", log_dir):
             setup_logging(verbose=False)
 
-        logger = logging.getLogger("vdj_manager")
-        file_h = [h for h in logger.handlers if isinstance(h, RotatingFileHandler)][0]
-        assert file_h.level == logging.DEBUG
+        assert _file_handler().level == logging.DEBUG
 
     def test_child_loggers_inherit(self, tmp_path):
         """Child loggers should use parent handlers."""
@@ -121,8 +124,11 @@ class TestSetupLogging:
         with patch("vdj_manager.config.LOG_DIR", log_dir):
             setup_logging()
 
+        from vdj_manager.config import _stop_log_listener
+
         logger = logging.getLogger("vdj_manager")
         logger.info("test message")
+        _stop_log_listener()  # drain the queue
 
         log_file = log_dir / "vdj_manager.log"
         assert log_file.exists()
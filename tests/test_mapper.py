@@ -87,3 +87,39 @@ class TestVDJToSeratoMapper:
         assert result["cue_points"][0]["position_ms"] == 0
         assert result["cue_points"][1]["position_ms"] == 30000
         assert result["beatgrid"]["bpm"] == 120.0
+
+    def test_map_song_caps_cues_and_loops_at_eight(self):
+        """Serato has 8 hot cue and 8 loop slots; extras are dropped in order."""
+        mapper = VDJToSeratoMapper()
+        pois = [Poi(Type=PoiType.CUE, Pos=float(i), Num=i + 1) for i in range(10)]
+        pois += [Poi(Type=PoiType.LOOP, Pos=float(i), Size=4.0) for i in range(10)]
+        song = Song(FilePath="/path/track.mp3", pois=pois)
+
+        result = mapper.map_song(song)
+
+        assert [cue["index"] for cue in result["cue_points"]] == list(range(8))
+        assert [cue["position_ms"] for cue in result["cue_points"]] == [i * 1000 for i in range(8)]
+        assert [loop["index"] for loop in result["loops"]] == list(range(8))
+
+    def test_map_song_without_tags_keeps_comment_fallback(self):
+        """Without an energy level the original comment is kept."""
+        mapper = VDJToSeratoMapper()
+
+        bare = mapper.map_song(Song(FilePath="/path/a.mp3"))
+        commented = mapper.map_song(Song(FilePath="/path/b.mp3", tags=Tags(Comment="Warm-up")))
+
+        assert bare["artist"] is None and bare["comment"] is None
+        assert bare["cue_points"] == [] and bare["beatgrid"] is None
+        assert commented["comment"] == "Warm-up"
+        assert commented["energy"] is None
+
+    def test_map_cue_points_only_matches_map_song(self):
+        """The cues-only path gives the same cue points as a full mapping."""
+        mapper = VDJToSeratoMapper()
+        pois = [Poi(Type=PoiType.BEATGRID, Pos=0.1, Bpm=0.5)]
+        pois += [Poi(Type=PoiType.CUE, Pos=float(i), Name=f"C{i}") for i in range(10)]
+        pois.insert(3, Poi(Type=PoiType.LOOP, Pos=2.5, Size=4.0))
+        song = Song(FilePath="/path/track.mp3", tags=Tags(Author="A"), pois=pois)
+
+        assert mapper.map_cue_points_only(song) == mapper.map_song(song)["cue_points"]
+        assert len(mapper.map_cue_points_only(song)) == 8
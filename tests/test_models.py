@@ -1,5 +1,7 @@
 """Tests for Pydantic models."""
 
+from pathlib import Path
+
 from vdj_manager.core.models import DatabaseStats, Poi, PoiType, Scan, Song, Tags
 
 
@@ -107,6 +109,26 @@ class TestSong:
         song = Song(FilePath="/path/to/track.FLAC")
         assert song.extension == ".flac"
 
+    def test_mood_is_last_lowercase_hashtag(self):
+        """Mood is the most recent lowercase hashtag in User2."""
+        song = Song(FilePath="/a.mp3", tags=Tags(User2="#ClearBeat #happy #Mellow #sad #Loud"))
+        assert song.mood == "sad"
+
+        assert Song(FilePath="/a.mp3", tags=Tags(User2="#ClearBeat plain")).mood is None
+        assert Song(FilePath="/a.mp3", tags=Tags()).mood is None
+
+    def test_extension_matches_path_suffix(self):
+        """Extension follows Path.suffix for dotfiles, trailing dots and dotted dirs."""
+        for file_path in [
+            "/music/.hidden",
+            "/music/trailing.",
+            "/music.d/noext",
+            "/music/archive.tar.GZ",
+            "C:/dir/track.Mp3",
+            "noslash.wav",
+        ]:
+            assert Song(FilePath=file_path).extension == Path(file_path).suffix.lower()
+
     def test_display_name_with_tags(self):
         """Test display name generation."""
         song = Song(
@@ -42,6 +42,13 @@ class TestPathRemapper:
         result = remapper.remap_path("X:/Custom/track.mp3")
         assert result == "/Volumes/Custom/track.mp3"
 
+    def test_short_prefixes_still_match(self):
+        """Prefixes shorter than the two-character bucket head are honored."""
+        remapper = PathRemapper(mappings={"D": "/d", "": "/root/", "D:/Main/": "/main/"})
+        assert remapper.remap_path("D:/Main/track.mp3") == "/main/track.mp3"
+        assert remapper.remap_path("D:/Other/track.mp3") == "/d:/Other/track.mp3"
+        assert remapper.remap_path("X:/track.mp3") == "/root/X:/track.mp3"
+
     def test_can_remap(self):
         """Test can_remap check."""
         remapper = PathRemapper()
@@ -69,3 +76,18 @@ class TestPathRemapper:
         assert "D:/Main/" in prefixes
         assert "E:/Other/" in prefixes
         assert len(prefixes["D:/Main/"]) == 2
+
+    def test_detect_mappable_paths_counts_all_but_keeps_five_examples(self):
+        """Counts cover every path; only the first five are kept as examples."""
+        songs = [Song(FilePath=f"D:\\Main\\track{i}.mp3") for i in range(8)]
+        songs += [Song(FilePath="Z:/Unknown/a.mp3"), Song(FilePath="/local/b.mp3")]
+
+        analysis = PathRemapper().detect_mappable_paths(iter(songs))
+
+        main = analysis["by_prefix"]["D:/Main/"]
+        assert main["count"] == 8
+        assert main["examples"] == [f"D:\\Main\\track{i}.mp3" for i in range(5)]
+        assert main["has_mapping"] is True
+        assert analysis["total_windows_paths"] == 9
+        assert analysis["mappable"] == 8
+        assert analysis["unmappable"] == 1
@@ -9,6 +9,7 @@ from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
 import pytest
+from lxml import etree
 
 from vdj_manager.core.database import VDJDatabase
 from vdj_manager.core.models import Song
@@ -245,6 +246,22 @@ class TestDatabaseMergeOptimized:
         assert new_fp in db._filepath_to_elem
         assert new_fp in db.songs
 
+    def test_merge_copies_element_independently(self, temp_db_file, temp_merge_source):
+        """The merged element is a copy, not shared with the source tree."""
+        db = VDJDatabase(temp_db_file)
+        db.load()
+        other = VDJDatabase(temp_merge_source)
+        other.load()
+
+        db.merge_from(other)
+
+        new_fp = "/path/to/new_track.mp3"
+        copied = db._filepath_to_elem[new_fp]
+        source = other._filepath_to_elem[new_fp]
+        assert copied is not source
+        assert copied.getroottree().getroot() is db._root
+        assert etree.tostring(copied, with_tail=False) == etree.tostring(source, with_tail=False)
+
     def test_merge_preserves_existing_data(self, temp_db_file, temp_merge_source):
         """Verify merge doesn't corrupt existing songs."""
         db = VDJDatabase(temp_db_file)
@@ -279,11 +296,11 @@ class TestPathRemapperCachedPrefixes:
         remapper = PathRemapper()
         # Trigger cache build
         remapper.remap_path("D:/Main/track.mp3")
-        assert remapper._sorted_prefixes is not None
+        assert remapper._prefix_re is not None
 
         # Add mapping — should invalidate
         remapper.add_mapping("X:/Custom/", "/Volumes/Custom/")
-        assert remapper._sorted_prefixes is None
+        assert remapper._prefix_re is None
 
         # Should work with new mapping
         result = remapper.remap_path("X:/Custom/track.mp3")
@@ -296,10 +313,10 @@ class TestPathRemapperCachedPrefixes:
 
         # Trigger cache build
         remapper.remap_path("X:/Test/track.mp3")
-        assert remapper._sorted_prefixes is not None
+        assert remapper._prefix_re is not None
 
         remapper.remove_mapping("X:/Test/")
-        assert remapper._sorted_prefixes is None
+        assert remapper._prefix_re is None
 
         # X:/Test should no longer remap
         assert remapper.remap_path("X:/Test/track.mp3") is None
@@ -318,16 +335,28 @@ class TestPathRemapperCachedPrefixes:
         assert remapper.remap_path("D:/Music/other.mp3") == "/long/other.mp3"
         assert remapper.remap_path("D:/docs/file.txt") == "/short/docs/file.txt"
 
+    def test_no_mappings_remaps_nothing(self):
+        """An empty mapping table must not match the empty prefix."""
+        remapper = PathRemapper(mappings={"D:/": "/d/"})
+        remapper.remove_mapping("D:/")
+        assert remapper.remap_path("D:/track.mp3") is None
+
+    def test_prefix_regex_characters_are_literal(self):
+        """Prefixes are escaped, so '.' or '(' in a folder name match literally."""
+        remapper = PathRemapper(mappings={"D:/DJ (Main).v2/": "/main/"})
+        assert remapper.remap_path("D:/DJ (Main).v2/a.mp3") == "/main/a.mp3"
+        assert remapper.remap_path("D:/DJ (Main)xv2/a.mp3") is None
+
     def test_repeated_remap_uses_cache(self):
         """Verify cache is reused across multiple remap calls."""
         remapper = PathRemapper()
         remapper.remap_path("D:/Main/track1.mp3")
-        cached = remapper._sorted_prefixes
+        cached = remapper._prefix_re
         assert cached is not None
 
         # Second call should reuse same cache object
         remapper.remap_path("D:/Main/track2.mp3")
-        assert remapper._sorted_prefixes is cached
+        assert remapper._prefix_re is cached
 
 
 # --- Fix 4: duplicates.py skip full hash for small groups ---
@@ -357,9 +386,9 @@ class TestDuplicateHashOptimization:
             original_full_hash = DuplicateDetector.compute_file_hash
             full_hash_calls = []
 
-            def tracking_full_hash(path, chunk_size=65536):
+            def tracking_full_hash(path, chunk_size=65536, **kwargs):
                 full_hash_calls.append(path)
-                return original_full_hash(path, chunk_size)
+                return original_full_hash(path, chunk_size, **kwargs)
 
             with patch.object(
                 DuplicateDetector, "compute_file_hash", side_effect=tracking_full_hash
@@ -389,9 +418,9 @@ class TestDuplicateHashOptimization:
             original_full_hash = DuplicateDetector.compute_file_hash
             full_hash_calls = []
 
-            def tracking_full_hash(path, chunk_size=65536):
+            def tracking_full_hash(path, chunk_size=65536, **kwargs):
                 full_hash_calls.append(path)
-                return original_full_hash(path, chunk_size)
+                return original_full_hash(path, chunk_size, **kwargs)
 
             with patch.object(
                 DuplicateDetector, "compute_file_hash", side_effect=tracking_full_hash
@@ -0,0 +1,131 @@
+"""Tests for directory scanner."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from vdj_manager.files.scanner import DirectoryScanner, find_existing_paths
+
+
+def _touch(path: Path, size: int = 10) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\0" * size)
+    return path
+
+
+class TestScanDirectory:
+    def test_matches_extensions_case_insensitively(self, tmp_path):
+        """Audio extensions match in any case; other files and dotfiles don't."""
+        upper = _touch(tmp_path / "a" / "LOUD.MP3")
+        flac = _touch(tmp_path / "a" / "b" / "song.flac")
+        _touch(tmp_path / "cover.jpg")
+        _touch(tmp_path / ".mp3")
+
+        result = set(DirectoryScanner().scan_directory(tmp_path))
+
+        assert result == {upper, flac}
+
+    def test_does_not_follow_symlinked_directories(self, tmp_path):
+        """Symlinked files are reported, symlinked directories not descended."""
+        real = _touch(tmp_path / "music" / "track.mp3")
+        (tmp_path / "alias").symlink_to(tmp_path / "music", target_is_directory=True)
+        (tmp_path / "link.mp3").symlink_to(real)
+
+        result = set(DirectoryScanner().scan_directory(tmp_path))
+
+        assert result == {real, tmp_path / "link.mp3"}
+
+
+class TestFindNewFiles:
+    def test_returns_only_files_not_in_database(self, tmp_path):
+        """Files already in the database are excluded from the result."""
+        known = _touch(tmp_path / "known.mp3")
+        new = _touch(tmp_path / "sub" / "new.flac", size=42)
+        _touch(tmp_path / "cover.jpg")
+
+        result = DirectoryScanner().find_new_files(tmp_path, {str(known)})
+
+        assert [f["file_path"] for f in result] == [str(new)]
+        assert result[0]["file_size"] == 42
+        assert result[0]["extension"] == ".flac"
+        assert result[0]["name"] == "new"
+
+    def test_existing_files_are_not_stat_called(self, tmp_path):
+        """Membership is checked before stat() so known files are never stat'd."""
+        known = _touch(tmp_path / "known.mp3")
+        new = _touch(tmp_path / "new.mp3")
+        scanner = DirectoryScanner()
+
+        with patch.object(
+            DirectoryScanner, "_file_info", wraps=DirectoryScanner._file_info
+        ) as file_info:
+            result = scanner.find_new_files(tmp_path, {str(known)})
+
+        assert len(result) == 1
+        file_info.assert_called_once()
+        assert file_info.call_args.args[:2] == (new, str(new))
+
+    def test_non_recursive_skips_subdirectories(self, tmp_path):
+        """Non-recursive scans only report top-level files."""
+        top = _touch(tmp_path / "top.mp3")
+        _touch(tmp_path / "sub" / "nested.mp3")
+
+        result = DirectoryScanner().find_new_files(tmp_path, set(), recursive=False)
+
+        assert [f["file_path"] for f in result] == [str(top)]
+
+
+class TestFindExistingPaths:
+    def test_returns_only_existing_paths(self, tmp_path):
+        """Existing files are reported; missing files and directories are not."""
+        a = _touch(tmp_path / "a.mp3")
+        b = _touch(tmp_path / "sub" / "b.mp3")
+        missing = tmp_path / "missing.mp3"
+        missing_dir = tmp_path / "nope" / "c.mp3"
+
+        result = find_existing_paths([str(a), str(b), str(missing), str(missing_dir)])
+
+        assert result == {str(a), str(b)}
+
+    def test_lists_each_directory_once(self, tmp_path):
+        """Files sharing a parent directory trigger a single scandir call."""
+        paths = [str(_touch(tmp_path / f"track{i}.mp3")) for i in range(5)]
+
+        with patch("vdj_manager.files.scanner.os.scandir", wraps=os.scandir) as scandir:
+            result = find_existing_paths(paths)
+
+        assert result == set(paths)
+        scandir.assert_called_once_with(str(tmp_path))
+
+    def test_falls_back_to_exists_for_unlisted_names(self, tmp_path):
+        """A name absent from the listing is confirmed with os.path.exists."""
+        real = _touch(tmp_path / "track.mp3")
+        alias = str(tmp_path / "TRACK.mp3")
+
+        with patch("vdj_manager.files.scanner.os.path.exists", return_value=True) as exists:
+            result = find_existing_paths([str(real), alias])
+
+        assert result == {str(real), alias}
+        exists.assert_called_once_with(alias)
+
+    def test_broken_symlink_is_missing(self, tmp_path):
+        """Symlinks are resolved, so a dangling link does not count as existing."""
+        target = _touch(tmp_path / "target.mp3")
+        good = tmp_path / "good.mp3"
+        broken = tmp_path / "broken.mp3"
+        good.symlink_to(target)
+        broken.symlink_to(tmp_path / "gone.mp3")
+
+        assert find_existing_paths([str(good), str(broken)]) == {str(good)}
+
+    def test_relative_paths_do_not_list_cwd(self, tmp_path, monkeypatch):
+        """Paths without an absolute directory are checked directly, not via a CWD listing."""
+        monkeypatch.chdir(tmp_path)
+        _touch(tmp_path / "track.mp3")
+        _touch(tmp_path / "C:other.mp3")
+
+        with patch("vdj_manager.files.scanner.os.scandir", wraps=os.scandir) as scandir:
+            result = find_existing_paths(["track.mp3", "C:other.mp3", "C:missing.mp3"])
+
+        assert result == {"track.mp3", "C:other.mp3"}
+        scandir.assert_not_called()
@@ -1,8 +1,12 @@
-"""Tests for Serato crate writer and name sanitization."""
+"""Tests for Serato crate writer, name sanitization, and exporter."""
+
+import os
+from unittest.mock import patch
 
 import pytest
 
-from vdj_manager.export.serato import SeratoCrateWriter
+from vdj_manager.core.models import Song
+from vdj_manager.export.serato import SeratoCrateWriter, SeratoExporter, SeratoTagWriter
 
 
 @pytest.fixture
@@ -64,6 +68,30 @@ class TestCrateWriterBasics:
         encoded = writer.encode_path("/music/song.mp3")
         assert encoded == "/music/song.mp3".encode("utf-16-be")
 
+    def test_track_entry_layout(self, writer):
+        path_bytes = "/m/é.mp3".encode("utf-16-be")
+        entry = writer.create_track_entry("/m/é.mp3")
+        assert entry == (
+            b"otrk"
+            + (len(path_bytes) + 8).to_bytes(4, "big")
+            + b"ptrk"
+            + len(path_bytes).to_bytes(4, "big")
+            + path_bytes
+        )
+
+    def test_crate_header_is_length_prefixed_version_record(self, writer):
+        header = writer.CRATE_HEADER
+        assert header[:4] == b"vrsn"
+        assert int.from_bytes(header[4:8], "big") == len(header) - 8
+        assert header[8:].decode("utf-16-be") == "1.0/Serato ScratchLive Crate"
+
+    def test_crate_is_header_plus_entries(self, writer):
+        paths = ["/m/a.mp3", "/m/b.mp3"]
+        crate_path = writer.write_crate("Two", paths)
+        assert crate_path.read_bytes() == writer.CRATE_HEADER + b"".join(
+            writer.create_track_entry(p) for p in paths
+        )
+
     def test_list_crates_empty(self, writer):
         writer.ensure_directories()
         assert writer.list_crates() == []
@@ -72,3 +100,114 @@ class TestCrateWriterBasics:
         writer.write_crate("TestCrate", [])
         crates = writer.list_crates()
         assert "TestCrate" in crates
+
+
+class TestSeratoMarkers2:
+    """Tests for SeratoTagWriter._create_serato_markers2."""
+
+    def test_cue_entries_layout(self):
+        data = SeratoTagWriter()._create_serato_markers2(
+            [{"position_ms": 1500, "name": "Drop"}, {"position_ms": 70000, "name": "Café"}]
+        )
+
+        first = b"\x00" + (1500).to_bytes(4, "big") + (0xFFCC0000).to_bytes(4, "big")
+        first += b"\x04Drop"
+        second = b"\x00" + (70000).to_bytes(4, "big") + (0xFFCC4400).to_bytes(4, "big")
+        second += b"\x05" + "Café".encode()  # length counts encoded bytes
+        assert data == (
+            b"\x01\x01"
+            + (2).to_bytes(4, "big")
+            + len(first).to_bytes(4, "big")
+            + first
+            + len(second).to_bytes(4, "big")
+            + second
+        )
+
+    def test_at_most_eight_cues(self):
+        data = SeratoTagWriter()._create_serato_markers2([{"position_ms": i} for i in range(12)])
+        assert data[2:6] == (8).to_bytes(4, "big")
+
+
+class TestExportSongs:
+    """Tests for SeratoExporter.export_songs concurrent export."""
+
+    def test_yields_each_file_once(self, tmp_path):
+        exporter = SeratoExporter(serato_dir=tmp_path / "_Serato_")
+        songs = [Song(FilePath=f"/music/{i}.mp3") for i in range(5)]
+        songs.append(Song(FilePath="/music/0.mp3"))  # duplicate playlist entry
+
+        with patch.object(exporter, "export_song", return_value=True) as export_song:
+            results = list(exporter.export_songs(songs, max_workers=3))
+
+        assert sorted(song.file_path for song, _ in results) == [
+            f"/music/{i}.mp3" for i in range(5)
+        ]
+        assert all(result is True for _, result in results)
+        assert export_song.call_count == 5
+
+    def test_exceptions_are_yielded_not_raised(self, tmp_path):
+        exporter = SeratoExporter(serato_dir=tmp_path / "_Serato_")
+        good = Song(FilePath="/music/good.mp3")
+        bad = Song(FilePath="/music/bad.mp3")
+
+        def fake_export(song, cues_only=False, **kwargs):
+            if song is bad:
+                raise OSError("disk full")
+            return True
+
+        with patch.object(exporter, "export_song", side_effect=fake_export):
+            results = {
+                song.file_path: result for song, result in exporter.export_songs([good, bad])
+            }
+
+        assert results["/music/good.mp3"] is True
+        assert isinstance(results["/music/bad.mp3"], OSError)
+
+
+class TestExportPlaylist:
+    """Tests for SeratoExporter.export_playlist."""
+
+    def test_existence_checked_once_per_path(self, tmp_path):
+        exporter = SeratoExporter(serato_dir=tmp_path / "_Serato_")
+        present = tmp_path / "present.mp3"
+        present.write_bytes(b"")
+        songs = [
+            Song(FilePath=str(present)),
+            Song(FilePath=str(tmp_path / "missing.mp3")),
+            Song(FilePath=str(present)),
+        ]
+
+        with (
+            patch.object(exporter, "export_song", return_value=True) as export_song,
+            patch("vdj_manager.files.scanner.os.path.exists", wraps=os.path.exists) as exists,
+        ):
+            exported, crate_path = exporter.export_playlist("Set", songs)
+
+        # The directory listing finds present.mp3; only the miss is re-checked
+        assert exists.call_count == 1
+        assert exported == 2
+        assert export_song.call_count == 1
+        assert export_song.call_args.kwargs["check_exists"] is False
+        assert crate_path.exists()
+
+    def test_failed_exports_not_counted_and_crate_keeps_order(self, tmp_path):
+        exporter = SeratoExporter(serato_dir=tmp_path / "_Serato_")
+        paths = []
+        for name in ("b.mp3", "a.mp3", "c.mp3"):
+            (tmp_path / name).write_bytes(b"")
+            paths.append(str(tmp_path / name))
+        songs = [Song(FilePath=p) for p in paths]
+
+        def fake_export(song, cues_only=False, **kwargs):
+            if song.file_path.endswith("a.mp3"):
+                raise OSError("read-only")
+            return True
+
+        with (
+            patch.object(exporter, "export_song", side_effect=fake_export),
+            patch.object(exporter, "create_crate", return_value=tmp_path / "x.crate") as crate,
+        ):
+            exported, _ = exporter.export_playlist("Set", songs, max_workers=3)
+
+        assert exported == 2
+        crate.assert_called_once_with("Set", paths)
@@ -1,7 +1,9 @@
 """Tests for file validator."""
 
+import os
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from unittest.mock import patch
 
 import pytest
 
@@ -161,3 +163,57 @@ class TestFileValidator:
         assert report["windows_paths"] == 1
         assert ".mp3" in report["extensions"]
         assert ".flac" in report["extensions"]
+
+    def test_find_missing_files_lists_each_directory_once(self, tmp_path):
+        """Songs sharing a folder cost one listing, not one stat each."""
+        validator = FileValidator()
+        present = [tmp_path / f"track{i}.mp3" for i in range(3)]
+        for path in present:
+            path.write_bytes(b"audio")
+        songs = [Song(FilePath=str(p)) for p in present]
+        songs.append(Song(FilePath=str(tmp_path / "gone.mp3")))
+        songs.append(Song(FilePath="file:///music/stream.mp3"))
+
+        with patch("vdj_manager.files.scanner.os.scandir", wraps=os.scandir) as scandir:
+            missing = validator.find_missing_files(iter(songs))
+
+        assert [s.file_path for s in missing] == [
+            str(tmp_path / "gone.mp3"),
+            "file:///music/stream.mp3",
+        ]
+        scandir.assert_called_once_with(str(tmp_path))
+
+    def test_validate_song_stats_once(self, temp_audio_file):
+        """Existence and size come from a single stat call."""
+        validator = FileValidator()
+        song = Song(FilePath=str(temp_audio_file), FileSize=999)
+
+        with patch("vdj_manager.files.validator.os.stat", wraps=os.stat) as stat:
+            result = validator.validate_song(song)
+
+        assert result["exists"]
+        assert result["size_match"] is False
+        stat.assert_called_once_with(str(temp_audio_file))
+
+    def test_categorize_entries_checks_audio_per_directory(self, tmp_path):
+        """Audio existence is resolved from one listing per folder, in input order."""
+        validator = FileValidator()
+        for name in ("b.mp3", "a.flac"):
+            (tmp_path / name).write_bytes(b"audio")
+        songs = [
+            Song(FilePath=str(tmp_path / "b.mp3")),
+            Song(FilePath=str(tmp_path / "gone.mp3")),
+            Song(FilePath=str(tmp_path / "a.flac")),
+            Song(FilePath=str(tmp_path / "cover.jpg")),
+        ]
+
+        with patch("vdj_manager.files.scanner.os.scandir", wraps=os.scandir) as scandir:
+            categories = validator.categorize_entries(iter(songs))
+
+        assert [s.file_path for s in categories["audio_exists"]] == [
+            str(tmp_path / "b.mp3"),
+            str(tmp_path / "a.flac"),
+        ]
+        assert [s.file_path for s in categories["audio_missing"]] == [str(tmp_path / "gone.mp3")]
+        assert len(categories["non_audio"]) == 1
+        scandir.assert_called_once_with(str(tmp_path))